@@ -0,0 +1,115 @@
+"""
+In-process TTL cache for API responses.
+
+Holds small, frequently requested payloads (reference tables, latest
+snapshots, aggregate summaries) in memory so repeated dashboard loads skip
+the database.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+# Misses for keys hashing to the same stripe share a compute lock
+_LOCK_STRIPES = 16
+
+
+class TTLCache:
+    """Thread-safe mapping whose entries expire ``ttl`` seconds after being set.
+
+    With ``stale_ttl`` > 0, expired entries are kept that much longer so
+    ``get_or_set`` can serve them while a background thread refreshes them.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128, stale_ttl: float = 0):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        self._compute_locks = [threading.Lock() for _ in range(_LOCK_STRIPES)]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` if missing/expired."""
+        value, fresh = self._lookup(key)
+        return value if fresh else default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key`` for ``ttl`` seconds."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._evict()
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it with ``factory`` on a miss.
+
+        Concurrent misses for a key wait for a single ``factory`` call instead
+        of all hitting the database. A stale value (see ``stale_ttl``) is
+        returned immediately and refreshed in the background.
+        """
+        value, fresh = self._lookup(key)
+        if fresh:
+            return value
+        if value is not _MISSING:
+            self._refresh_in_background(key, factory)
+            return value
+        with self._compute_lock(key):
+            value, fresh = self._lookup(key)
+            if not fresh:
+                value = factory()
+                self.set(key, value)
+            return value
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def _lookup(self, key: Hashable) -> Tuple[Any, bool]:
+        """Return ``(value, is_fresh)``; ``value`` is ``_MISSING`` once past the stale window."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING, False
+            expires_at, value = entry
+            now = time.monotonic()
+            if expires_at > now:
+                return value, True
+            if expires_at + self.stale_ttl <= now:
+                del self._data[key]
+                return _MISSING, False
+            return value, False
+
+    def _compute_lock(self, key: Hashable) -> threading.Lock:
+        return self._compute_locks[hash(key) % _LOCK_STRIPES]
+
+    def _refresh_in_background(self, key: Hashable, factory: Callable[[], Any]) -> None:
+        """Recompute ``key`` on a daemon thread unless a refresh is already running."""
+        lock = self._compute_lock(key)
+        if not lock.acquire(blocking=False):
+            return
+
+        def refresh():
+            try:
+                self.set(key, factory())
+            except Exception:
+                # Keep serving the stale value; the next request retries
+                logger.exception(f"Background cache refresh failed for {key!r}")
+            finally:
+                lock.release()
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _evict(self) -> None:
+        """Drop expired entries, or the oldest one if none have expired."""
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _) in self._data.items() if expires_at + self.stale_ttl <= now]
+        for k in expired:
+            del self._data[k]
+        if not expired:
+            del self._data[next(iter(self._data))]
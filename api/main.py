@@ -2,17 +2,26 @@
 FastAPI REST API for NYISO data access.
 Provides endpoints for dashboard consumption.
 """
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from typing import Optional, List, Dict, Any
-from datetime import datetime, date, timedelta
-from pydantic import BaseModel
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from datetime import datetime, date, time, timedelta
+from pydantic import BaseModel, ConfigDict
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, func, desc
-import statistics
-import json
+from sqlalchemy import and_, or_, case, func, desc, literal, select, tuple_, union, union_all, Float, BigInteger, cast, column as sql_column, null, table as sql_table, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+import base64
+import functools
+import hashlib
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+import re
+import orjson
+import numpy as np
+import pandas as pd
 import os
 from pathlib import Path
 import pytz
@@ -22,13 +31,24 @@ from database.schema import (
     RealTimeLoad, LoadForecast, InterfaceFlow, Zone, Interface,
     MarketAdvisory, Constraint, ExternalRTOPrice, ATC_TTC,
     Outage, WeatherForecast, FuelMix, AncillaryService,
-    PageView, VisitorSession
+    PageView, PageViewDaily, PageViewDailyVisitor, VisitorSession
 )
+from database.rollups import page_view_rollup_end
+from api.cache import TTLCache
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (handles datetimes natively)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
 
 app = FastAPI(
     title="NYISO Data API",
     description="REST API for accessing NYISO market data",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 @app.on_event("startup")
@@ -54,6 +74,17 @@ async def startup_event():
     else:
         logger.warning("No frontend files found - frontend will not be served!")
     
+    # Warm the zone/interface name maps used by the list endpoints
+    try:
+        db = get_session()
+        try:
+            _reference_names(db, Zone)
+            _reference_names(db, Interface)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.warning(f"Could not preload zone/interface names: {e}")
+    
     logger.info("FastAPI app initialized successfully")
     logger.info("=" * 80)
 
@@ -64,6 +95,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Analytics middleware (must be after CORS)
@@ -87,8 +119,7 @@ class ZoneResponse(BaseModel):
     ptid: Optional[int]
     display_name: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class RealTimeLBMPResponse(BaseModel):
@@ -98,8 +129,7 @@ class RealTimeLBMPResponse(BaseModel):
     marginal_cost_losses: Optional[float]
     marginal_cost_congestion: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DayAheadLBMPResponse(BaseModel):
@@ -109,8 +139,7 @@ class DayAheadLBMPResponse(BaseModel):
     marginal_cost_losses: Optional[float]
     marginal_cost_congestion: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TimeWeightedLBMPResponse(BaseModel):
@@ -120,8 +149,7 @@ class TimeWeightedLBMPResponse(BaseModel):
     marginal_cost_losses: Optional[float]
     marginal_cost_congestion: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AncillaryServiceResponse(BaseModel):
@@ -131,8 +159,7 @@ class AncillaryServiceResponse(BaseModel):
     service_type: Optional[str]
     price: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class RealTimeLoadResponse(BaseModel):
@@ -141,8 +168,7 @@ class RealTimeLoadResponse(BaseModel):
     load: float
     time_zone: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LoadForecastResponse(BaseModel):
@@ -150,8 +176,7 @@ class LoadForecastResponse(BaseModel):
     zone_name: str
     forecast_load: float
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class InterfaceFlowResponse(BaseModel):
@@ -161,8 +186,7 @@ class InterfaceFlowResponse(BaseModel):
     positive_limit_mwh: Optional[float]
     negative_limit_mwh: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class InterregionalFlowResponse(BaseModel):
@@ -176,8 +200,7 @@ class InterregionalFlowResponse(BaseModel):
     negative_limit_mw: float
     utilization_percent: Optional[float]  # Calculated
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class MarketAdvisoryResponse(BaseModel):
@@ -187,8 +210,7 @@ class MarketAdvisoryResponse(BaseModel):
     message: Optional[str]
     severity: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ConstraintResponse(BaseModel):
@@ -200,8 +222,7 @@ class ConstraintResponse(BaseModel):
     limit_mw: Optional[float]
     flow_mw: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ExternalRTOPriceResponse(BaseModel):
@@ -211,8 +232,7 @@ class ExternalRTOPriceResponse(BaseModel):
     cts_price: Optional[float]
     price_difference: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ATC_TTCResponse(BaseModel):
@@ -224,8 +244,7 @@ class ATC_TTCResponse(BaseModel):
     trm_mw: Optional[float]
     direction: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class OutageResponse(BaseModel):
@@ -240,8 +259,7 @@ class OutageResponse(BaseModel):
     end_time: Optional[datetime]
     status: Optional[str]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WeatherForecastResponse(BaseModel):
@@ -259,8 +277,7 @@ class WeatherForecastResponse(BaseModel):
     data_source: Optional[str] = None  # 'NYISO' or 'OpenMeteo'
     forecast_horizon: Optional[float] = None  # Hours until forecast time
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class FuelMixResponse(BaseModel):
@@ -269,8 +286,7 @@ class FuelMixResponse(BaseModel):
     generation_mw: float
     percentage: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 # Calculated Metrics Response Models
@@ -282,8 +298,7 @@ class RTDASpreadResponse(BaseModel):
     spread: float
     spread_percent: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ZoneSpreadResponse(BaseModel):
@@ -295,8 +310,7 @@ class ZoneSpreadResponse(BaseModel):
     spread: float
     all_zones: Optional[dict]  # zone_name -> price mapping
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LoadForecastErrorResponse(BaseModel):
@@ -307,8 +321,7 @@ class LoadForecastErrorResponse(BaseModel):
     error_mw: float
     error_percent: float
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ReserveMarginResponse(BaseModel):
@@ -319,8 +332,7 @@ class ReserveMarginResponse(BaseModel):
     reserve_margin_percent: Optional[float]
     zones: Optional[dict]  # zone_name -> reserve_margin
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PriceVolatilityResponse(BaseModel):
@@ -331,8 +343,7 @@ class PriceVolatilityResponse(BaseModel):
     mean_price: float
     std_dev: float
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class CorrelationResponse(BaseModel):
@@ -343,8 +354,7 @@ class CorrelationResponse(BaseModel):
     period_start: datetime
     period_end: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TradingSignalResponse(BaseModel):
@@ -356,8 +366,7 @@ class TradingSignalResponse(BaseModel):
     value: Optional[float]
     threshold: Optional[float]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class StatsResponse(BaseModel):
@@ -375,6 +384,151 @@ def get_db():
         db.close()
 
 
+# Zones/interfaces only change when the scraper meets a new one; the latest
+# interregional snapshot changes on the 5-minute scrape cycle.
+_reference_cache = TTLCache(ttl=3600)
+_snapshot_cache = TTLCache(ttl=30)
+# Aggregate endpoints: serve the previous answer while one thread recomputes
+_stats_cache = TTLCache(ttl=300, stale_ttl=300)
+_analytics_cache = TTLCache(ttl=60, maxsize=256, stale_ttl=60)
+# Static files served from memory; re-read once a minute so regenerated
+# files are picked up without a restart
+_file_cache = TTLCache(ttl=60)
+# Calculated metrics: dashboards re-request the same windows every few seconds
+_metrics_cache = TTLCache(ttl=15, maxsize=256)
+_health_cache = TTLCache(ttl=3)
+
+
+def _json_bytes_response(body: bytes) -> Response:
+    """Wrap an already-serialized JSON payload in a response."""
+    return Response(content=body, media_type="application/json")
+
+
+def _cached_response(endpoint: Callable[..., Response]) -> Callable[..., Response]:
+    """Serve an endpoint's response body from _metrics_cache, keyed by its query params.
+    
+    The endpoint takes ``db`` plus query params and returns a fully rendered
+    response; concurrent misses for the same params compute it once. An
+    ``X-Cache: HIT|MISS`` header tells the two apart.
+    """
+    @functools.wraps(endpoint)
+    def wrapper(db: Session, **params) -> Response:
+        key = (endpoint.__name__, *sorted(params.items()))
+        body = _metrics_cache.get(key)
+        status = "HIT"
+        if body is None:
+            status = "MISS"
+            body = _metrics_cache.get_or_set(key, lambda: endpoint(db=db, **params).body)
+        return Response(content=body, media_type="application/json", headers={"X-Cache": status})
+    
+    return wrapper
+
+
+# Rows fetched per round-trip (and emitted per chunk) when streaming lists
+_STREAM_BATCH_SIZE = 1000
+
+
+def _stream_json_rows(
+    db: Session,
+    stmt,
+    transform: Optional[Callable[[Any], dict]] = None,
+    headers: Optional[Dict[str, str]] = None
+) -> StreamingResponse:
+    """Stream a column select as a JSON array without materializing every row.
+    
+    Rows are fetched ``_STREAM_BATCH_SIZE`` at a time and serialized batch by
+    batch. ``transform`` maps each row mapping to the dict that gets serialized.
+    """
+    to_dict = transform or dict
+    
+    def generate():
+        try:
+            yield b"["
+            separator = b""
+            # stream_results: a server-side (named) cursor on psycopg2, so the
+            # driver never buffers more than one batch either
+            result = db.execute(stmt.execution_options(
+                stream_results=True, yield_per=_STREAM_BATCH_SIZE
+            )).mappings()
+            for partition in result.partitions():
+                yield separator + b",".join(orjson.dumps(to_dict(row)) for row in partition)
+                separator = b","
+            yield b"]"
+        finally:
+            # The body is sent after the endpoint returns, so release the
+            # session here rather than relying on the dependency teardown
+            db.close()
+    
+    return StreamingResponse(generate(), media_type="application/json", headers=headers)
+
+
+def _reference_names(db: Session, model, refresh: bool = False) -> Dict[int, str]:
+    """Cached id -> name map for a reference table (Zone or Interface)."""
+    key = ("names", model.__tablename__)
+    names = None if refresh else _reference_cache.get(key)
+    if names is None:
+        names = dict(db.query(model.id, model.name).all())
+        _reference_cache.set(key, names)
+    return names
+
+
+def _name_resolver(db: Session, model, id_key: str, name_key: str) -> Callable[[Any], dict]:
+    """Row transform that swaps ``id_key`` for ``name_key`` using the cached map.
+    
+    Lets the list endpoints skip the JOIN against the reference table. An id
+    missing from the map (a zone/interface added since it was loaded) triggers
+    one reload.
+    """
+    names = _reference_names(db, model)
+    
+    def resolve(mapping) -> dict:
+        nonlocal names
+        row_id = mapping[id_key]
+        if row_id not in names:
+            names = _reference_names(db, model, refresh=True)
+        row = {(name_key if k == id_key else k): v for k, v in mapping.items()}
+        row[name_key] = names.get(row_id)
+        return row
+    
+    return resolve
+
+
+def _ids_for_names(db: Session, model, names: List[str]) -> List[int]:
+    """Translate reference names to ids; unknown names are dropped."""
+    ids_by_name = {name: id_ for id_, name in _reference_names(db, model).items()}
+    return [ids_by_name[n] for n in names if n in ids_by_name]
+
+
+@functools.lru_cache(maxsize=256)
+def _split_zone_names(zones: str) -> Tuple[str, ...]:
+    """Normalize a comma-separated ``zones`` query value to upper-case names."""
+    return tuple(name for name in (z.strip().upper() for z in zones.split(',')) if name)
+
+
+def zone_filter(
+    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
+    db: Session = Depends(get_db)
+) -> Optional[Tuple[str, ...]]:
+    """Dependency for the ``zones`` query parameter.
+    
+    Returns the requested zone names (None when not filtering) and rejects
+    names that are not known zones instead of silently returning no rows
+    for them. A miss reloads the zone map once in case a zone was added.
+    """
+    if not zones:
+        return None
+    names = _split_zone_names(zones)
+    if not names:
+        return None
+    known = set(_reference_names(db, Zone).values())
+    if not known.issuperset(names):
+        known = set(_reference_names(db, Zone, refresh=True).values())
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown zone(s): {', '.join(unknown)}")
+    return names
+
+
 @app.get("/")
 async def root():
     """API root endpoint or frontend index (in production)."""
@@ -454,34 +608,48 @@ async def root():
         )
 
 
-@app.get("/api/zones", response_model=List[ZoneResponse])
-async def get_zones():
+@app.get("/api/zones", responses={200: {"model": List[ZoneResponse]}})
+def get_zones(db: Session = Depends(get_db)):
     """Get all zones."""
-    db = next(get_db())
-    try:
-        zones = db.query(Zone).order_by(Zone.name).all()
-        return zones
-    finally:
-        db.close()
+    body = _reference_cache.get("zones")
+    if body is None:
+        rows = db.query(Zone.id, Zone.name, Zone.ptid, Zone.display_name).order_by(Zone.name).all()
+        body = orjson.dumps([dict(r._mapping) for r in rows])
+        _reference_cache.set("zones", body)
+    return _json_bytes_response(body)
 
 
-@app.get("/api/interfaces", response_model=List[dict])
-async def get_interfaces():
+@app.get("/api/interfaces", responses={200: {"model": List[dict]}})
+def get_interfaces(db: Session = Depends(get_db)):
     """Get all interfaces."""
-    db = next(get_db())
-    try:
-        interfaces = db.query(Interface).order_by(Interface.name).all()
-        return [{"id": i.id, "name": i.name, "point_id": i.point_id} for i in interfaces]
-    finally:
-        db.close()
+    body = _reference_cache.get("interfaces")
+    if body is None:
+        rows = db.query(Interface.id, Interface.name, Interface.point_id).order_by(Interface.name).all()
+        body = orjson.dumps([dict(r._mapping) for r in rows])
+        _reference_cache.set("interfaces", body)
+    return _json_bytes_response(body)
 
 
-@app.get("/api/realtime-lbmp", response_model=List[RealTimeLBMPResponse])
-async def get_realtime_lbmp(
+# Stored timestamps are naive US/Eastern wall-clock times
+_EASTERN = pytz.timezone('US/Eastern')
+# Allowance for publication delays when hiding forward-looking RT intervals
+_REALTIME_FUTURE_BUFFER = timedelta(minutes=30)
+
+
+def _realtime_future_cutoff() -> datetime:
+    """Latest real-time timestamp to show when no end_date is given."""
+    return datetime.now(_EASTERN).replace(tzinfo=None) + _REALTIME_FUTURE_BUFFER
+
+
+@app.get("/api/realtime-lbmp", responses={200: {"model": List[RealTimeLBMPResponse]}})
+def get_realtime_lbmp(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    before_ts: Optional[datetime] = Query(None, deprecated=True, description="Only return rows older than this timestamp (page with after instead)"),
+    db: Session = Depends(get_db)
 ):
     """Get real-time LBMP data.
     
@@ -489,277 +657,263 @@ async def get_realtime_lbmp(
     By default, timestamps more than 30 minutes in the future are filtered out
     to show only current/actual data. Use date filters to see all data including forecasts.
     """
-    db = next(get_db())
-    
-    query = db.query(RealTimeLBMP).join(Zone)
+    stmt = select(
+        RealTimeLBMP.timestamp,
+        RealTimeLBMP.zone_id,
+        RealTimeLBMP.lbmp,
+        RealTimeLBMP.marginal_cost_losses,
+        RealTimeLBMP.marginal_cost_congestion
+    )
     
     # Apply filters
     if start_date:
-        query = query.filter(RealTimeLBMP.timestamp >= start_date)
+        stmt = stmt.where(RealTimeLBMP.timestamp >= start_date)
     if end_date:
-        query = query.filter(RealTimeLBMP.timestamp <= end_date)
+        stmt = stmt.where(RealTimeLBMP.timestamp <= end_date)
     else:
         # If no end_date specified, filter out future timestamps (NYISO includes forecasts)
-        # Allow 30 minutes buffer for publication delays
-        eastern = pytz.timezone('US/Eastern')
-        now_et = datetime.now(eastern).replace(tzinfo=None)
-        future_cutoff = now_et + timedelta(minutes=30)
-        query = query.filter(RealTimeLBMP.timestamp <= future_cutoff)
+        stmt = stmt.where(RealTimeLBMP.timestamp <= _realtime_future_cutoff())
     
     if zones:
-        zone_list = [z.strip().upper() for z in zones.split(',')]
-        query = query.filter(Zone.name.in_(zone_list))
+        stmt = stmt.where(RealTimeLBMP.zone_id.in_(_ids_for_names(db, Zone, zones)))
     
-    # Order and limit
-    query = query.order_by(desc(RealTimeLBMP.timestamp)).limit(limit)
+    if before_ts:
+        stmt = stmt.where(RealTimeLBMP.timestamp < before_ts)
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "zone_name": r.zone.name,
-                "lbmp": r.lbmp,
-                "marginal_cost_losses": r.marginal_cost_losses,
-                "marginal_cost_congestion": r.marginal_cost_congestion
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, RealTimeLBMP, after, limit, _name_resolver(db, Zone, "zone_id", "zone_name"))
 
 
-@app.get("/api/dayahead-lbmp", response_model=List[DayAheadLBMPResponse])
-async def get_dayahead_lbmp(
+@app.get("/api/dayahead-lbmp", responses={200: {"model": List[DayAheadLBMPResponse]}})
+def get_dayahead_lbmp(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    before_ts: Optional[datetime] = Query(None, deprecated=True, description="Only return rows older than this timestamp (page with after instead)"),
+    db: Session = Depends(get_db)
 ):
     """Get day-ahead LBMP data."""
-    db = next(get_db())
-    
-    query = db.query(DayAheadLBMP).join(Zone)
+    stmt = select(
+        DayAheadLBMP.timestamp,
+        DayAheadLBMP.zone_id,
+        DayAheadLBMP.lbmp,
+        DayAheadLBMP.marginal_cost_losses,
+        DayAheadLBMP.marginal_cost_congestion
+    )
     
     if start_date:
-        query = query.filter(DayAheadLBMP.timestamp >= start_date)
+        stmt = stmt.where(DayAheadLBMP.timestamp >= start_date)
     if end_date:
-        query = query.filter(DayAheadLBMP.timestamp <= end_date)
+        stmt = stmt.where(DayAheadLBMP.timestamp <= end_date)
     if zones:
-        zone_list = [z.strip().upper() for z in zones.split(',')]
-        query = query.filter(Zone.name.in_(zone_list))
+        stmt = stmt.where(DayAheadLBMP.zone_id.in_(_ids_for_names(db, Zone, zones)))
     
-    query = query.order_by(desc(DayAheadLBMP.timestamp)).limit(limit)
+    if before_ts:
+        stmt = stmt.where(DayAheadLBMP.timestamp < before_ts)
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "zone_name": r.zone.name,
-                "lbmp": r.lbmp,
-                "marginal_cost_losses": r.marginal_cost_losses,
-                "marginal_cost_congestion": r.marginal_cost_congestion
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, DayAheadLBMP, after, limit, _name_resolver(db, Zone, "zone_id", "zone_name"))
 
 
-@app.get("/api/timeweighted-lbmp", response_model=List[TimeWeightedLBMPResponse])
-async def get_timeweighted_lbmp(
+@app.get("/api/timeweighted-lbmp", responses={200: {"model": List[TimeWeightedLBMPResponse]}})
+def get_timeweighted_lbmp(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    before_ts: Optional[datetime] = Query(None, deprecated=True, description="Only return rows older than this timestamp (page with after instead)"),
+    db: Session = Depends(get_db)
 ):
     """Get time-weighted/integrated real-time LBMP data (hourly)."""
-    db = next(get_db())
-    
-    query = db.query(TimeWeightedLBMP).join(Zone)
+    stmt = select(
+        TimeWeightedLBMP.timestamp,
+        TimeWeightedLBMP.zone_id,
+        TimeWeightedLBMP.lbmp,
+        TimeWeightedLBMP.marginal_cost_losses,
+        TimeWeightedLBMP.marginal_cost_congestion
+    )
     
     if start_date:
-        query = query.filter(TimeWeightedLBMP.timestamp >= start_date)
+        stmt = stmt.where(TimeWeightedLBMP.timestamp >= start_date)
     if end_date:
-        query = query.filter(TimeWeightedLBMP.timestamp <= end_date)
+        stmt = stmt.where(TimeWeightedLBMP.timestamp <= end_date)
     if zones:
-        zone_list = [z.strip().upper() for z in zones.split(',')]
-        query = query.filter(Zone.name.in_(zone_list))
+        stmt = stmt.where(TimeWeightedLBMP.zone_id.in_(_ids_for_names(db, Zone, zones)))
     
-    query = query.order_by(desc(TimeWeightedLBMP.timestamp)).limit(limit)
+    if before_ts:
+        stmt = stmt.where(TimeWeightedLBMP.timestamp < before_ts)
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "zone_name": r.zone.name,
-                "lbmp": r.lbmp,
-                "marginal_cost_losses": r.marginal_cost_losses,
-                "marginal_cost_congestion": r.marginal_cost_congestion
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, TimeWeightedLBMP, after, limit, _name_resolver(db, Zone, "zone_id", "zone_name"))
 
 
-@app.get("/api/ancillary-services", response_model=List[AncillaryServiceResponse])
-async def get_ancillary_services(
+@app.get("/api/ancillary-services", responses={200: {"model": List[AncillaryServiceResponse]}})
+def get_ancillary_services(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     market_type: Optional[str] = Query(None, description="Filter by market type: 'realtime' or 'dayahead'"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
     service_type: Optional[str] = Query(None, description="Filter by service type"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    before_ts: Optional[datetime] = Query(None, deprecated=True, description="Only return rows older than this timestamp (page with after instead)"),
+    db: Session = Depends(get_db)
 ):
     """Get ancillary service prices (real-time and day-ahead)."""
-    db = next(get_db())
-    
-    query = db.query(AncillaryService).join(Zone)
+    stmt = select(
+        AncillaryService.timestamp,
+        AncillaryService.zone_id,
+        AncillaryService.market_type,
+        AncillaryService.service_type,
+        AncillaryService.price
+    )
     
     if start_date:
-        query = query.filter(AncillaryService.timestamp >= start_date)
+        stmt = stmt.where(AncillaryService.timestamp >= start_date)
     if end_date:
-        query = query.filter(AncillaryService.timestamp <= end_date)
+        stmt = stmt.where(AncillaryService.timestamp <= end_date)
     if market_type:
-        query = query.filter(AncillaryService.market_type == market_type.lower())
+        stmt = stmt.where(AncillaryService.market_type == market_type.lower())
     if zones:
-        zone_list = [z.strip().upper() for z in zones.split(',')]
-        query = query.filter(Zone.name.in_(zone_list))
+        stmt = stmt.where(AncillaryService.zone_id.in_(_ids_for_names(db, Zone, zones)))
     if service_type:
-        query = query.filter(AncillaryService.service_type == service_type.lower())
+        stmt = stmt.where(AncillaryService.service_type == service_type.lower())
     
-    query = query.order_by(desc(AncillaryService.timestamp)).limit(limit)
+    if before_ts:
+        stmt = stmt.where(AncillaryService.timestamp < before_ts)
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "zone_name": r.zone.name,
-                "market_type": r.market_type,
-                "service_type": r.service_type,
-                "price": r.price
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, AncillaryService, after, limit, _name_resolver(db, Zone, "zone_id", "zone_name"))
 
 
-@app.get("/api/realtime-load", response_model=List[RealTimeLoadResponse])
-async def get_realtime_load(
+@app.get("/api/realtime-load", responses={200: {"model": List[RealTimeLoadResponse]}})
+def get_realtime_load(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    before_ts: Optional[datetime] = Query(None, deprecated=True, description="Only return rows older than this timestamp (page with after instead)"),
+    db: Session = Depends(get_db)
 ):
     """Get real-time load data."""
-    db = next(get_db())
-    
-    query = db.query(RealTimeLoad).join(Zone)
+    stmt = select(
+        RealTimeLoad.timestamp,
+        RealTimeLoad.zone_id,
+        RealTimeLoad.load,
+        RealTimeLoad.time_zone
+    )
     
     if start_date:
-        query = query.filter(RealTimeLoad.timestamp >= start_date)
+        stmt = stmt.where(RealTimeLoad.timestamp >= start_date)
     if end_date:
-        query = query.filter(RealTimeLoad.timestamp <= end_date)
+        stmt = stmt.where(RealTimeLoad.timestamp <= end_date)
     if zones:
-        zone_list = [z.strip().upper() for z in zones.split(',')]
-        query = query.filter(Zone.name.in_(zone_list))
+        stmt = stmt.where(RealTimeLoad.zone_id.in_(_ids_for_names(db, Zone, zones)))
     
-    query = query.order_by(desc(RealTimeLoad.timestamp)).limit(limit)
+    if before_ts:
+        stmt = stmt.where(RealTimeLoad.timestamp < before_ts)
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "zone_name": r.zone.name,
-                "load": r.load,
-                "time_zone": r.time_zone
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, RealTimeLoad, after, limit, _name_resolver(db, Zone, "zone_id", "zone_name"))
 
 
-@app.get("/api/load-forecast", response_model=List[LoadForecastResponse])
-async def get_load_forecast(
+@app.get("/api/load-forecast", responses={200: {"model": List[LoadForecastResponse]}})
+def get_load_forecast(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    before_ts: Optional[datetime] = Query(None, deprecated=True, description="Only return rows older than this timestamp (page with after instead)"),
+    db: Session = Depends(get_db)
 ):
     """Get load forecast data."""
-    db = next(get_db())
-    
-    query = db.query(LoadForecast).join(Zone)
+    stmt = select(
+        LoadForecast.timestamp,
+        LoadForecast.zone_id,
+        LoadForecast.forecast_load
+    )
     
     if start_date:
-        query = query.filter(LoadForecast.timestamp >= start_date)
+        stmt = stmt.where(LoadForecast.timestamp >= start_date)
     if end_date:
-        query = query.filter(LoadForecast.timestamp <= end_date)
+        stmt = stmt.where(LoadForecast.timestamp <= end_date)
     if zones:
-        zone_list = [z.strip().upper() for z in zones.split(',')]
-        query = query.filter(Zone.name.in_(zone_list))
+        stmt = stmt.where(LoadForecast.zone_id.in_(_ids_for_names(db, Zone, zones)))
     
-    query = query.order_by(desc(LoadForecast.timestamp)).limit(limit)
+    if before_ts:
+        stmt = stmt.where(LoadForecast.timestamp < before_ts)
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "zone_name": r.zone.name,
-                "forecast_load": r.forecast_load
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, LoadForecast, after, limit, _name_resolver(db, Zone, "zone_id", "zone_name"))
 
 
-@app.get("/api/interface-flows", response_model=List[InterfaceFlowResponse])
-async def get_interface_flows(
+@app.get("/api/interface-flows", responses={200: {"model": List[InterfaceFlowResponse]}})
+def get_interface_flows(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     interfaces: Optional[str] = Query(None, description="Comma-separated interface names"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    before_ts: Optional[datetime] = Query(None, deprecated=True, description="Only return rows older than this timestamp (page with after instead)"),
+    db: Session = Depends(get_db)
 ):
     """Get interface flow data."""
-    db = next(get_db())
-    
-    query = db.query(InterfaceFlow).join(Interface)
+    stmt = select(
+        InterfaceFlow.timestamp,
+        InterfaceFlow.interface_id,
+        InterfaceFlow.flow_mwh,
+        InterfaceFlow.positive_limit_mwh,
+        InterfaceFlow.negative_limit_mwh
+    )
     
     if start_date:
-        query = query.filter(InterfaceFlow.timestamp >= start_date)
+        stmt = stmt.where(InterfaceFlow.timestamp >= start_date)
     if end_date:
-        query = query.filter(InterfaceFlow.timestamp <= end_date)
+        stmt = stmt.where(InterfaceFlow.timestamp <= end_date)
     if interfaces:
         interface_list = [i.strip() for i in interfaces.split(',')]
-        query = query.filter(Interface.name.in_(interface_list))
+        stmt = stmt.where(InterfaceFlow.interface_id.in_(_ids_for_names(db, Interface, interface_list)))
     
-    query = query.order_by(desc(InterfaceFlow.timestamp)).limit(limit)
+    if before_ts:
+        stmt = stmt.where(InterfaceFlow.timestamp < before_ts)
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "interface_name": r.interface.name,
-                "flow_mwh": r.flow_mwh,
-                "positive_limit_mwh": r.positive_limit_mwh,
-                "negative_limit_mwh": r.negative_limit_mwh
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, InterfaceFlow, after, limit, _name_resolver(db, Interface, "interface_id", "interface_name"))
+
+
+# Every token the interface classifier looks for, scanned in one pass. The
+# lookahead lets overlapping tokens all be reported (e.g. 'NE_NY' inside
+# 'KEYSTONE_NY'); at a given position longer tokens are listed first so
+# 'HQ_CEDARS' is reported rather than 'HQ'.
+_INTERFACE_TOKEN_RE = re.compile(
+    r'(?=(?P<PJM>PJM)|(?P<PJ_NY>PJ - NY)|(?P<HTP>HTP)|(?P<NEPTUNE>NEPTUNE)'
+    r'|(?P<VFT>VFT)|(?P<KEYSTONE>KEYSTONE)|(?P<NE_NY>NE - NY|NE_NY)|(?P<NE>N\.E)'
+    r'|(?P<OH_NY>OH - NY|OH_NY)|(?P<ONTARIO>ONTARIO|IESO)|(?P<HQ_NY>HQ - NY|HQ_NY)'
+    r'|(?P<HQ_CEDARS>HQ_CEDARS)|(?P<HQ_IMPORT>HQ_IMPORT)|(?P<HQ>HQ))'
+)
+
+
+# PJM node tokens in priority order; only consulted for PJM interfaces
+_PJM_NODES: tuple[tuple[str, str], ...] = (
+    ('HTP', 'HTP'),
+    ('NEPTUNE', 'NEPTUNE'),
+    ('VFT', 'VFT'),
+    ('KEYSTONE', 'KEYSTONE'),
+    ('PJ_NY', 'PJ - NY'),
+)
+
+# Remaining (token, region, node) rules in priority order
+_CLASSIFY: tuple[tuple[str, str, str], ...] = (
+    ('NE_NY', 'ISO-NE', 'NE - NY'),
+    ('NE', 'ISO-NE', 'NE'),
+    ('OH_NY', 'IESO', 'OH - NY'),
+    ('ONTARIO', 'IESO', 'ONTARIO'),
+    ('HQ_NY', 'HQ', 'HQ - NY'),
+    ('HQ_CEDARS', 'HQ', 'CEDARS'),
+    ('HQ_IMPORT', 'HQ', 'IMPORT_EXPORT'),
+    ('HQ', 'HQ', 'HQ'),
+)
 
 
+@functools.lru_cache(maxsize=256)
 def _identify_region_and_node(interface_name: str) -> tuple[str, str]:
     """
     Identify region and node name from interface name.
@@ -767,87 +921,47 @@ def _identify_region_and_node(interface_name: str) -> tuple[str, str]:
     Returns:
         (region, node_name) tuple
     """
-    interface_upper = interface_name.upper()
-    
-    # PJM interfaces
-    if 'PJM' in interface_upper or ('PJ - NY' in interface_upper and 'PJM' not in interface_upper):
-        if 'HTP' in interface_upper:
-            return ('PJM', 'HTP')
-        elif 'NEPTUNE' in interface_upper:
-            return ('PJM', 'NEPTUNE')
-        elif 'VFT' in interface_upper:
-            return ('PJM', 'VFT')
-        elif 'KEYSTONE' in interface_upper:
-            return ('PJM', 'KEYSTONE')
-        elif 'PJ - NY' in interface_upper:
-            return ('PJM', 'PJ - NY')
-        else:
-            # Generic PJM
-            return ('PJM', 'PJM')
-    
-    # ISO-NE (New England)
-    elif 'NE - NY' in interface_upper or 'NE_NY' in interface_upper:
-        return ('ISO-NE', 'NE - NY')
-    elif 'N.E.' in interface_upper or 'N.E' in interface_upper:
-        return ('ISO-NE', 'NE')
-    
-    # IESO (Ontario)
-    elif 'OH - NY' in interface_upper or 'OH_NY' in interface_upper:
-        return ('IESO', 'OH - NY')
-    elif 'ONTARIO' in interface_upper or 'IESO' in interface_upper:
-        return ('IESO', 'ONTARIO')
-    
-    # Hydro Quebec
-    elif 'HQ - NY' in interface_upper or 'HQ_NY' in interface_upper:
-        return ('HQ', 'HQ - NY')
-    elif 'HQ_CEDARS' in interface_upper:
-        return ('HQ', 'CEDARS')
-    elif 'HQ_IMPORT_EXPORT' in interface_upper or 'HQ_IMPORT' in interface_upper:
-        return ('HQ', 'IMPORT_EXPORT')
-    elif 'HQ' in interface_upper:
-        return ('HQ', 'HQ')
+    tokens = {m.lastgroup for m in _INTERFACE_TOKEN_RE.finditer(interface_name.upper())}
+    
+    # PJM interfaces take precedence; fall back to the generic PJM node
+    if 'PJM' in tokens or 'PJ_NY' in tokens:
+        for token, node in _PJM_NODES:
+            if token in tokens:
+                return ('PJM', node)
+        return ('PJM', 'PJM')
+    
+    for token, region, node in _CLASSIFY:
+        if token in tokens:
+            return (region, node)
     
     # Default: unknown
     return ('UNKNOWN', interface_name)
 
 
-def _calculate_utilization(flow_mw: float, positive_limit: Optional[float], negative_limit: Optional[float]) -> Optional[float]:
-    """
-    Calculate utilization percentage based on flow direction.
-    
-    Args:
-        flow_mw: Flow in MW (positive = import, negative = export)
-        positive_limit: Import limit (positive)
-        negative_limit: Export limit (negative)
-    
-    Returns:
-        Utilization percentage (0-100) or None if cannot calculate
-    """
-    if flow_mw is None:
-        return None
-    
-    # Import (positive flow)
-    if flow_mw > 0:
-        if positive_limit is None or positive_limit == 0:
-            return None
-        return (flow_mw / positive_limit) * 100
-    
-    # Export (negative flow)
-    elif flow_mw < 0:
-        if negative_limit is None or negative_limit == 0:
-            return None
-        # Use absolute value for calculation
-        return (abs(flow_mw) / abs(negative_limit)) * 100
-    
-    # Zero flow
-    return 0.0
+# Case-insensitive name patterns of the external (interregional) interfaces
+EXTERNAL_INTERFACE_PATTERNS = ('%PJM%', '%NE - NY%', '%N.E.%', '%OH - NY%', '%ONTARIO%', '%IESO%', '%HQ%')
+
 
+def _external_interface_ids(db: Session) -> List[int]:
+    """IDs of the external interfaces, resolved once per reference-cache TTL."""
+    ids = _reference_cache.get("external-interface-ids")
+    if ids is None:
+        rows = db.query(Interface.id).filter(
+            or_(*[Interface.name.ilike(pattern) for pattern in EXTERNAL_INTERFACE_PATTERNS])
+        ).all()
+        ids = [r.id for r in rows]
+        # Don't pin an empty result before the scraper has seen any interfaces
+        if ids:
+            _reference_cache.set("external-interface-ids", ids)
+    return ids
 
-@app.get("/api/interregional-flows", response_model=List[InterregionalFlowResponse])
-async def get_interregional_flows(
+
+@app.get("/api/interregional-flows", responses={200: {"model": List[InterregionalFlowResponse]}})
+def get_interregional_flows(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum records to return")
+    limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
+    db: Session = Depends(get_db)
 ):
     """
     Get interregional flow data for external interfaces (PJM, ISO-NE, IESO, HQ).
@@ -855,84 +969,86 @@ async def get_interregional_flows(
     Returns all external interfaces separately to show individual locational price deltas.
     Each interface represents a different physical connection point.
     """
-    db = next(get_db())
+    # The default (latest snapshot) view is what every dashboard load asks for
+    latest_only = not start_date and not end_date
+    cache_key = ("interregional-latest", limit)
+    if latest_only:
+        body = _snapshot_cache.get(cache_key)
+        if body is not None:
+            return _json_bytes_response(body)
+    
+    # Utilization against the limit in the direction of flow (positive =
+    # import, negative = export); NULL when that limit is missing or zero
+    utilization_percent = case(
+        (InterfaceFlow.flow_mwh > 0,
+         InterfaceFlow.flow_mwh / func.nullif(InterfaceFlow.positive_limit_mwh, 0) * 100),
+        (InterfaceFlow.flow_mwh < 0,
+         func.abs(InterfaceFlow.flow_mwh) / func.nullif(func.abs(InterfaceFlow.negative_limit_mwh), 0) * 100),
+        else_=0.0
+    ).label("utilization_percent")
+    
+    # Query interface flows with interface names
+    query = db.query(
+        InterfaceFlow.timestamp,
+        Interface.name.label("interface_name"),
+        InterfaceFlow.flow_mwh,
+        InterfaceFlow.positive_limit_mwh,
+        InterfaceFlow.negative_limit_mwh,
+        utilization_percent
+    ).join(Interface, InterfaceFlow.interface_id == Interface.id)
+    
+    # Filter for external interfaces (PJM, ISO-NE, IESO, HQ)
+    query = query.filter(InterfaceFlow.interface_id.in_(_external_interface_ids(db)))
+    
+    # Apply date filters
+    if start_date:
+        query = query.filter(InterfaceFlow.timestamp >= start_date)
+    if end_date:
+        query = query.filter(InterfaceFlow.timestamp <= end_date)
     
-    try:
-        # Query interface flows with interface names
-        query = db.query(InterfaceFlow).join(Interface)
-        
-        # Filter for external interfaces (PJM, ISO-NE, IESO, HQ)
-        # Use case-insensitive matching with LIKE
-        external_patterns = [
-            '%PJM%',
-            '%NE - NY%',
-            '%N.E.%',
-            '%OH - NY%',
-            '%ONTARIO%',
-            '%IESO%',
-            '%HQ%'
-        ]
-        
-        from sqlalchemy import or_
-        interface_filters = or_(*[Interface.name.ilike(pattern) for pattern in external_patterns])
-        query = query.filter(interface_filters)
-        
-        # Apply date filters
-        if start_date:
-            query = query.filter(InterfaceFlow.timestamp >= start_date)
-        if end_date:
-            query = query.filter(InterfaceFlow.timestamp <= end_date)
-        
-        # Get latest data by default (if no date filters)
-        if not start_date and not end_date:
-            # Get the latest timestamp
-            latest_timestamp = db.query(func.max(InterfaceFlow.timestamp)).scalar()
-            if latest_timestamp:
-                query = query.filter(InterfaceFlow.timestamp == latest_timestamp)
-        
-        query = query.order_by(desc(InterfaceFlow.timestamp), Interface.name).limit(limit)
-        
-        results = query.all()
-        
-        # Transform results
-        response_data = []
-        for r in results:
-            interface_name = r.interface.name
-            region, node_name = _identify_region_and_node(interface_name)
-            
-            # Skip if not a recognized external region
-            if region == 'UNKNOWN':
-                continue
-            
-            # Get flow (stored as MWH but represents MW in 5-min context)
-            flow_mw = r.flow_mwh if r.flow_mwh is not None else 0.0
-            
-            # Determine direction
-            direction = "import" if flow_mw > 0 else "export" if flow_mw < 0 else "zero"
-            
-            # Calculate utilization
-            utilization_percent = _calculate_utilization(
-                flow_mw,
-                r.positive_limit_mwh,
-                r.negative_limit_mwh
-            )
-            
-            response_data.append({
-                "timestamp": r.timestamp,
-                "interface_name": interface_name,
-                "region": region,
-                "node_name": node_name,
-                "flow_mw": flow_mw,
-                "direction": direction,
-                "positive_limit_mw": r.positive_limit_mwh if r.positive_limit_mwh is not None else 0.0,
-                "negative_limit_mw": r.negative_limit_mwh if r.negative_limit_mwh is not None else 0.0,
-                "utilization_percent": utilization_percent
-            })
-        
-        return response_data
+    # Get latest data by default (if no date filters)
+    if latest_only:
+        # Resolve the latest timestamp in the same statement
+        latest_timestamp = select(func.max(InterfaceFlow.timestamp)).scalar_subquery()
+        query = query.filter(InterfaceFlow.timestamp == latest_timestamp)
+    
+    query = query.order_by(desc(InterfaceFlow.timestamp), Interface.name).limit(limit)
+    
+    results = query.all()
+    
+    # Transform results
+    response_data = []
+    for r in results:
+        interface_name = r.interface_name
+        region, node_name = _identify_region_and_node(interface_name)
+        
+        # Skip if not a recognized external region
+        if region == 'UNKNOWN':
+            continue
+        
+        # Get flow (stored as MWH but represents MW in 5-min context)
+        flow_mw = r.flow_mwh if r.flow_mwh is not None else 0.0
+        
+        # Determine direction
+        direction = "import" if flow_mw > 0 else "export" if flow_mw < 0 else "zero"
+        
+        response_data.append({
+            "timestamp": r.timestamp,
+            "interface_name": interface_name,
+            "region": region,
+            "node_name": node_name,
+            "flow_mw": flow_mw,
+            "direction": direction,
+            "positive_limit_mw": r.positive_limit_mwh if r.positive_limit_mwh is not None else 0.0,
+            "negative_limit_mw": r.negative_limit_mwh if r.negative_limit_mwh is not None else 0.0,
+            "utilization_percent": r.utilization_percent
+        })
     
-    finally:
-        db.close()
+    if latest_only:
+        body = orjson.dumps(response_data)
+        _snapshot_cache.set(cache_key, body)
+        return _json_bytes_response(body)
+    return ORJSONResponse(response_data)
 
 
 # ============================================================================
@@ -950,410 +1066,525 @@ class AnalyticsSummaryResponse(BaseModel):
     countries: List[Dict[str, Any]]
 
 
-@app.get("/api/analytics/summary", response_model=AnalyticsSummaryResponse)
-async def get_analytics_summary(
+# The summary's aggregates are independent, so each runs on its own pooled
+# connection; wall time is the slowest query rather than the sum
+_summary_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="analytics-summary")
+
+
+# PostgreSQL planner settings for the summary's aggregates, applied with
+# SET LOCAL so they end with each query's transaction
+_SUMMARY_PG_SETTINGS = (
+    "SET LOCAL jit = on",
+    "SET LOCAL jit_above_cost = 50000",
+    "SET LOCAL max_parallel_workers_per_gather = 4",
+    "SET LOCAL parallel_tuple_cost = 0.01",
+    "SET LOCAL work_mem = '128MB'",  # keep DISTINCT/GROUP BY hash tables in memory
+)
+
+
+def _fetch_rows(stmt) -> list:
+    """Execute ``stmt`` in a short-lived session (safe from worker threads)."""
+    db = get_session()
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            for setting in _SUMMARY_PG_SETTINGS:
+                db.execute(text(setting))
+        return db.execute(stmt).all()
+    finally:
+        db.close()
+
+
+# Summary top-N lists: payload key -> page view column
+_TOP_PAGE_VIEW_COLUMNS = {
+    "top_pages": "path",
+    "referrers": "referrer",
+    "countries": "country",
+}
+
+
+def _top_page_views_stmt(rolled, live, limit: int = 10):
+    """
+    Top values of each _TOP_PAGE_VIEW_COLUMNS column in one statement.
+    
+    Rolled-up days and live rows are combined once in a CTE; each column is
+    ranked from it and the results come back as (kind, value, views) rows.
+    """
+    columns = list(_TOP_PAGE_VIEW_COLUMNS.values())
+    counts = union_all(
+        select(*(getattr(PageViewDaily, c) for c in columns), PageViewDaily.views.label('views'))
+        .where(rolled),
+        select(*(getattr(PageView, c) for c in columns), func.count(PageView.id).label('views'))
+        .where(live)
+        .group_by(*(getattr(PageView, c) for c in columns))
+    ).cte('page_view_counts')
+    
+    ranked = []
+    for column in columns:
+        value = counts.c[column]
+        views = func.sum(counts.c.views)
+        ranked.append(
+            select(
+                literal(column).label('kind'),
+                value.label('value'),
+                views.label('views'),
+                func.row_number().over(order_by=(views.desc(), value)).label('rank')
+            ).where(value.isnot(None)).group_by(value)
+        )
+    top = union_all(*ranked).subquery()
+    return (
+        select(top.c.kind, top.c.value, top.c.views)
+        .where(top.c.rank <= limit)
+        .order_by(top.c.kind, top.c.rank)
+    )
+
+
+def _compute_analytics_summary(start_date: Optional[datetime], end_date: Optional[datetime], days: int) -> dict:
+    """Build the analytics summary payload (cached by get_analytics_summary)."""
+    # Default to last N days
+    if not start_date:
+        start_date = datetime.utcnow() - timedelta(days=days)
+    if not end_date:
+        end_date = datetime.utcnow()
+    
+    db = get_session()
+    try:
+        rollup_end = page_view_rollup_end(db)
+    finally:
+        db.close()
+    
+    # Whole days inside the range come from the daily rollup; the partial
+    # days at either edge (and anything not rolled up yet) stay live
+    rolled_from = datetime.combine(start_date.date(), time.min)
+    if rolled_from < start_date:
+        rolled_from += timedelta(days=1)
+    rolled_to = datetime.combine(end_date.date(), time.min)
+    if rollup_end:
+        rolled_to = min(rolled_to, datetime.combine(rollup_end, time.min))
+    if not rollup_end or rolled_to <= rolled_from:
+        rolled_from = rolled_to = start_date
+    rolled = and_(
+        PageViewDaily.day >= rolled_from.date(),
+        PageViewDaily.day < rolled_to.date()
+    )
+    live = or_(
+        and_(PageView.timestamp >= start_date, PageView.timestamp < rolled_from),
+        and_(PageView.timestamp >= rolled_to, PageView.timestamp <= end_date)
+    )
+    
+    # Unique visitors (distinct IP hashes); UNION dedupes across days
+    visitors = union(
+        select(PageViewDailyVisitor.ip_hash).where(
+            PageViewDailyVisitor.day >= rolled_from.date(),
+            PageViewDailyVisitor.day < rolled_to.date()
+        ),
+        select(PageView.ip_hash).where(live)
+    ).subquery()
+    today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    
+    statements = {
+        "rolled_views": select(func.sum(PageViewDaily.views)).where(rolled),
+        # Live edge views and today's figures in one pass over page_views
+        "live": select(
+            func.count(PageView.id).filter(live),
+            func.count(PageView.id).filter(PageView.timestamp >= today_start),
+            func.count(func.distinct(PageView.ip_hash)).filter(PageView.timestamp >= today_start)
+        ).where(or_(live, PageView.timestamp >= today_start)),
+        "unique_visitors": select(func.count()).select_from(visitors),
+        "sessions": select(func.count(VisitorSession.id)).where(
+            VisitorSession.first_visit >= start_date,
+            VisitorSession.first_visit <= end_date
+        ),
+        "top": _top_page_views_stmt(rolled, live),
+    }
+    rows = dict(zip(statements, _summary_executor.map(_fetch_rows, statements.values())))
+    
+    def scalar(name: str, column: int = 0) -> int:
+        return int(rows[name][0][column] or 0)
+    
+    top: Dict[str, List[dict]] = {column: [] for column in _TOP_PAGE_VIEW_COLUMNS.values()}
+    for kind, value, views in rows["top"]:
+        top[kind].append({kind: value, "views": int(views)})
+    
+    summary = {
+        "total_page_views": scalar("rolled_views") + scalar("live", 0),
+        "unique_visitors": scalar("unique_visitors"),
+        "sessions": scalar("sessions"),
+        "page_views_today": scalar("live", 1),
+        "unique_visitors_today": scalar("live", 2),
+    }
+    for key, column in _TOP_PAGE_VIEW_COLUMNS.items():
+        summary[key] = top[column]
+    return summary
+
+
+@app.get("/api/analytics/summary", responses={200: {"model": AnalyticsSummaryResponse}})
+def get_analytics_summary(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     days: int = Query(30, ge=1, le=365, description="Number of days (if dates not provided)")
 ):
     """Get analytics summary."""
-    db = next(get_db())
+    # The payload is built in the model's shape; skip re-validating cache hits
+    return ORJSONResponse(_analytics_cache.get_or_set(
+        (start_date, end_date, days),
+        functools.partial(_compute_analytics_summary, start_date, end_date, days)
+    ))
+
+
+# Tables reported by /api/stats, keyed as in its record_counts
+_STATS_COUNT_MODELS = (
+    ("realtime_lbmp", RealTimeLBMP),
+    ("dayahead_lbmp", DayAheadLBMP),
+    ("realtime_load", RealTimeLoad),
+    ("load_forecast", LoadForecast),
+    ("interface_flows", InterfaceFlow),
+    ("market_advisories", MarketAdvisory),
+    ("constraints", Constraint),
+    ("external_rto_prices", ExternalRTOPrice),
+    ("atc_ttc", ATC_TTC),
+    ("outages", Outage),
+    ("weather_forecast", WeatherForecast),
+    ("fuel_mix", FuelMix),
+)
+
+
+# On PostgreSQL, tables at least this large report the planner's row estimate
+# instead of an exact count
+_STATS_ESTIMATE_MIN_ROWS = 100_000
+
+_pg_class = sql_table("pg_class", sql_column("relname"), sql_column("reltuples"))
+
+
+def _estimated_row_counts(db: Session) -> Dict[str, int]:
+    """
+    Planner row estimates (pg_class.reltuples) for the _STATS_COUNT_MODELS
+    tables at or above _STATS_ESTIMATE_MIN_ROWS, keyed as in record_counts.
+    
+    Empty on other databases, and for tables that are small or never analyzed.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return {}
+    keys = {model.__tablename__: key for key, model in _STATS_COUNT_MODELS}
+    rows = db.execute(
+        select(_pg_class.c.relname, cast(_pg_class.c.reltuples, BigInteger))
+        .where(_pg_class.c.relname.in_(keys), _pg_class.c.reltuples >= _STATS_ESTIMATE_MIN_ROWS)
+    ).all()
+    return {keys[relname]: estimate for relname, estimate in rows}
+
+
+def _compute_stats() -> dict:
+    """Build the /api/stats payload (cached by get_stats)."""
+    db = get_session()
     
     try:
-        # Default to last N days
-        if not start_date:
-            start_date = datetime.utcnow() - timedelta(days=days)
-        if not end_date:
-            end_date = datetime.utcnow()
-        
-        # Total page views
-        total_views = db.query(func.count(PageView.id)).filter(
-            PageView.timestamp >= start_date,
-            PageView.timestamp <= end_date
-        ).scalar() or 0
-        
-        # Unique visitors (distinct IP hashes)
-        unique_visitors = db.query(func.count(func.distinct(PageView.ip_hash))).filter(
-            PageView.timestamp >= start_date,
-            PageView.timestamp <= end_date
-        ).scalar() or 0
-        
-        # Sessions
-        sessions = db.query(func.count(VisitorSession.id)).filter(
-            VisitorSession.first_visit >= start_date,
-            VisitorSession.first_visit <= end_date
-        ).scalar() or 0
-        
-        # Today's stats
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        views_today = db.query(func.count(PageView.id)).filter(
-            PageView.timestamp >= today_start
-        ).scalar() or 0
-        visitors_today = db.query(func.count(func.distinct(PageView.ip_hash))).filter(
-            PageView.timestamp >= today_start
-        ).scalar() or 0
-        
-        # Top pages
-        top_pages = db.query(
-            PageView.path,
-            func.count(PageView.id).label('views')
-        ).filter(
-            PageView.timestamp >= start_date,
-            PageView.timestamp <= end_date
-        ).group_by(PageView.path).order_by(desc('views')).limit(10).all()
-        
-        # Top referrers
-        top_referrers = db.query(
-            PageView.referrer,
-            func.count(PageView.id).label('views')
-        ).filter(
-            PageView.timestamp >= start_date,
-            PageView.timestamp <= end_date,
-            PageView.referrer.isnot(None)
-        ).group_by(PageView.referrer).order_by(desc('views')).limit(10).all()
-        
-        # Countries
-        top_countries = db.query(
-            PageView.country,
-            func.count(PageView.id).label('views')
-        ).filter(
-            PageView.timestamp >= start_date,
-            PageView.timestamp <= end_date,
-            PageView.country.isnot(None)
-        ).group_by(PageView.country).order_by(desc('views')).limit(10).all()
+        # Big tables use catalog estimates; the rest are counted exactly,
+        # together with the RT LBMP date range in one round-trip
+        record_counts = _estimated_row_counts(db)
+        stats = db.execute(select(
+            *(select(func.count(model.id)).scalar_subquery().label(key)
+              for key, model in _STATS_COUNT_MODELS if key not in record_counts),
+            select(func.min(RealTimeLBMP.timestamp)).scalar_subquery().label("rt_lbmp_min"),
+            select(func.max(RealTimeLBMP.timestamp)).scalar_subquery().label("rt_lbmp_max")
+        )).one()
+        record_counts = {
+            key: record_counts[key] if key in record_counts else getattr(stats, key)
+            for key, _ in _STATS_COUNT_MODELS
+        }
         
         return {
-            "total_page_views": total_views,
-            "unique_visitors": unique_visitors,
-            "sessions": sessions,
-            "page_views_today": views_today,
-            "unique_visitors_today": visitors_today,
-            "top_pages": [{"path": p[0], "views": p[1]} for p in top_pages],
-            "referrers": [{"referrer": r[0], "views": r[1]} for r in top_referrers],
-            "countries": [{"country": c[0], "views": c[1]} for c in top_countries]
+            "total_records": sum(record_counts.values()),
+            "date_range": {
+                "start": stats.rt_lbmp_min.isoformat() if stats.rt_lbmp_min else None,
+                "end": stats.rt_lbmp_max.isoformat() if stats.rt_lbmp_max else None
+            },
+            "zones": sorted(_reference_names(db, Zone).values()),
+            "record_counts": record_counts
         }
     finally:
         db.close()
 
 
 @app.get("/api/stats", response_model=StatsResponse)
-async def get_stats():
+def get_stats():
     """Get database statistics."""
-    db = next(get_db())
-    
-    # Count records
-    rt_lbmp_count = db.query(func.count(RealTimeLBMP.id)).scalar()
-    da_lbmp_count = db.query(func.count(DayAheadLBMP.id)).scalar()
-    rt_load_count = db.query(func.count(RealTimeLoad.id)).scalar()
-    load_fcst_count = db.query(func.count(LoadForecast.id)).scalar()
-    if_flow_count = db.query(func.count(InterfaceFlow.id)).scalar()
-    advisory_count = db.query(func.count(MarketAdvisory.id)).scalar()
-    constraint_count = db.query(func.count(Constraint.id)).scalar()
-    external_rto_count = db.query(func.count(ExternalRTOPrice.id)).scalar()
-    atc_ttc_count = db.query(func.count(ATC_TTC.id)).scalar()
-    outage_count = db.query(func.count(Outage.id)).scalar()
-    weather_count = db.query(func.count(WeatherForecast.id)).scalar()
-    fuel_mix_count = db.query(func.count(FuelMix.id)).scalar()
-    
-    total = (rt_lbmp_count + da_lbmp_count + rt_load_count + load_fcst_count + 
-             if_flow_count + advisory_count + constraint_count + external_rto_count +
-             atc_ttc_count + outage_count + weather_count + fuel_mix_count)
-    
-    # Date ranges
-    rt_lbmp_min = db.query(func.min(RealTimeLBMP.timestamp)).scalar()
-    rt_lbmp_max = db.query(func.max(RealTimeLBMP.timestamp)).scalar()
-    
-    # Zones
-    zones = db.query(Zone.name).order_by(Zone.name).all()
-    zone_names = [z[0] for z in zones]
-    
-    try:
-        return {
-            "total_records": total,
-            "date_range": {
-                "start": rt_lbmp_min.isoformat() if rt_lbmp_min else None,
-                "end": rt_lbmp_max.isoformat() if rt_lbmp_max else None
-            },
-            "zones": zone_names,
-            "record_counts": {
-                "realtime_lbmp": rt_lbmp_count,
-                "dayahead_lbmp": da_lbmp_count,
-                "realtime_load": rt_load_count,
-                "load_forecast": load_fcst_count,
-                "interface_flows": if_flow_count,
-                "market_advisories": advisory_count,
-                "constraints": constraint_count,
-                "external_rto_prices": external_rto_count,
-                "atc_ttc": atc_ttc_count,
-                "outages": outage_count,
-                "weather_forecast": weather_count,
-                "fuel_mix": fuel_mix_count
-            }
-        }
-    finally:
-        db.close()
+    return _stats_cache.get_or_set("stats", _compute_stats)
+
 
+def _encode_cursor(timestamp: datetime, row_id: int) -> str:
+    """Opaque keyset cursor for the row at (timestamp, id)."""
+    return base64.urlsafe_b64encode(f"{timestamp.isoformat()}|{row_id}".encode()).decode()
 
-@app.get("/api/market-advisories", response_model=List[MarketAdvisoryResponse])
-async def get_market_advisories(
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of _encode_cursor; a malformed cursor is a 400."""
+    try:
+        timestamp, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _keyset_page(
+    db: Session,
+    stmt,
+    model,
+    after: Optional[str],
+    limit: int,
+    transform: Optional[Callable[[Any], dict]] = None
+) -> StreamingResponse:
+    """Stream one newest-first page of a list query.
+    
+    Seeks past ``after`` on (timestamp, id) instead of re-sorting skipped rows.
+    The page's keys are looked up first so X-Next-Cursor can go out with the
+    headers; the streamed rows are then exactly those ids, so rows written in
+    between can neither grow the page past ``limit`` nor shift it onto rows
+    the cursor has already passed.
+    """
+    if after:
+        stmt = stmt.where(tuple_(model.timestamp, model.id) < tuple_(*_decode_cursor(after)))
+    newest_first = (desc(model.timestamp), desc(model.id))
+    keys = db.execute(
+        stmt.with_only_columns(model.timestamp, model.id)
+        .order_by(*newest_first)
+        .limit(limit)
+    ).all()
+    if not keys:
+        return _stream_json_rows(db, stmt.limit(0), transform)
+    stmt = stmt.where(model.id.in_([row_id for _, row_id in keys]))
+    headers = {"X-Next-Cursor": _encode_cursor(*keys[-1])} if len(keys) == limit else None
+    return _stream_json_rows(db, stmt.order_by(*newest_first), transform, headers)
+
+
+@app.get("/api/market-advisories", responses={200: {"model": List[MarketAdvisoryResponse]}})
+def get_market_advisories(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum records to return")
+    limit: int = Query(100, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_db)
 ):
     """Get market advisory notifications."""
-    db = next(get_db())
-    
-    query = db.query(MarketAdvisory)
+    stmt = select(
+        MarketAdvisory.timestamp,
+        MarketAdvisory.advisory_type,
+        MarketAdvisory.title,
+        MarketAdvisory.message,
+        MarketAdvisory.severity
+    )
     
     if start_date:
-        query = query.filter(MarketAdvisory.timestamp >= start_date)
+        stmt = stmt.where(MarketAdvisory.timestamp >= start_date)
     if end_date:
-        query = query.filter(MarketAdvisory.timestamp <= end_date)
-    
-    query = query.order_by(desc(MarketAdvisory.timestamp)).limit(limit)
+        stmt = stmt.where(MarketAdvisory.timestamp <= end_date)
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "advisory_type": r.advisory_type,
-                "title": r.title,
-                "message": r.message,
-                "severity": r.severity
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, MarketAdvisory, after, limit)
 
 
-@app.get("/api/constraints", response_model=List[ConstraintResponse])
-async def get_constraints(
+@app.get("/api/constraints", responses={200: {"model": List[ConstraintResponse]}})
+def get_constraints(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     market_type: Optional[str] = Query(None, description="Filter by market type: 'realtime' or 'dayahead'"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_db)
 ):
     """Get transmission constraints."""
-    db = next(get_db())
-    
-    query = db.query(Constraint)
+    stmt = select(
+        Constraint.timestamp,
+        Constraint.constraint_name,
+        Constraint.market_type,
+        Constraint.shadow_price,
+        Constraint.binding_status,
+        Constraint.limit_mw,
+        Constraint.flow_mw
+    )
     
     if start_date:
-        query = query.filter(Constraint.timestamp >= start_date)
+        stmt = stmt.where(Constraint.timestamp >= start_date)
     if end_date:
-        query = query.filter(Constraint.timestamp <= end_date)
+        stmt = stmt.where(Constraint.timestamp <= end_date)
     if market_type:
-        query = query.filter(Constraint.market_type == market_type.lower())
+        stmt = stmt.where(Constraint.market_type == market_type.lower())
     
-    query = query.order_by(desc(Constraint.timestamp)).limit(limit)
-    
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "constraint_name": r.constraint_name,
-                "market_type": r.market_type,
-                "shadow_price": r.shadow_price,
-                "binding_status": r.binding_status,
-                "limit_mw": r.limit_mw,
-                "flow_mw": r.flow_mw
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, Constraint, after, limit)
 
 
-@app.get("/api/external-rto-prices", response_model=List[ExternalRTOPriceResponse])
-async def get_external_rto_prices(
+@app.get("/api/external-rto-prices", responses={200: {"model": List[ExternalRTOPriceResponse]}})
+def get_external_rto_prices(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     rto_name: Optional[str] = Query(None, description="Filter by RTO name (IESO, PJM, ISO-NE)"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_db)
 ):
     """Get external RTO CTS prices."""
-    db = next(get_db())
-    
-    query = db.query(ExternalRTOPrice)
+    stmt = select(
+        ExternalRTOPrice.timestamp,
+        ExternalRTOPrice.rto_name,
+        ExternalRTOPrice.rtc_price,
+        ExternalRTOPrice.cts_price,
+        ExternalRTOPrice.price_difference
+    )
     
     if start_date:
-        query = query.filter(ExternalRTOPrice.timestamp >= start_date)
+        stmt = stmt.where(ExternalRTOPrice.timestamp >= start_date)
     if end_date:
-        query = query.filter(ExternalRTOPrice.timestamp <= end_date)
+        stmt = stmt.where(ExternalRTOPrice.timestamp <= end_date)
     if rto_name:
-        query = query.filter(ExternalRTOPrice.rto_name == rto_name.upper())
-    
-    query = query.order_by(desc(ExternalRTOPrice.timestamp)).limit(limit)
+        stmt = stmt.where(ExternalRTOPrice.rto_name == rto_name.upper())
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "rto_name": r.rto_name,
-                "rtc_price": r.rtc_price,
-                "cts_price": r.cts_price,
-                "price_difference": r.price_difference
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, ExternalRTOPrice, after, limit)
 
 
-@app.get("/api/atc-ttc", response_model=List[ATC_TTCResponse])
-async def get_atc_ttc(
+@app.get("/api/atc-ttc", responses={200: {"model": List[ATC_TTCResponse]}})
+def get_atc_ttc(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     interfaces: Optional[str] = Query(None, description="Comma-separated interface names"),
     forecast_type: Optional[str] = Query(None, description="Filter by forecast type: 'short_term' or 'long_term'"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_db)
 ):
     """Get ATC/TTC data."""
-    db = next(get_db())
-    
-    query = db.query(ATC_TTC).join(Interface)
+    stmt = select(
+        ATC_TTC.timestamp,
+        ATC_TTC.interface_id,
+        ATC_TTC.forecast_type,
+        ATC_TTC.atc_mw,
+        ATC_TTC.ttc_mw,
+        ATC_TTC.trm_mw,
+        ATC_TTC.direction
+    )
     
     if start_date:
-        query = query.filter(ATC_TTC.timestamp >= start_date)
+        stmt = stmt.where(ATC_TTC.timestamp >= start_date)
     if end_date:
-        query = query.filter(ATC_TTC.timestamp <= end_date)
+        stmt = stmt.where(ATC_TTC.timestamp <= end_date)
     if interfaces:
         interface_list = [i.strip() for i in interfaces.split(',')]
-        query = query.filter(Interface.name.in_(interface_list))
+        stmt = stmt.where(ATC_TTC.interface_id.in_(_ids_for_names(db, Interface, interface_list)))
     if forecast_type:
-        query = query.filter(ATC_TTC.forecast_type == forecast_type)
+        stmt = stmt.where(ATC_TTC.forecast_type == forecast_type)
     
-    query = query.order_by(desc(ATC_TTC.timestamp)).limit(limit)
-    
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "interface_name": r.interface.name,
-                "forecast_type": r.forecast_type,
-                "atc_mw": r.atc_mw,
-                "ttc_mw": r.ttc_mw,
-                "trm_mw": r.trm_mw,
-                "direction": r.direction
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(
+        db, stmt, ATC_TTC, after, limit,
+        _name_resolver(db, Interface, "interface_id", "interface_name")
+    )
 
 
-@app.get("/api/outages", response_model=List[OutageResponse])
-async def get_outages(
+@app.get("/api/outages", responses={200: {"model": List[OutageResponse]}})
+def get_outages(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     outage_type: Optional[str] = Query(None, description="Filter by outage type: 'scheduled', 'actual', 'maintenance'"),
     market_type: Optional[str] = Query(None, description="Filter by market type: 'realtime' or 'dayahead'"),
     resource_type: Optional[str] = Query(None, description="Filter by resource type: 'generator' or 'transmission'"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_db)
 ):
     """Get outage information."""
-    db = next(get_db())
-    
-    query = db.query(Outage)
+    stmt = select(
+        Outage.timestamp,
+        Outage.outage_type,
+        Outage.market_type,
+        Outage.resource_name,
+        Outage.resource_type,
+        Outage.mw_capacity,
+        Outage.mw_outage,
+        Outage.start_time,
+        Outage.end_time,
+        Outage.status
+    )
     
     if start_date:
-        query = query.filter(Outage.timestamp >= start_date)
+        stmt = stmt.where(Outage.timestamp >= start_date)
     if end_date:
-        query = query.filter(Outage.timestamp <= end_date)
+        stmt = stmt.where(Outage.timestamp <= end_date)
     if outage_type:
-        query = query.filter(Outage.outage_type == outage_type.lower())
+        stmt = stmt.where(Outage.outage_type == outage_type.lower())
     if market_type:
-        query = query.filter(Outage.market_type == market_type.lower())
+        stmt = stmt.where(Outage.market_type == market_type.lower())
     if resource_type:
-        query = query.filter(Outage.resource_type == resource_type.lower())
-    
-    query = query.order_by(desc(Outage.timestamp)).limit(limit)
+        stmt = stmt.where(Outage.resource_type == resource_type.lower())
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "outage_type": r.outage_type,
-                "market_type": r.market_type,
-                "resource_name": r.resource_name,
-                "resource_type": r.resource_type,
-                "mw_capacity": r.mw_capacity,
-                "mw_outage": r.mw_outage,
-                "start_time": r.start_time,
-                "end_time": r.end_time,
-                "status": r.status
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, Outage, after, limit)
 
 
-@app.get("/api/weather-forecast", response_model=List[WeatherForecastResponse])
-async def get_weather_forecast(
+class _hours_between(FunctionElement):
+    """SQL expression for the hours from the second datetime argument to the first."""
+    type = Float()
+    name = "hours_between"
+    inherit_cache = True
+
+
+@compiles(_hours_between)
+def _compile_hours_between(element, compiler, **kw):
+    # SQLite: whole seconds since the epoch (julianday() would add float error)
+    later, earlier = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"(strftime('%s', {later}) - strftime('%s', {earlier})) / 3600.0"
+
+
+@compiles(_hours_between, "postgresql")
+def _compile_hours_between_postgresql(element, compiler, **kw):
+    later, earlier = (compiler.process(arg, **kw) for arg in element.clauses)
+    return f"EXTRACT(EPOCH FROM ({later} - {earlier})) / 3600.0"
+
+
+@app.get("/api/weather-forecast", responses={200: {"model": List[WeatherForecastResponse]}})
+def get_weather_forecast(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     location: Optional[str] = Query(None, description="Filter by location"),
     vintage: Optional[str] = Query(None, description="Filter by vintage: 'Actual' or 'Forecast'"),
     zone_name: Optional[str] = Query(None, description="Filter by NYISO zone name"),
     data_source: Optional[str] = Query(None, description="Filter by data source: 'NYISO' or 'OpenMeteo'"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_db)
 ):
     """Get weather forecast data."""
-    db = next(get_db())
-    
-    query = db.query(WeatherForecast)
+    stmt = select(
+        WeatherForecast.timestamp,
+        WeatherForecast.forecast_time,
+        WeatherForecast.location,
+        WeatherForecast.vintage,  # 'Actual' or 'Forecast'
+        WeatherForecast.temperature_f.label("temperature"),  # Frontend-friendly names
+        WeatherForecast.humidity_percent.label("humidity"),
+        WeatherForecast.wind_speed_mph.label("wind_speed"),
+        WeatherForecast.wind_direction,
+        WeatherForecast.cloud_cover_percent,
+        WeatherForecast.zone_name,
+        WeatherForecast.irradiance_w_m2,
+        func.coalesce(WeatherForecast.data_source, 'NYISO').label("data_source"),
+        _hours_between(WeatherForecast.forecast_time, WeatherForecast.timestamp).label("forecast_horizon")
+    )
     
     if start_date:
-        query = query.filter(WeatherForecast.timestamp >= start_date)
+        stmt = stmt.where(WeatherForecast.timestamp >= start_date)
     if end_date:
-        query = query.filter(WeatherForecast.timestamp <= end_date)
+        stmt = stmt.where(WeatherForecast.timestamp <= end_date)
     if location:
-        query = query.filter(WeatherForecast.location == location)
+        stmt = stmt.where(WeatherForecast.location == location)
     if vintage:
-        query = query.filter(WeatherForecast.vintage == vintage)
+        stmt = stmt.where(WeatherForecast.vintage == vintage)
     if zone_name:
-        query = query.filter(WeatherForecast.zone_name == zone_name)
+        stmt = stmt.where(WeatherForecast.zone_name == zone_name)
     if data_source:
-        query = query.filter(WeatherForecast.data_source == data_source)
+        stmt = stmt.where(WeatherForecast.data_source == data_source)
     
-    query = query.order_by(desc(WeatherForecast.timestamp)).limit(limit)
-    
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp.isoformat() if r.timestamp else None,
-                "forecast_time": r.forecast_time.isoformat() if r.forecast_time else None,
-                "location": r.location,
-                "vintage": r.vintage,  # 'Actual' or 'Forecast'
-                "temperature": r.temperature_f,  # Map to frontend-friendly name
-                "humidity": r.humidity_percent,  # Map to frontend-friendly name
-                "wind_speed": r.wind_speed_mph,  # Map to frontend-friendly name
-                "wind_direction": r.wind_direction,
-                "cloud_cover_percent": r.cloud_cover_percent,
-                "zone_name": r.zone_name,
-                "irradiance_w_m2": r.irradiance_w_m2,
-                "data_source": r.data_source or 'NYISO',
-                "forecast_horizon": (r.forecast_time - r.timestamp).total_seconds() / 3600 if r.forecast_time and r.timestamp else None
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, WeatherForecast, after, limit)
 
 
-@app.get("/api/weather-current", response_model=List[WeatherForecastResponse])
-async def get_current_weather(
+@app.get("/api/weather-current", responses={200: {"model": List[WeatherForecastResponse]}})
+def get_current_weather(
     location: Optional[str] = Query(None, description="Filter by location (station ID)"),
     zone_name: Optional[str] = Query(None, description="Filter by NYISO zone name"),
-    data_source: Optional[str] = Query(None, description="Filter by data source: 'NYISO' or 'OpenMeteo'")
+    data_source: Optional[str] = Query(None, description="Filter by data source: 'NYISO' or 'OpenMeteo'"),
+    db: Session = Depends(get_db)
 ):
     """Get current weather data (Actual vintage, most recent per station).
     
@@ -1361,742 +1592,589 @@ async def get_current_weather(
     represents when the data was last updated (Vintage Date), while 'timestamp' 
     represents the date the weather is for (Forecast Date).
     """
-    db = next(get_db())
+    # Build base filter for Actual vintage
+    base_filter = WeatherForecast.vintage == 'Actual'
     
-    try:
-        # Build base filter for Actual vintage
-        base_filter = WeatherForecast.vintage == 'Actual'
-        
-        # If data_source is specified, filter by it from the start
-        # This ensures we find the latest data for that specific source
-        if data_source:
-            base_filter = and_(base_filter, WeatherForecast.data_source == data_source)
-        
-        # Get most recent actual weather data for the specified data source
-        # Use forecast_time (Vintage Date) to find the most recently updated data
-        latest_vintage_date_query = db.query(func.max(WeatherForecast.forecast_time)).filter(base_filter)
-        latest_vintage_date = latest_vintage_date_query.scalar()
-        
-        if not latest_vintage_date:
-            return []
-        
-        # Get the most recent timestamp (Forecast Date) for this vintage date and data source
-        latest_timestamp_query = db.query(func.max(WeatherForecast.timestamp)).filter(
-            base_filter,
-            WeatherForecast.forecast_time == latest_vintage_date
-        )
-        latest_timestamp = latest_timestamp_query.scalar()
-        
-        if not latest_timestamp:
-            return []
-        
-        # Get one record per location for the latest data
-        # Use a subquery to get the most recent record per location
-        subquery_filter = and_(
-            WeatherForecast.vintage == 'Actual',
-            WeatherForecast.timestamp == latest_timestamp,
-            WeatherForecast.forecast_time == latest_vintage_date
-        )
-        
-        # Apply data_source filter to subquery if specified
-        if data_source:
-            subquery_filter = and_(subquery_filter, WeatherForecast.data_source == data_source)
-        
-        subquery = db.query(
-            WeatherForecast.location,
-            func.max(WeatherForecast.forecast_time).label('max_forecast_time')
-        ).filter(subquery_filter)
-        
-        if location:
-            subquery = subquery.filter(WeatherForecast.location == location)
-        if zone_name:
-            subquery = subquery.filter(WeatherForecast.zone_name == zone_name)
-        
-        subquery = subquery.group_by(WeatherForecast.location).subquery()
-        
-        # Join to get full records
-        join_conditions = and_(
-            WeatherForecast.location == subquery.c.location,
-            WeatherForecast.forecast_time == subquery.c.max_forecast_time,
-            WeatherForecast.vintage == 'Actual',
-            WeatherForecast.timestamp == latest_timestamp
-        )
-        
-        # Apply data_source filter to join conditions if specified
-        if data_source:
-            join_conditions = and_(join_conditions, WeatherForecast.data_source == data_source)
-        
-        query = db.query(WeatherForecast).join(
-            subquery,
-            join_conditions
-        )
-        
-        if location:
-            query = query.filter(WeatherForecast.location == location)
-        if zone_name:
-            query = query.filter(WeatherForecast.zone_name == zone_name)
-        
-        query = query.order_by(WeatherForecast.location)
-        
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp.isoformat() if r.timestamp else None,
-                "forecast_time": r.forecast_time.isoformat() if r.forecast_time else None,  # This is the "last updated" time
-                "location": r.location,
-                "vintage": r.vintage,
-                "temperature": r.temperature_f,
-                "humidity": r.humidity_percent,
-                "wind_speed": r.wind_speed_mph,
-                "wind_direction": r.wind_direction,
-                "cloud_cover_percent": r.cloud_cover_percent,
-                "zone_name": r.zone_name,
-                "irradiance_w_m2": r.irradiance_w_m2,
-                "data_source": r.data_source or 'NYISO',
-                "forecast_horizon": None  # Current weather, not a forecast
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    # If data_source is specified, filter by it from the start
+    # This ensures we find the latest data for that specific source
+    if data_source:
+        base_filter = and_(base_filter, WeatherForecast.data_source == data_source)
+    
+    # Most recently updated vintage (forecast_time), then the latest
+    # Forecast Date (timestamp) within it; both resolve inside the one query
+    latest_vintage_date = select(func.max(WeatherForecast.forecast_time)).where(
+        base_filter
+    ).scalar_subquery()
+    latest_timestamp = select(func.max(WeatherForecast.timestamp)).where(
+        base_filter,
+        WeatherForecast.forecast_time == latest_vintage_date
+    ).scalar_subquery()
+    
+    stmt = select(
+        WeatherForecast.timestamp,
+        WeatherForecast.forecast_time,  # This is the "last updated" time
+        WeatherForecast.location,
+        WeatherForecast.vintage,
+        WeatherForecast.temperature_f.label("temperature"),
+        WeatherForecast.humidity_percent.label("humidity"),
+        WeatherForecast.wind_speed_mph.label("wind_speed"),
+        WeatherForecast.wind_direction,
+        WeatherForecast.cloud_cover_percent,
+        WeatherForecast.zone_name,
+        WeatherForecast.irradiance_w_m2,
+        func.coalesce(WeatherForecast.data_source, 'NYISO').label("data_source"),
+        # Current weather, not a forecast
+        null().label("forecast_horizon")
+    ).where(
+        base_filter,
+        WeatherForecast.forecast_time == latest_vintage_date,
+        WeatherForecast.timestamp == latest_timestamp
+    )
+    
+    if location:
+        stmt = stmt.where(WeatherForecast.location == location)
+    if zone_name:
+        stmt = stmt.where(WeatherForecast.zone_name == zone_name)
+    
+    stmt = stmt.order_by(WeatherForecast.location)
+    
+    return _stream_json_rows(db, stmt)
 
 
-@app.get("/api/fuel-mix", response_model=List[FuelMixResponse])
-async def get_fuel_mix(
+@app.get("/api/fuel-mix", responses={200: {"model": List[FuelMixResponse]}})
+def get_fuel_mix(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     fuel_type: Optional[str] = Query(None, description="Filter by fuel type"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    after: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_db)
 ):
     """Get real-time fuel mix / generation stack."""
-    db = next(get_db())
-    
-    query = db.query(FuelMix)
+    stmt = select(
+        FuelMix.timestamp,
+        FuelMix.fuel_type,
+        FuelMix.generation_mw,
+        FuelMix.percentage
+    )
     
     if start_date:
-        query = query.filter(FuelMix.timestamp >= start_date)
+        stmt = stmt.where(FuelMix.timestamp >= start_date)
     if end_date:
-        query = query.filter(FuelMix.timestamp <= end_date)
+        stmt = stmt.where(FuelMix.timestamp <= end_date)
     if fuel_type:
-        query = query.filter(FuelMix.fuel_type == fuel_type.lower())
-    
-    query = query.order_by(desc(FuelMix.timestamp)).limit(limit)
+        stmt = stmt.where(FuelMix.fuel_type == fuel_type.lower())
     
-    try:
-        results = query.all()
-        return [
-            {
-                "timestamp": r.timestamp,
-                "fuel_type": r.fuel_type,
-                "generation_mw": r.generation_mw,
-                "percentage": r.percentage
-            }
-            for r in results
-        ]
-    finally:
-        db.close()
+    return _keyset_page(db, stmt, FuelMix, after, limit)
 
 
 # ============================================================================
 # CALCULATED METRICS ENDPOINTS
 # ============================================================================
 
-@app.get("/api/rt-da-spreads", response_model=List[RTDASpreadResponse])
-async def get_rt_da_spreads(
+# RT minus DA price, and that spread as a percent of DA (NULL when DA is 0)
+_RT_DA_SPREAD = RealTimeLBMP.lbmp - DayAheadLBMP.lbmp
+_RT_DA_SPREAD_PERCENT = _RT_DA_SPREAD / func.nullif(DayAheadLBMP.lbmp, 0) * 100
+
+# Actual minus forecast load, and that error as a percent of the forecast
+# (0 when the forecast is 0)
+_LOAD_ERROR_MW = RealTimeLoad.load - LoadForecast.forecast_load
+_LOAD_ERROR_PERCENT = case(
+    (LoadForecast.forecast_load != 0, _LOAD_ERROR_MW / LoadForecast.forecast_load * 100),
+    else_=0.0
+)
+
+
+def _rt_da_spread_stmt():
+    """RT LBMP rows joined to the DA LBMP for the same timestamp and zone."""
+    return select(
+        RealTimeLBMP.timestamp,
+        Zone.name.label('zone_name'),
+        RealTimeLBMP.lbmp.label('rt_lbmp'),
+        DayAheadLBMP.lbmp.label('da_lbmp'),
+        _RT_DA_SPREAD.label('spread'),
+        _RT_DA_SPREAD_PERCENT.label('spread_percent')
+    ).join(Zone, RealTimeLBMP.zone_id == Zone.id).join(
+        DayAheadLBMP,
+        and_(DayAheadLBMP.timestamp == RealTimeLBMP.timestamp, DayAheadLBMP.zone_id == RealTimeLBMP.zone_id)
+    )
+
+
+def _load_forecast_error_stmt():
+    """Load forecast rows joined to the actual load for the same timestamp and zone."""
+    return select(
+        LoadForecast.timestamp,
+        Zone.name.label('zone_name'),
+        RealTimeLoad.load.label('actual_load'),
+        LoadForecast.forecast_load,
+        _LOAD_ERROR_MW.label('error_mw'),
+        _LOAD_ERROR_PERCENT.label('error_percent')
+    ).join(Zone, LoadForecast.zone_id == Zone.id).join(
+        RealTimeLoad,
+        and_(RealTimeLoad.timestamp == LoadForecast.timestamp, RealTimeLoad.zone_id == LoadForecast.zone_id)
+    )
+
+
+def _load_generation_stmt(start_date: Optional[datetime], end_date: Optional[datetime]):
+    """Total RT load and total fuel-mix generation per timestamp, for timestamps with both."""
+    load = select(RealTimeLoad.timestamp, func.sum(RealTimeLoad.load).label('total_load'))
+    gen = select(FuelMix.timestamp, func.sum(FuelMix.generation_mw).label('total_generation'))
+    if start_date:
+        load = load.where(RealTimeLoad.timestamp >= start_date)
+        gen = gen.where(FuelMix.timestamp >= start_date)
+    if end_date:
+        load = load.where(RealTimeLoad.timestamp <= end_date)
+        gen = gen.where(FuelMix.timestamp <= end_date)
+    load = load.group_by(RealTimeLoad.timestamp).subquery()
+    gen = gen.group_by(FuelMix.timestamp).subquery()
+    return select(load.c.timestamp, load.c.total_load, gen.c.total_generation).join(
+        gen, gen.c.timestamp == load.c.timestamp
+    )
+
+
+@app.get("/api/rt-da-spreads", responses={200: {"model": List[RTDASpreadResponse]}})
+@_cached_response
+def get_rt_da_spreads(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
     min_spread: Optional[float] = Query(None, description="Minimum spread threshold ($/MWh)"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    db: Session = Depends(get_db)
 ):
     """Calculate RT-DA price spreads by zone.
     
     Compares real-time LBMP with day-ahead LBMP for the same timestamp and zone.
     Positive spread means RT > DA (real-time is more expensive).
     """
-    db = next(get_db())
+    # RT and DA prices are matched, filtered and limited in the database
+    stmt = _rt_da_spread_stmt()
     
-    try:
-        # Get RT and DA LBMP data, matching by timestamp and zone
-        rt_query = db.query(
-            RealTimeLBMP.timestamp,
-            Zone.name.label('zone_name'),
-            RealTimeLBMP.lbmp.label('rt_lbmp')
-        ).join(Zone).filter(RealTimeLBMP.zone_id == Zone.id)
-        
-        da_query = db.query(
-            DayAheadLBMP.timestamp,
-            Zone.name.label('zone_name'),
-            DayAheadLBMP.lbmp.label('da_lbmp')
-        ).join(Zone).filter(DayAheadLBMP.zone_id == Zone.id)
-        
-        if start_date:
-            rt_query = rt_query.filter(RealTimeLBMP.timestamp >= start_date)
-            da_query = da_query.filter(DayAheadLBMP.timestamp >= start_date)
-        if end_date:
-            rt_query = rt_query.filter(RealTimeLBMP.timestamp <= end_date)
-            da_query = da_query.filter(DayAheadLBMP.timestamp <= end_date)
-        if zones:
-            zone_list = [z.strip().upper() for z in zones.split(',')]
-            rt_query = rt_query.filter(Zone.name.in_(zone_list))
-            da_query = da_query.filter(Zone.name.in_(zone_list))
-        
-        # Get data - use tuple keys for matching
-        rt_data = {(r.timestamp, r.zone_name): r.rt_lbmp for r in rt_query.all()}
-        da_data = {(r.timestamp, r.zone_name): r.da_lbmp for r in da_query.all()}
-        
-        # Calculate spreads for matching timestamps and zones
-        spreads = []
-        for (ts, zone), rt_lbmp in rt_data.items():
-            if (ts, zone) in da_data:
-                da_lbmp = da_data[(ts, zone)]
-                spread = rt_lbmp - da_lbmp
-                spread_pct = (spread / da_lbmp * 100) if da_lbmp != 0 else None
-                
-                if min_spread is None or abs(spread) >= min_spread:
-                    spreads.append({
-                        "timestamp": ts,
-                        "zone_name": zone,
-                        "rt_lbmp": rt_lbmp,
-                        "da_lbmp": da_lbmp,
-                        "spread": spread,
-                        "spread_percent": spread_pct
-                    })
-        
-        # Sort by timestamp desc and limit
-        spreads.sort(key=lambda x: x["timestamp"], reverse=True)
-        return spreads[:limit]
-    finally:
-        db.close()
+    if start_date:
+        stmt = stmt.where(RealTimeLBMP.timestamp >= start_date)
+    if end_date:
+        stmt = stmt.where(RealTimeLBMP.timestamp <= end_date)
+    if zones:
+        stmt = stmt.where(Zone.name.in_(zones))
+    if min_spread is not None:
+        stmt = stmt.where(func.abs(_RT_DA_SPREAD) >= min_spread)
+    
+    rows = db.execute(stmt.order_by(desc(RealTimeLBMP.timestamp)).limit(limit)).mappings()
+    return ORJSONResponse([dict(row) for row in rows])
 
 
-@app.get("/api/zone-spreads", response_model=List[ZoneSpreadResponse])
-async def get_zone_spreads(
+@app.get("/api/zone-spreads", responses={200: {"model": List[ZoneSpreadResponse]}})
+@_cached_response
+def get_zone_spreads(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     include_all_zones: bool = Query(False, description="Include all zone prices in response"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    db: Session = Depends(get_db)
 ):
     """Calculate intra-zonal price differentials.
     
     For each timestamp, finds the maximum and minimum zone prices,
     and calculates the spread between them.
     """
-    db = next(get_db())
-    
-    try:
-        # Get all RT LBMP data grouped by timestamp
-        query = db.query(
-            RealTimeLBMP.timestamp,
-            Zone.name.label('zone_name'),
-            RealTimeLBMP.lbmp
-        ).join(Zone).filter(RealTimeLBMP.zone_id == Zone.id)
-        
-        if start_date:
-            query = query.filter(RealTimeLBMP.timestamp >= start_date)
-        if end_date:
-            query = query.filter(RealTimeLBMP.timestamp <= end_date)
-        
-        results = query.order_by(desc(RealTimeLBMP.timestamp)).limit(limit * 20).all()
-        
-        # Group by timestamp
-        by_timestamp = {}
-        for r in results:
-            ts = r.timestamp
-            if ts not in by_timestamp:
-                by_timestamp[ts] = {}
-            by_timestamp[ts][r.zone_name] = r.lbmp
-        
-        # Calculate spreads
-        spreads = []
-        for ts, zone_prices in sorted(by_timestamp.items(), reverse=True)[:limit]:
-            if len(zone_prices) < 2:
-                continue
-            
-            max_zone = max(zone_prices.items(), key=lambda x: x[1])
-            min_zone = min(zone_prices.items(), key=lambda x: x[1])
-            
-            spreads.append({
-                "timestamp": ts,
-                "max_zone": max_zone[0],
-                "min_zone": min_zone[0],
-                "max_price": max_zone[1],
-                "min_price": min_zone[1],
-                "spread": max_zone[1] - min_zone[1],
-                "all_zones": zone_prices if include_all_zones else None
-            })
-        
-        return spreads
-    finally:
-        db.close()
-
-
-@app.get("/api/load-forecast-errors", response_model=List[LoadForecastErrorResponse])
-async def get_load_forecast_errors(
+    # The latest `limit` timestamps in range
+    latest = select(RealTimeLBMP.timestamp).distinct()
+    if start_date:
+        latest = latest.where(RealTimeLBMP.timestamp >= start_date)
+    if end_date:
+        latest = latest.where(RealTimeLBMP.timestamp <= end_date)
+    latest = latest.order_by(desc(RealTimeLBMP.timestamp)).limit(limit)
+    
+    # Rank each timestamp's zone prices both ways, then keep the top and
+    # bottom zone per timestamp
+    ranked = select(
+        RealTimeLBMP.timestamp,
+        Zone.name.label('zone_name'),
+        RealTimeLBMP.lbmp,
+        func.row_number().over(
+            partition_by=RealTimeLBMP.timestamp, order_by=(desc(RealTimeLBMP.lbmp), Zone.name)
+        ).label('max_rank'),
+        func.row_number().over(
+            partition_by=RealTimeLBMP.timestamp, order_by=(RealTimeLBMP.lbmp, Zone.name)
+        ).label('min_rank'),
+        func.count().over(partition_by=RealTimeLBMP.timestamp).label('zone_count')
+    ).join(Zone, RealTimeLBMP.zone_id == Zone.id).where(
+        RealTimeLBMP.timestamp.in_(latest)
+    ).subquery()
+    
+    max_price = func.max(ranked.c.lbmp)
+    min_price = func.min(ranked.c.lbmp)
+    rows = db.execute(
+        select(
+            ranked.c.timestamp,
+            func.max(case((ranked.c.max_rank == 1, ranked.c.zone_name))).label('max_zone'),
+            func.max(case((ranked.c.min_rank == 1, ranked.c.zone_name))).label('min_zone'),
+            max_price.label('max_price'),
+            min_price.label('min_price'),
+            (max_price - min_price).label('spread')
+        ).where(ranked.c.zone_count >= 2)
+        .group_by(ranked.c.timestamp)
+        .order_by(desc(ranked.c.timestamp))
+    ).mappings().all()
+    
+    all_zones = {}
+    if include_all_zones and rows:
+        prices = db.execute(
+            select(RealTimeLBMP.timestamp, Zone.name, RealTimeLBMP.lbmp)
+            .join(Zone, RealTimeLBMP.zone_id == Zone.id)
+            .where(RealTimeLBMP.timestamp.in_(latest))
+        ).all()
+        for ts, zone_name, lbmp in prices:
+            all_zones.setdefault(ts, {})[zone_name] = lbmp
+    
+    return ORJSONResponse([{**row, "all_zones": all_zones.get(row["timestamp"])} for row in rows])
+
+
+@app.get("/api/load-forecast-errors", responses={200: {"model": List[LoadForecastErrorResponse]}})
+@_cached_response
+def get_load_forecast_errors(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
     max_error_percent: Optional[float] = Query(None, description="Maximum error percentage threshold"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    db: Session = Depends(get_db)
 ):
     """Calculate load forecast errors (forecast vs actual deviations).
     
     Compares load forecast with actual real-time load for the same timestamp and zone.
     """
-    db = next(get_db())
+    # Forecast and actual load are matched, filtered and limited in the database
+    stmt = _load_forecast_error_stmt()
     
-    try:
-        # Get forecast and actual load data
-        forecast_query = db.query(
-            LoadForecast.timestamp,
-            Zone.name.label('zone_name'),
-            LoadForecast.forecast_load
-        ).join(Zone).filter(LoadForecast.zone_id == Zone.id)
-        
-        actual_query = db.query(
-            RealTimeLoad.timestamp,
-            Zone.name.label('zone_name'),
-            RealTimeLoad.load.label('actual_load')
-        ).join(Zone).filter(RealTimeLoad.zone_id == Zone.id)
-        
-        if start_date:
-            forecast_query = forecast_query.filter(LoadForecast.timestamp >= start_date)
-            actual_query = actual_query.filter(RealTimeLoad.timestamp >= start_date)
-        if end_date:
-            forecast_query = forecast_query.filter(LoadForecast.timestamp <= end_date)
-            actual_query = actual_query.filter(RealTimeLoad.timestamp <= end_date)
-        if zones:
-            zone_list = [z.strip().upper() for z in zones.split(',')]
-            forecast_query = forecast_query.filter(Zone.name.in_(zone_list))
-            actual_query = actual_query.filter(Zone.name.in_(zone_list))
-        
-        forecast_data = {(r.timestamp, r.zone_name): r.forecast_load for r in forecast_query.all()}
-        actual_data = {(r.timestamp, r.zone_name): r.actual_load for r in actual_query.all()}
-        
-        # Calculate errors
-        errors = []
-        for (ts, zone), forecast_load in forecast_data.items():
-            if (ts, zone) in actual_data:
-                actual_load = actual_data[(ts, zone)]
-                error_mw = actual_load - forecast_load
-                error_pct = (error_mw / forecast_load * 100) if forecast_load != 0 else 0
-                
-                if max_error_percent is None or abs(error_pct) <= max_error_percent:
-                    errors.append({
-                        "timestamp": ts,
-                        "zone_name": zone,
-                        "actual_load": actual_load,
-                        "forecast_load": forecast_load,
-                        "error_mw": error_mw,
-                        "error_percent": error_pct
-                    })
-        
-        errors.sort(key=lambda x: x["timestamp"], reverse=True)
-        return errors[:limit]
-    finally:
-        db.close()
+    if start_date:
+        stmt = stmt.where(LoadForecast.timestamp >= start_date)
+    if end_date:
+        stmt = stmt.where(LoadForecast.timestamp <= end_date)
+    if zones:
+        stmt = stmt.where(Zone.name.in_(zones))
+    if max_error_percent is not None:
+        stmt = stmt.where(func.abs(_LOAD_ERROR_PERCENT) <= max_error_percent)
+    
+    rows = db.execute(stmt.order_by(desc(LoadForecast.timestamp)).limit(limit)).mappings()
+    return ORJSONResponse([dict(row) for row in rows])
 
 
-@app.get("/api/reserve-margins", response_model=List[ReserveMarginResponse])
-async def get_reserve_margins(
+@app.get("/api/reserve-margins", responses={200: {"model": List[ReserveMarginResponse]}})
+@_cached_response
+def get_reserve_margins(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    db: Session = Depends(get_db)
 ):
     """Calculate reserve margins.
     
     Reserve margin = (Total Generation Capacity - Total Load) / Total Load * 100
     Uses fuel mix data for generation and real-time load for demand.
     """
-    db = next(get_db())
+    rows = db.execute(
+        _load_generation_stmt(start_date, end_date).order_by(desc('timestamp')).limit(limit)
+    ).all()
+    
+    # Calculate reserve margins
+    margins = []
+    for ts, total_load, total_gen in rows:
+        reserve_mw = total_gen - total_load if total_gen else None
+        reserve_pct = (reserve_mw / total_load * 100) if total_load and reserve_mw else None
+        
+        margins.append({
+            "timestamp": ts,
+            "total_load": total_load,
+            "total_generation": total_gen,
+            "reserve_margin_mw": reserve_mw,
+            "reserve_margin_percent": reserve_pct,
+            "zones": None  # Could be enhanced to calculate per-zone
+        })
     
-    try:
-        # Get total load by timestamp
-        load_query = db.query(
-            RealTimeLoad.timestamp,
-            func.sum(RealTimeLoad.load).label('total_load')
-        ).group_by(RealTimeLoad.timestamp)
-        
-        # Get total generation by timestamp (from fuel mix)
-        gen_query = db.query(
-            FuelMix.timestamp,
-            func.sum(FuelMix.generation_mw).label('total_generation')
-        ).group_by(FuelMix.timestamp)
-        
-        if start_date:
-            load_query = load_query.filter(RealTimeLoad.timestamp >= start_date)
-            gen_query = gen_query.filter(FuelMix.timestamp >= start_date)
-        if end_date:
-            load_query = load_query.filter(RealTimeLoad.timestamp <= end_date)
-            gen_query = gen_query.filter(FuelMix.timestamp <= end_date)
-        
-        load_data = {r.timestamp: r.total_load for r in load_query.all()}
-        gen_data = {r.timestamp: r.total_generation for r in gen_query.all()}
-        
-        # Calculate reserve margins
-        margins = []
-        for ts in sorted(set(load_data.keys()) & set(gen_data.keys()), reverse=True)[:limit]:
-            total_load = load_data[ts]
-            total_gen = gen_data[ts]
-            reserve_mw = total_gen - total_load if total_gen else None
-            reserve_pct = (reserve_mw / total_load * 100) if total_load and reserve_mw else None
-            
-            margins.append({
-                "timestamp": ts,
-                "total_load": total_load,
-                "total_generation": total_gen,
-                "reserve_margin_mw": reserve_mw,
-                "reserve_margin_percent": reserve_pct,
-                "zones": None  # Could be enhanced to calculate per-zone
-            })
-        
-        return margins
-    finally:
-        db.close()
+    return ORJSONResponse(margins)
+
+
+# RT LBMP rows packed into arrays per round-trip for the pandas-based metrics
+_FRAME_BATCH_SIZE = 10_000
 
 
-@app.get("/api/price-volatility", response_model=List[PriceVolatilityResponse])
-async def get_price_volatility(
+def _zone_price_stmt(start_date: Optional[datetime], end_date: Optional[datetime], zones: Optional[Tuple[str, ...]]):
+    """(timestamp, zone_name, lbmp) RT LBMP rows for the given range and zones."""
+    stmt = select(
+        RealTimeLBMP.timestamp,
+        Zone.name.label('zone_name'),
+        RealTimeLBMP.lbmp
+    ).join(Zone, RealTimeLBMP.zone_id == Zone.id)
+    
+    if start_date:
+        stmt = stmt.where(RealTimeLBMP.timestamp >= start_date)
+    if end_date:
+        stmt = stmt.where(RealTimeLBMP.timestamp <= end_date)
+    if zones:
+        stmt = stmt.where(Zone.name.in_(zones))
+    return stmt
+
+
+def _zone_price_frame(db: Session, stmt) -> pd.DataFrame:
+    """Load a _zone_price_stmt() result into a DataFrame.
+    
+    Rows come through a server-side cursor and each batch is packed into
+    NumPy arrays right away, so only one batch of Python rows is alive at a time.
+    """
+    timestamps, zone_names, prices = [], [], []
+    result = db.execute(stmt.execution_options(stream_results=True, yield_per=_FRAME_BATCH_SIZE))
+    for partition in result.partitions():
+        batch_timestamps, batch_zones, batch_prices = zip(*partition)
+        timestamps.append(np.array(batch_timestamps, dtype="datetime64[us]"))
+        zone_names.append(np.array(batch_zones, dtype=object))
+        prices.append(np.array(batch_prices, dtype=np.float64))
+    if not timestamps:
+        return pd.DataFrame(columns=["timestamp", "zone_name", "lbmp"])
+    return pd.DataFrame({
+        "timestamp": np.concatenate(timestamps),
+        # A dozen distinct zones: small integer codes instead of a string per row
+        "zone_name": pd.Categorical(np.concatenate(zone_names)),
+        "lbmp": np.concatenate(prices)
+    })
+
+
+@app.get("/api/price-volatility", responses={200: {"model": List[PriceVolatilityResponse]}})
+@_cached_response
+def get_price_volatility(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names"),
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
     window_hours: int = Query(24, ge=1, le=168, description="Rolling window size in hours"),
-    limit: int = Query(1000, ge=1, le=10000, description="Maximum records to return")
+    limit: int = Query(1000, ge=1, le=1000, description="Maximum records to return"),
+    db: Session = Depends(get_db)
 ):
     """Calculate rolling price volatility metrics.
     
     Computes standard deviation of prices over a rolling window.
     """
-    db = next(get_db())
-    
-    try:
-        query = db.query(
-            RealTimeLBMP.timestamp,
-            Zone.name.label('zone_name'),
-            RealTimeLBMP.lbmp
-        ).join(Zone).filter(RealTimeLBMP.zone_id == Zone.id)
-        
-        if start_date:
-            query = query.filter(RealTimeLBMP.timestamp >= start_date)
-        if end_date:
-            query = query.filter(RealTimeLBMP.timestamp <= end_date)
-        if zones:
-            zone_list = [z.strip().upper() for z in zones.split(',')]
-            query = query.filter(Zone.name.in_(zone_list))
-        
-        results = query.order_by(RealTimeLBMP.timestamp).all()
-        
-        # Group by zone
-        by_zone = {}
-        for r in results:
-            if r.zone_name not in by_zone:
-                by_zone[r.zone_name] = []
-            by_zone[r.zone_name].append((r.timestamp, r.lbmp))
-        
-        # Calculate rolling volatility
-        volatilities = []
-        window_delta = timedelta(hours=window_hours)
-        
-        for zone_name, prices in by_zone.items():
-            for i, (ts, price) in enumerate(prices):
-                window_start = ts - window_delta
-                window_prices = [p for t, p in prices if window_start <= t <= ts]
-                
-                if len(window_prices) >= 2:
-                    mean_price = statistics.mean(window_prices)
-                    std_dev = statistics.stdev(window_prices)
-                    volatility = (std_dev / mean_price * 100) if mean_price != 0 else 0
-                    
-                    volatilities.append({
-                        "timestamp": ts,
-                        "zone_name": zone_name,
-                        "volatility": volatility,
-                        "window_hours": window_hours,
-                        "mean_price": mean_price,
-                        "std_dev": std_dev
-                    })
-        
-        volatilities.sort(key=lambda x: x["timestamp"], reverse=True)
-        return volatilities[:limit]
-    finally:
-        db.close()
+    stmt = _zone_price_stmt(start_date, end_date, zones).order_by(RealTimeLBMP.timestamp)
+    prices = _zone_price_frame(db, stmt)
+    if prices.empty:
+        return ORJSONResponse([])
+    
+    # Rolling mean/std over [ts - window, ts] per zone, zones in first-seen order
+    prices = prices.set_index("timestamp")
+    rolling = prices.groupby("zone_name", sort=False)["lbmp"].rolling(f"{window_hours}h", closed="both")
+    windows = pd.DataFrame({
+        "mean_price": rolling.mean(),
+        "std_dev": rolling.std(),
+        "count": rolling.count()
+    }).reset_index()
+    windows = windows[windows["count"] >= 2]
+    
+    mean_price = windows["mean_price"].to_numpy()
+    std_dev = windows["std_dev"].to_numpy()
+    volatility = np.divide(std_dev, mean_price, out=np.zeros_like(std_dev), where=mean_price != 0) * 100
+    
+    # Newest first; ties keep zone order
+    order = np.argsort(-windows["timestamp"].to_numpy().astype(np.int64), kind="stable")[:limit]
+    timestamps = windows["timestamp"].dt.to_pydatetime()
+    zone_names = windows["zone_name"].to_numpy()
+    return ORJSONResponse([
+        {
+            "timestamp": timestamps[k],
+            "zone_name": zone_names[k],
+            "volatility": float(volatility[k]),
+            "window_hours": window_hours,
+            "mean_price": float(mean_price[k]),
+            "std_dev": float(std_dev[k])
+        }
+        for k in order
+    ])
 
 
-@app.get("/api/correlations", response_model=List[CorrelationResponse])
-async def get_correlations(
+@app.get("/api/correlations", responses={200: {"model": List[CorrelationResponse]}})
+@_cached_response
+def get_correlations(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
-    zones: Optional[str] = Query(None, description="Comma-separated zone names (default: all)"),
-    limit: int = Query(100, ge=1, le=500, description="Maximum zone pairs to return")
+    zones: Optional[Tuple[str, ...]] = Depends(zone_filter),
+    limit: int = Query(100, ge=1, le=500, description="Maximum zone pairs to return"),
+    db: Session = Depends(get_db)
 ):
     """Calculate zone-to-zone price correlations.
     
     Computes Pearson correlation coefficient between zone prices over the time period.
     """
-    db = next(get_db())
-    
-    try:
-        query = db.query(
-            RealTimeLBMP.timestamp,
-            Zone.name.label('zone_name'),
-            RealTimeLBMP.lbmp
-        ).join(Zone).filter(RealTimeLBMP.zone_id == Zone.id)
-        
-        if start_date:
-            query = query.filter(RealTimeLBMP.timestamp >= start_date)
-        if end_date:
-            query = query.filter(RealTimeLBMP.timestamp <= end_date)
-        if zones:
-            zone_list = [z.strip().upper() for z in zones.split(',')]
-            query = query.filter(Zone.name.in_(zone_list))
-        
-        results = query.order_by(RealTimeLBMP.timestamp).all()
-        
-        # Group by timestamp, then by zone
-        by_timestamp = {}
-        zones_set = set()
-        for r in results:
-            if r.timestamp not in by_timestamp:
-                by_timestamp[r.timestamp] = {}
-            by_timestamp[r.timestamp][r.zone_name] = r.lbmp
-            zones_set.add(r.zone_name)
-        
-        # Calculate correlations for all zone pairs
-        correlations = []
-        zones_list = sorted(zones_set)
-        
-        for i, zone1 in enumerate(zones_list):
-            for zone2 in zones_list[i+1:]:
-                prices1 = []
-                prices2 = []
-                
-                for ts in sorted(by_timestamp.keys()):
-                    if zone1 in by_timestamp[ts] and zone2 in by_timestamp[ts]:
-                        prices1.append(by_timestamp[ts][zone1])
-                        prices2.append(by_timestamp[ts][zone2])
-                
-                if len(prices1) >= 2:
-                    try:
-                        # Calculate Pearson correlation coefficient
-                        mean1 = statistics.mean(prices1)
-                        mean2 = statistics.mean(prices2)
-                        std1 = statistics.stdev(prices1) if len(prices1) > 1 else 0
-                        std2 = statistics.stdev(prices2) if len(prices2) > 1 else 0
-                        
-                        if std1 == 0 or std2 == 0:
-                            correlation = 0.0
-                        else:
-                            covariance = sum((p1 - mean1) * (p2 - mean2) for p1, p2 in zip(prices1, prices2)) / len(prices1)
-                            correlation = covariance / (std1 * std2)
-                    except:
-                        correlation = 0.0
-                    
-                    if start_date and end_date:
-                        period_start = start_date
-                        period_end = end_date
-                    else:
-                        timestamps = sorted(by_timestamp.keys())
-                        period_start = timestamps[0] if timestamps else datetime.utcnow()
-                        period_end = timestamps[-1] if timestamps else datetime.utcnow()
-                    
-                    correlations.append({
-                        "zone1": zone1,
-                        "zone2": zone2,
-                        "correlation": correlation,
-                        "sample_count": len(prices1),
-                        "period_start": period_start,
-                        "period_end": period_end
-                    })
-        
-        # Sort by absolute correlation (descending)
-        correlations.sort(key=lambda x: abs(x["correlation"]), reverse=True)
-        return correlations[:limit]
-    finally:
-        db.close()
+    prices = _zone_price_frame(db, _zone_price_stmt(start_date, end_date, zones))
+    if prices.empty:
+        return ORJSONResponse([])
+    
+    # Timestamp x zone price matrix; NaN where a zone has no price
+    prices = prices.pivot(
+        index="timestamp", columns="zone_name", values="lbmp"
+    ).sort_index(axis=1)
+    
+    # Pairwise sample counts (timestamps priced in both zones) in one product
+    present = prices.notna().to_numpy(dtype=np.int64)
+    counts = present.T @ present
+    
+    zone1_idx, zone2_idx = np.triu_indices(len(prices.columns), k=1)
+    pair_counts = counts[zone1_idx, zone2_idx]
+    keep = pair_counts >= 2
+    zone1_idx, zone2_idx, pair_counts = zone1_idx[keep], zone2_idx[keep], pair_counts[keep]
+    
+    # Pearson r over each pair's shared timestamps, scaled by (n - 1) / n:
+    # the reported figure divides the covariance by n but uses sample
+    # standard deviations. Flat series (r undefined) report 0.
+    pearson = prices.corr(min_periods=2).to_numpy()[zone1_idx, zone2_idx]
+    correlations = np.nan_to_num(pearson * (pair_counts - 1) / pair_counts)
+    
+    if start_date and end_date:
+        period_start, period_end = start_date, end_date
+    else:
+        period_start, period_end = prices.index[0].to_pydatetime(), prices.index[-1].to_pydatetime()
+    
+    # Strongest (absolute) correlations first
+    order = np.argsort(-np.abs(correlations), kind="stable")[:limit]
+    zone_names = prices.columns
+    return ORJSONResponse([
+        {
+            "zone1": zone_names[zone1_idx[k]],
+            "zone2": zone_names[zone2_idx[k]],
+            "correlation": float(correlations[k]),
+            "sample_count": int(pair_counts[k]),
+            "period_start": period_start,
+            "period_end": period_end
+        }
+        for k in order
+    ])
 
 
-@app.get("/api/trading-signals", response_model=List[TradingSignalResponse])
-async def get_trading_signals(
+@app.get("/api/trading-signals", responses={200: {"model": List[TradingSignalResponse]}})
+@_cached_response
+def get_trading_signals(
     start_date: Optional[datetime] = Query(None, description="Start date (ISO format)"),
     end_date: Optional[datetime] = Query(None, description="End date (ISO format)"),
     signal_type: Optional[str] = Query(None, description="Filter by signal type"),
     severity: Optional[str] = Query(None, description="Filter by severity: low, medium, high"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum signals to return")
+    limit: int = Query(100, ge=1, le=1000, description="Maximum signals to return"),
+    db: Session = Depends(get_db)
 ):
     """Generate trading signals based on market conditions.
     
     Rule-based signal generation from various market metrics.
     """
-    db = next(get_db())
+    signals = []
+    now = datetime.utcnow()
+    lookback = start_date if start_date else now - timedelta(hours=24)
+    lookforward = end_date if end_date else now
+    
+    # Only run the queries behind the requested signal type
+    def wanted(kind: str) -> bool:
+        return not signal_type or signal_type == kind
+    
+    # Signal 1: High RT-DA Spreads
+    spread_rows = [] if not wanted("rt_da_spread") else db.execute(_rt_da_spread_stmt().where(
+        RealTimeLBMP.timestamp >= lookback,
+        RealTimeLBMP.timestamp <= lookforward,
+        func.abs(_RT_DA_SPREAD) >= 15.0  # $15/MWh threshold
+    )).all()
+    
+    for r in spread_rows:
+        signals.append({
+            "timestamp": r.timestamp,
+            "signal_type": "rt_da_spread",
+            "severity": "high" if abs(r.spread) >= 25.0 else "medium",
+            "zone_name": r.zone_name,
+            "message": f"RT-DA spread of ${r.spread:.2f}/MWh in {r.zone_name}",
+            "value": r.spread,
+            "threshold": 15.0
+        })
     
-    try:
-        signals = []
-        now = datetime.utcnow()
-        lookback = start_date if start_date else now - timedelta(hours=24)
-        lookforward = end_date if end_date else now
-        
-        # Signal 1: High RT-DA Spreads
-        rt_da_query = db.query(
-            RealTimeLBMP.timestamp,
-            Zone.name.label('zone_name'),
-            RealTimeLBMP.lbmp.label('rt_lbmp')
-        ).join(Zone).filter(
-            RealTimeLBMP.timestamp >= lookback,
-            RealTimeLBMP.timestamp <= lookforward
-        )
-        
-        da_query = db.query(
-            DayAheadLBMP.timestamp,
-            Zone.name.label('zone_name'),
-            DayAheadLBMP.lbmp.label('da_lbmp')
-        ).join(Zone).filter(
-            DayAheadLBMP.timestamp >= lookback,
-            DayAheadLBMP.timestamp <= lookforward
-        )
-        
-        rt_data = {(r.timestamp, r.zone_name): r.rt_lbmp for r in rt_da_query.all()}
-        da_data = {(r.timestamp, r.zone_name): r.da_lbmp for r in da_query.all()}
-        
-        for (ts, zone), rt_lbmp in rt_data.items():
-            if (ts, zone) in da_data:
-                spread = rt_lbmp - da_data[(ts, zone)]
-                if abs(spread) >= 15.0:  # $15/MWh threshold
-                    signals.append({
-                        "timestamp": ts,
-                        "signal_type": "rt_da_spread",
-                        "severity": "high" if abs(spread) >= 25.0 else "medium",
-                        "zone_name": zone,
-                        "message": f"RT-DA spread of ${spread:.2f}/MWh in {zone}",
-                        "value": spread,
-                        "threshold": 15.0
-                    })
-        
-        # Signal 2: High Load Forecast Errors
-        forecast_query = db.query(
-            LoadForecast.timestamp,
-            Zone.name.label('zone_name'),
-            LoadForecast.forecast_load
-        ).join(Zone).filter(
-            LoadForecast.timestamp >= lookback,
-            LoadForecast.timestamp <= lookforward
-        )
-        
-        actual_query = db.query(
-            RealTimeLoad.timestamp,
-            Zone.name.label('zone_name'),
-            RealTimeLoad.load.label('actual_load')
-        ).join(Zone).filter(
-            RealTimeLoad.timestamp >= lookback,
-            RealTimeLoad.timestamp <= lookforward
+    # Signal 2: High Load Forecast Errors
+    error_rows = [] if not wanted("load_forecast_error") else db.execute(_load_forecast_error_stmt().where(
+        LoadForecast.timestamp >= lookback,
+        LoadForecast.timestamp <= lookforward,
+        func.abs(_LOAD_ERROR_PERCENT) >= 5.0  # 5% threshold
+    )).all()
+    
+    for r in error_rows:
+        error_pct = abs(r.error_percent)
+        signals.append({
+            "timestamp": r.timestamp,
+            "signal_type": "load_forecast_error",
+            "severity": "high" if error_pct >= 10.0 else "medium",
+            "zone_name": r.zone_name,
+            "message": f"Load forecast error of {error_pct:.1f}% in {r.zone_name}",
+            "value": error_pct,
+            "threshold": 5.0
+        })
+    
+    # Signal 3: Low Reserve Margins
+    margins = _load_generation_stmt(lookback, lookforward)
+    total_load = margins.selected_columns.total_load
+    total_gen = margins.selected_columns.total_generation
+    reserve_pct = (total_gen - total_load) / func.nullif(total_load, 0) * 100
+    margin_rows = [] if not wanted("low_reserve_margin") else db.execute(
+        margins.with_only_columns(margins.selected_columns.timestamp, reserve_pct).where(
+            total_load != 0,
+            total_gen != 0,
+            reserve_pct < 10.0  # 10% threshold
         )
-        
-        forecast_data = {(r.timestamp, r.zone_name): r.forecast_load for r in forecast_query.all()}
-        actual_data = {(r.timestamp, r.zone_name): r.actual_load for r in actual_query.all()}
-        
-        for (ts, zone), forecast_load in forecast_data.items():
-            if (ts, zone) in actual_data:
-                error_pct = abs((actual_data[(ts, zone)] - forecast_load) / forecast_load * 100) if forecast_load != 0 else 0
-                if error_pct >= 5.0:  # 5% threshold
-                    signals.append({
-                        "timestamp": ts,
-                        "signal_type": "load_forecast_error",
-                        "severity": "high" if error_pct >= 10.0 else "medium",
-                        "zone_name": zone,
-                        "message": f"Load forecast error of {error_pct:.1f}% in {zone}",
-                        "value": error_pct,
-                        "threshold": 5.0
-                    })
-        
-        # Signal 3: Low Reserve Margins
-        load_query = db.query(
-            RealTimeLoad.timestamp,
-            func.sum(RealTimeLoad.load).label('total_load')
-        ).filter(
-            RealTimeLoad.timestamp >= lookback,
-            RealTimeLoad.timestamp <= lookforward
-        ).group_by(RealTimeLoad.timestamp)
-        
-        gen_query = db.query(
-            FuelMix.timestamp,
-            func.sum(FuelMix.generation_mw).label('total_generation')
-        ).filter(
-            FuelMix.timestamp >= lookback,
-            FuelMix.timestamp <= lookforward
-        ).group_by(FuelMix.timestamp)
-        
-        load_data = {r.timestamp: r.total_load for r in load_query.all()}
-        gen_data = {r.timestamp: r.total_generation for r in gen_query.all()}
-        
-        for ts in set(load_data.keys()) & set(gen_data.keys()):
-            total_load = load_data[ts]
-            total_gen = gen_data[ts]
-            if total_load and total_gen:
-                reserve_pct = (total_gen - total_load) / total_load * 100
-                if reserve_pct < 10.0:  # 10% threshold
-                    signals.append({
-                        "timestamp": ts,
-                        "signal_type": "low_reserve_margin",
-                        "severity": "high" if reserve_pct < 5.0 else "medium",
-                        "zone_name": None,
-                        "message": f"Low reserve margin of {reserve_pct:.1f}%",
-                        "value": reserve_pct,
-                        "threshold": 10.0
-                    })
-        
-        # Filter and sort
-        if signal_type:
-            signals = [s for s in signals if s["signal_type"] == signal_type]
-        if severity:
-            signals = [s for s in signals if s["severity"] == severity.lower()]
-        
-        signals.sort(key=lambda x: x["timestamp"], reverse=True)
-        return signals[:limit]
-    finally:
-        db.close()
+    ).all()
+    
+    for ts, pct in margin_rows:
+        signals.append({
+            "timestamp": ts,
+            "signal_type": "low_reserve_margin",
+            "severity": "high" if pct < 5.0 else "medium",
+            "zone_name": None,
+            "message": f"Low reserve margin of {pct:.1f}%",
+            "value": pct,
+            "threshold": 10.0
+        })
+    
+    # Filter and sort
+    if signal_type:
+        signals = [s for s in signals if s["signal_type"] == signal_type]
+    if severity:
+        signals = [s for s in signals if s["severity"] == severity.lower()]
+    
+    # Newest `limit` signals; ties keep generation order
+    return ORJSONResponse(heapq.nlargest(limit, signals, key=lambda x: x["timestamp"]))
+
+
+# Generated by scripts/generate_nyiso_zones.py or scripts/fetch_nyiso_zones.py
+NYISO_ZONES_GEOJSON = Path(__file__).parent.parent / "static" / "nyiso_zones.geojson"
+
+
+def _load_nyiso_zones() -> Optional[Tuple[bytes, str]]:
+    """GeoJSON bytes and their ETag, or None if the file hasn't been generated."""
+    try:
+        body = NYISO_ZONES_GEOJSON.read_bytes()
+    except FileNotFoundError:
+        return None
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
 
 
 @app.get("/api/maps/nyiso-zones")
-async def get_nyiso_zones():
+async def get_nyiso_zones(request: Request):
     """
     Get NYISO zone boundaries as GeoJSON.
     Returns zone polygons generated from zone definitions.
     """
-    try:
-        # Path to static GeoJSON file
-        script_dir = Path(__file__).parent
-        project_root = script_dir.parent
-        geojson_file = project_root / "static" / "nyiso_zones.geojson"
-        
-        # If file doesn't exist, return helpful error
-        if not geojson_file.exists():
-            raise HTTPException(
-                status_code=404,
-                detail="GeoJSON file not found. Please run 'python3 scripts/generate_nyiso_zones.py' or 'python3 scripts/fetch_nyiso_zones.py' to generate the zone boundaries file."
-            )
-        
-        # Read and return the cached file
-        with open(geojson_file, 'r') as f:
-            geojson_data = json.load(f)
-        
-        return JSONResponse(
-            content=geojson_data,
-            headers={
-                "Content-Type": "application/geo+json",
-                "Cache-Control": "no-cache, no-store, must-revalidate",  # Disable caching to ensure fresh polygons
-                "Pragma": "no-cache",
-                "Expires": "0"
-            }
-        )
-    except FileNotFoundError:
+    zones = _file_cache.get_or_set("nyiso-zones", _load_nyiso_zones)
+    
+    # If file doesn't exist, return helpful error
+    if zones is None:
         raise HTTPException(
             status_code=404,
-            detail="NYISO zones GeoJSON file not found. Please run scripts/fetch_nyiso_zones.py first."
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error loading NYISO zones: {str(e)}"
+            detail="GeoJSON file not found. Please run 'python3 scripts/generate_nyiso_zones.py' or 'python3 scripts/fetch_nyiso_zones.py' to generate the zone boundaries file."
         )
+    
+    body, etag = zones
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/geo+json", headers=headers)
 
 
 @app.get("/ping")
@@ -2149,29 +2227,24 @@ async def vite_svg():
     raise HTTPException(status_code=404, detail="vite.svg not found")
 
 
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for Railway/deployment monitoring."""
-    # Always return 200 - Railway needs this to know the app is running
-    # Even if database fails, the app can still serve static files
+def _check_database() -> dict:
+    """Health payload for /health: a zero-row round trip to the database."""
     try:
-        from database.schema import get_session
         db = get_session()
         try:
-            # Simple query to test database connection
-            db.query(Zone).limit(1).all()
-            db.close()
+            db.execute(text("SELECT 1"))
             return {"status": "healthy", "database": "connected"}
         except Exception as db_error:
-            db.close()
             return {
                 "status": "degraded", 
                 "database": "disconnected",
                 "error": str(db_error),
                 "message": "API is running but database connection failed"
             }
+        finally:
+            db.close()
     except Exception as e:
-        # Even if we can't import or create a session, return 200
+        # Even if we can't create a session, return 200
         # This ensures Railway sees the app as running
         return {
             "status": "degraded",
@@ -2181,41 +2254,46 @@ async def health_check():
         }
 
 
+@app.get("/health")
+def health_check():
+    """Health check endpoint for Railway/deployment monitoring."""
+    # Always return 200 - Railway needs this to know the app is running
+    # Even if database fails, the app can still serve static files.
+    # Bursts of probes share one database check.
+    return _health_cache.get_or_set("health", _check_database)
+
+
 @app.get("/api/analytics/view-count")
-async def get_view_count():
+def get_view_count(db: Session = Depends(get_db)):
     """Get simple total view count - all time and today."""
     try:
         from sqlalchemy import func
         from datetime import datetime, date
         
-        db = next(get_db())
-        try:
-            # Total page views (all time)
-            total_views = db.query(func.count(PageView.id)).scalar() or 0
-            
-            # Today's page views
-            today_start = datetime.combine(date.today(), datetime.min.time())
-            today_views = db.query(func.count(PageView.id)).filter(
-                PageView.timestamp >= today_start
-            ).scalar() or 0
-            
-            # Unique visitors (all time) - count distinct IP hashes
-            unique_visitors = db.query(func.count(func.distinct(PageView.ip_hash))).scalar() or 0
-            
-            # Unique visitors today
-            unique_visitors_today = db.query(func.count(func.distinct(PageView.ip_hash))).filter(
-                PageView.timestamp >= today_start
-            ).scalar() or 0
-            
-            return {
-                "total_views": total_views,
-                "today_views": today_views,
-                "unique_visitors": unique_visitors,
-                "unique_visitors_today": unique_visitors_today,
-                "last_updated": datetime.utcnow().isoformat()
-            }
-        finally:
-            db.close()
+        # Total page views (all time)
+        total_views = db.query(func.count(PageView.id)).scalar() or 0
+        
+        # Today's page views
+        today_start = datetime.combine(date.today(), datetime.min.time())
+        today_views = db.query(func.count(PageView.id)).filter(
+            PageView.timestamp >= today_start
+        ).scalar() or 0
+        
+        # Unique visitors (all time) - count distinct IP hashes
+        unique_visitors = db.query(func.count(func.distinct(PageView.ip_hash))).scalar() or 0
+        
+        # Unique visitors today
+        unique_visitors_today = db.query(func.count(func.distinct(PageView.ip_hash))).filter(
+            PageView.timestamp >= today_start
+        ).scalar() or 0
+        
+        return {
+            "total_views": total_views,
+            "today_views": today_views,
+            "unique_visitors": unique_visitors,
+            "unique_visitors_today": unique_visitors_today,
+            "last_updated": datetime.utcnow().isoformat()
+        }
     except Exception as e:
         return {
             "error": str(e),
@@ -2225,39 +2303,34 @@ async def get_view_count():
 
 
 @app.get("/api/debug/db-stats")
-async def get_db_stats():
+def get_db_stats(db: Session = Depends(get_db)):
     """Debug endpoint to check database status and table counts."""
     try:
-        from sqlalchemy import text
-        db = next(get_db())
-        try:
-            # Get list of tables
-            tables = db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()
-            table_names = [t[0] for t in tables]
-            
-            stats = {}
-            total_rows = 0
-            
-            for table in table_names:
-                try:
-                    count = db.execute(text(f"SELECT count(*) FROM {table}")).scalar()
-                    stats[table] = count
-                    total_rows += count
-                except Exception as table_error:
-                    stats[table] = f"Error: {str(table_error)}"
-            
-            import os
-            db_url = os.getenv('DATABASE_URL', 'not set')
-            
-            return {
-                "status": "connected",
-                "database_url": db_url,
-                "total_tables": len(table_names),
-                "total_rows": total_rows,
-                "tables": stats
-            }
-        finally:
-            db.close()
+        # Get list of tables
+        tables = db.execute(text("SELECT name FROM sqlite_master WHERE type='table'")).fetchall()
+        table_names = [t[0] for t in tables]
+        
+        stats = {}
+        total_rows = 0
+        
+        for table in table_names:
+            try:
+                count = db.execute(text(f"SELECT count(*) FROM {table}")).scalar()
+                stats[table] = count
+                total_rows += count
+            except Exception as table_error:
+                stats[table] = f"Error: {str(table_error)}"
+        
+        import os
+        db_url = os.getenv('DATABASE_URL', 'not set')
+        
+        return {
+            "status": "connected",
+            "database_url": db_url,
+            "total_tables": len(table_names),
+            "total_rows": total_rows,
+            "tables": stats
+        }
     except Exception as e:
         return {
             "status": "error",
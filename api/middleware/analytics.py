@@ -4,13 +4,162 @@ Privacy-first: IP addresses are hashed, no personal data collected.
 """
 from fastapi import Request
 from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy import insert
+import atexit
+import functools
 import hashlib
+import queue
+import secrets
+import threading
+import time
 from datetime import datetime, timedelta
+from typing import Dict, List
 from database.schema import get_session, PageView, VisitorSession
 import logging
 
 logger = logging.getLogger(__name__)
 
+_STOP = object()
+
+# Skip API endpoints, static files, and health checks
+_SKIP_PATH_PREFIXES = (
+    '/api/',
+    '/static/',
+    '/health',
+    '/docs',
+    '/redoc',
+    '/openapi.json',
+    '/favicon.ico',
+)
+
+
+# Unsalted, so the same for every middleware instance
+_UNKNOWN_IP_HASH = hashlib.sha256(b'unknown').hexdigest()[:32]
+
+
+@functools.lru_cache(maxsize=8192)
+def _hash_ip_cached(ip: str, secret_bytes: bytes) -> str:
+    """Salted SHA-256 of an IP, truncated to 32 hex chars; clients repeat, so memoized."""
+    digest = hashlib.sha256(ip.encode())
+    digest.update(secret_bytes)
+    return digest.hexdigest()[:32]
+
+
+class PageViewWriter:
+    """Background writer that records page views in batches.
+    
+    Requests only enqueue an event; a daemon thread drains the queue and
+    writes up to ``batch_size`` events (or whatever arrived within
+    ``flush_interval`` seconds) in one transaction. Remaining events are
+    flushed at interpreter exit.
+    """
+    
+    def __init__(self, session_timeout: timedelta, batch_size: int = 500,
+                 flush_interval: float = 2.0, max_pending: int = 10000):
+        self.session_timeout = session_timeout
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, name="page-view-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+    
+    def submit(self, event: Dict) -> None:
+        """Queue a page view without blocking; dropped if the writer is backed up."""
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            logger.warning("Analytics queue full, dropping page view")
+    
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush queued page views and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+    
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = []
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while item is not _STOP:
+                batch.append(item)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self.batch_size or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            stopping = item is _STOP
+            if batch:
+                self._write(batch)
+    
+    def _write(self, events: List[Dict]) -> None:
+        """Apply a batch of page views to visitor_sessions and page_views."""
+        db = get_session()
+        try:
+            # One lookup each for the batch's sessions and returning visitors
+            session_ids = {e['session_id'] for e in events}
+            sessions = {
+                s.session_id: s
+                for s in db.query(VisitorSession).filter(VisitorSession.session_id.in_(session_ids))
+            }
+            ip_hashes = {e['ip_hash'] for e in events}
+            known_ips = {
+                ip_hash for (ip_hash,) in db.query(VisitorSession.ip_hash)
+                .filter(VisitorSession.ip_hash.in_(ip_hashes)).distinct()
+            }
+            
+            page_views = []
+            created_at = datetime.utcnow()
+            for event in events:
+                now = event['timestamp']
+                session = sessions.get(event['session_id'])
+                
+                if session and now - session.last_visit <= self.session_timeout:
+                    # Update existing session
+                    session.last_visit = now
+                    session.page_count += 1
+                else:
+                    # New or expired session (session_id is unique, so an
+                    # expired one is restarted in place)
+                    if not session:
+                        session = VisitorSession(session_id=event['session_id'])
+                        sessions[event['session_id']] = session
+                        db.add(session)
+                    session.ip_hash = event['ip_hash']
+                    session.user_agent = event['user_agent']
+                    session.country = event['country']
+                    session.first_visit = now
+                    session.last_visit = now
+                    session.page_count = 1
+                    # Returning visitor: same IP hash seen in an earlier session
+                    session.is_returning = event['ip_hash'] in known_ips
+                    known_ips.add(event['ip_hash'])
+                
+                page_views.append({
+                    'session_id': event['session_id'],
+                    'ip_hash': event['ip_hash'],
+                    'path': event['path'],
+                    'referrer': event['referrer'],
+                    'user_agent': event['user_agent'],
+                    'country': session.country,
+                    'is_unique': session.page_count == 1,
+                    'timestamp': now,
+                    'created_at': created_at
+                })
+            
+            # One executemany; SQLAlchemy batches it into multi-row INSERTs
+            db.execute(insert(PageView), page_views)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Analytics error: {e}", exc_info=True)
+        finally:
+            db.close()
+
 
 class AnalyticsMiddleware(BaseHTTPMiddleware):
     """Middleware to track page views and visitor analytics."""
@@ -18,23 +167,22 @@ class AnalyticsMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, secret_key: str = "default-secret-key-change-in-production"):
         super().__init__(app)
         self.secret_key = secret_key
+        self._secret_bytes = secret_key.encode()
         self.session_timeout = timedelta(minutes=30)
+        self.writer = PageViewWriter(self.session_timeout)
     
     def _hash_ip(self, ip: str) -> str:
         """Hash IP address for privacy."""
         if not ip or ip == 'unknown':
-            return hashlib.sha256(b'unknown').hexdigest()[:32]
-        return hashlib.sha256(f"{ip}{self.secret_key}".encode()).hexdigest()[:32]
+            return _UNKNOWN_IP_HASH
+        return _hash_ip_cached(ip, self._secret_bytes)
     
     def _get_session_id(self, request: Request) -> str:
         """Get or create session ID from cookie or generate new."""
         session_id = request.cookies.get('session_id')
         if not session_id:
-            # Generate new session ID
-            client_host = request.client.host if request.client else 'unknown'
-            session_id = hashlib.sha256(
-                f"{client_host}{datetime.utcnow().isoformat()}{self.secret_key}".encode()
-            ).hexdigest()[:32]
+            # Generate new session ID (random; only needs to be unique)
+            session_id = secrets.token_hex(16)
         return session_id
     
     def _get_country_from_ip(self, ip: str) -> str:
@@ -47,17 +195,7 @@ class AnalyticsMiddleware(BaseHTTPMiddleware):
     
     def _should_track(self, path: str) -> bool:
         """Determine if this path should be tracked."""
-        # Skip API endpoints, static files, and health checks
-        skip_paths = [
-            '/api/',
-            '/static/',
-            '/health',
-            '/docs',
-            '/redoc',
-            '/openapi.json',
-            '/favicon.ico',
-        ]
-        return not any(path.startswith(skip) for skip in skip_paths)
+        return not path.startswith(_SKIP_PATH_PREFIXES)
     
     async def dispatch(self, request: Request, call_next):
         # Skip tracking for API endpoints and static files
@@ -77,67 +215,16 @@ class AnalyticsMiddleware(BaseHTTPMiddleware):
         if referrer and len(referrer) > 500:
             referrer = referrer[:500]
         
-        # Track page view
-        db = get_session()
-        try:
-            # Check if session exists
-            session = db.query(VisitorSession).filter(
-                VisitorSession.session_id == session_id
-            ).first()
-            
-            now = datetime.utcnow()
-            
-            if session:
-                # Update existing session
-                time_since_last = now - session.last_visit
-                if time_since_last > self.session_timeout:
-                    # Session expired - create new session
-                    session = None
-                else:
-                    session.last_visit = now
-                    session.page_count += 1
-            
-            if not session:
-                # Check if returning visitor (same IP hash, different session)
-                existing_visitor = db.query(VisitorSession).filter(
-                    VisitorSession.ip_hash == ip_hash
-                ).order_by(VisitorSession.last_visit.desc()).first()
-                
-                is_returning = existing_visitor is not None
-                
-                # Create new session
-                session = VisitorSession(
-                    session_id=session_id,
-                    ip_hash=ip_hash,
-                    user_agent=user_agent[:500] if user_agent else None,
-                    country=self._get_country_from_ip(ip),
-                    first_visit=now,
-                    last_visit=now,
-                    page_count=1,
-                    is_returning=is_returning
-                )
-                db.add(session)
-            
-            # Create page view
-            page_view = PageView(
-                session_id=session_id,
-                ip_hash=ip_hash,
-                path=path[:500],
-                referrer=referrer if referrer else None,
-                user_agent=user_agent[:500] if user_agent else None,
-                country=session.country,
-                is_unique=(session.page_count == 1),
-                timestamp=now
-            )
-            db.add(page_view)
-            db.commit()
-            
-        except Exception as e:
-            db.rollback()
-            # Log error but don't break request
-            logger.error(f"Analytics error: {e}", exc_info=True)
-        finally:
-            db.close()
+        # Track page view off the request path
+        self.writer.submit({
+            'session_id': session_id,
+            'ip_hash': ip_hash,
+            'path': path[:500],
+            'referrer': referrer if referrer else None,
+            'user_agent': user_agent[:500] if user_agent else None,
+            'country': self._get_country_from_ip(ip),
+            'timestamp': datetime.utcnow()
+        })
         
         # Process request
         response = await call_next(request)
@@ -3,9 +3,10 @@ Configuration parser for NYISO URL patterns.
 Reads from URL_Instructions.txt and URL_Lookup.txt.
 """
 import csv
+import functools
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
@@ -21,23 +22,35 @@ class DataSourceConfig:
     category: Optional[str] = None
     update_frequency: Optional[str] = None
     description: Optional[str] = None
+    # Templates pre-split around their date placeholder (see __post_init__)
+    _csv_url_parts: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _zip_url_parts: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _filename_parts: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._csv_url_parts = tuple(self.direct_csv_url_template.split('{YYYYMMDD}'))
+        self._zip_url_parts = tuple(self.archive_zip_url_template.split('{YYYYMM01}'))
+        self._filename_parts = tuple(self.filename_pattern.split('{YYYYMMDD}'))
     
     def build_url(self, date: datetime, use_archive: bool = False) -> str:
         """Build URL for a specific date."""
-        date_str = date.strftime('%Y%m%d')
-        month_str = date.strftime('%Y%m01')  # First day of month for archives
-        
         if use_archive:
-            url = self.archive_zip_url_template.replace('{YYYYMM01}', month_str)
-        else:
-            url = self.direct_csv_url_template.replace('{YYYYMMDD}', date_str)
-        
-        return url
+            # First day of month for archives
+            return f"{date.year:04d}{date.month:02d}01".join(self._zip_url_parts)
+        return f"{date.year:04d}{date.month:02d}{date.day:02d}".join(self._csv_url_parts)
     
     def get_filename_pattern(self, date: datetime) -> str:
         """Get expected filename pattern for a date."""
-        date_str = date.strftime('%Y%m%d')
-        return self.filename_pattern.replace('{YYYYMMDD}', date_str)
+        return f"{date.year:04d}{date.month:02d}{date.day:02d}".join(self._filename_parts)
+
+
+@functools.lru_cache(maxsize=None)
+def _read_csv(path: str) -> Tuple[Dict[str, int], Tuple[List[str], ...]]:
+    """Parse a config CSV into (column name -> index, rows); cached since the files are static."""
+    with open(path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        header = {name: i for i, name in enumerate(next(reader, []))}
+        return header, tuple(row for row in reader if row)
 
 
 class URLConfigLoader:
@@ -54,28 +67,41 @@ class URLConfigLoader:
     def _load_configs(self):
         """Load configurations from both files."""
         # Load from URL_Instructions.txt (primary source with URL patterns)
-        with open(self.instructions_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                config = DataSourceConfig(
-                    data_type=row['Data Type'],
-                    report_code=row['Report Code'],
-                    dataset_name=row['Dataset Name'],
-                    filename_pattern=row['Filename Pattern'],
-                    direct_csv_url_template=row['Direct CSV URL'],
-                    archive_zip_url_template=row['Archive ZIP URL']
-                )
-                self.configs[config.report_code] = config
+        header, rows = _read_csv(str(self.instructions_file))
+        data_type, report_code, dataset_name, filename_pattern, direct_csv_url, archive_zip_url = (
+            header[name] for name in (
+                'Data Type', 'Report Code', 'Dataset Name',
+                'Filename Pattern', 'Direct CSV URL', 'Archive ZIP URL'
+            )
+        )
+        for row in rows:
+            config = DataSourceConfig(
+                data_type=row[data_type],
+                report_code=row[report_code],
+                dataset_name=row[dataset_name],
+                filename_pattern=row[filename_pattern],
+                direct_csv_url_template=row[direct_csv_url],
+                archive_zip_url_template=row[archive_zip_url]
+            )
+            self.configs[config.report_code] = config
         
         # Enrich with metadata from URL_Lookup.txt
-        with open(self.lookup_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                report_code = row['Report Code']
-                if report_code in self.configs:
-                    self.configs[report_code].category = row.get('Category', '')
-                    self.configs[report_code].update_frequency = row.get('Update Frequency', '')
-                    self.configs[report_code].description = row.get('Description', '')
+        header, rows = _read_csv(str(self.lookup_file))
+        report_code = header['Report Code']
+        
+        def column(row: List[str], name: str) -> Optional[str]:
+            # Missing column -> '', short row -> None (as csv.DictReader gave)
+            i = header.get(name)
+            if i is None:
+                return ''
+            return row[i] if i < len(row) else None
+        
+        for row in rows:
+            config = self.configs.get(row[report_code])
+            if config:
+                config.category = column(row, 'Category')
+                config.update_frequency = column(row, 'Update Frequency')
+                config.description = column(row, 'Description')
     
     def get_config(self, report_code: str) -> Optional[DataSourceConfig]:
         """Get configuration for a report code."""
@@ -86,30 +86,30 @@ WEATHER_LOCATIONS = {
 }
 
 
+# Per-zone tuples so callers can't mutate the shared configuration
+_LOCATIONS_BY_ZONE = {zone_code: tuple(locations) for zone_code, locations in WEATHER_LOCATIONS.items()}
+
+# Flattened once at import; WEATHER_LOCATIONS is static configuration
+_ALL_LOCATIONS = tuple(
+    {'zone_code': zone_code, 'name': loc['name'], 'lat': loc['lat'], 'lon': loc['lon']}
+    for zone_code, locations in WEATHER_LOCATIONS.items()
+    for loc in locations
+)
+
+# First zone listing a location name wins, matching the old linear search
+_ZONE_BY_LOCATION = {loc['name']: loc['zone_code'] for loc in reversed(_ALL_LOCATIONS)}
+
+
 def get_locations_for_zone(zone_code: str):
-    """Returns the list of weather monitoring locations for a given NYISO zone."""
-    return WEATHER_LOCATIONS.get(zone_code, [])
+    """Returns the weather monitoring locations for a given NYISO zone (read-only tuple)."""
+    return _LOCATIONS_BY_ZONE.get(zone_code, ())
 
 
 def get_all_locations():
     """Returns all weather locations across all zones."""
-    all_locations = []
-    for zone_code, locations in WEATHER_LOCATIONS.items():
-        for loc in locations:
-            all_locations.append({
-                'zone_code': zone_code,
-                'name': loc['name'],
-                'lat': loc['lat'],
-                'lon': loc['lon']
-            })
-    return all_locations
+    return [dict(loc) for loc in _ALL_LOCATIONS]
 
 
 def get_zone_for_location(location_name: str):
     """Returns the zone code for a given location name."""
-    for zone_code, locations in WEATHER_LOCATIONS.items():
-        for loc in locations:
-            if loc['name'] == location_name:
-                return zone_code
-    return None
-
+    return _ZONE_BY_LOCATION.get(location_name)
@@ -5,7 +5,7 @@ Implements 14-day data retention policy.
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, Tuple
-from sqlalchemy import and_, func
+from sqlalchemy import and_, delete, func
 from sqlalchemy.orm import Session
 
 from database.schema import (
@@ -15,11 +15,19 @@ from database.schema import (
     ExternalRTOPrice, ATC_TTC, Outage,
     WeatherForecast, FuelMix,
     ScrapingJob, ScrapingLog,
-    PageView, VisitorSession
+    PageView, PageViewDaily, PageViewDailyVisitor, VisitorSession
 )
 
 logger = logging.getLogger(__name__)
 
+# Tables pruned on their timestamp column alone
+TIMESERIES_TABLES = (
+    RealTimeLBMP, DayAheadLBMP, TimeWeightedLBMP,
+    RealTimeLoad, LoadForecast, InterfaceFlow,
+    AncillaryService, MarketAdvisory, Constraint,
+    ExternalRTOPrice, ATC_TTC, Outage, FuelMix
+)
+
 
 class DataCleanup:
     """Handles cleanup of old data based on retention policy."""
@@ -48,19 +56,8 @@ class DataCleanup:
         logger.info(f"Starting data cleanup - removing data older than {self.retention_days} days (before {self.cutoff_date})")
         
         # Time-series data tables (use timestamp column)
-        results.update(self._cleanup_timeseries_table(RealTimeLBMP, 'realtime_lbmp'))
-        results.update(self._cleanup_timeseries_table(DayAheadLBMP, 'dayahead_lbmp'))
-        results.update(self._cleanup_timeseries_table(TimeWeightedLBMP, 'timeweighted_lbmp'))
-        results.update(self._cleanup_timeseries_table(RealTimeLoad, 'realtime_load'))
-        results.update(self._cleanup_timeseries_table(LoadForecast, 'load_forecast'))
-        results.update(self._cleanup_timeseries_table(InterfaceFlow, 'interface_flows'))
-        results.update(self._cleanup_timeseries_table(AncillaryService, 'ancillary_services'))
-        results.update(self._cleanup_timeseries_table(MarketAdvisory, 'market_advisories'))
-        results.update(self._cleanup_timeseries_table(Constraint, 'constraints'))
-        results.update(self._cleanup_timeseries_table(ExternalRTOPrice, 'external_rto_prices'))
-        results.update(self._cleanup_timeseries_table(ATC_TTC, 'atc_ttc'))
-        results.update(self._cleanup_timeseries_table(Outage, 'outages'))
-        results.update(self._cleanup_timeseries_table(FuelMix, 'fuel_mix'))
+        for model_class in TIMESERIES_TABLES:
+            results.update(self._cleanup_timeseries_table(model_class, model_class.__tablename__))
         
         # Weather forecast (use timestamp, but also check forecast_time for older forecasts)
         results.update(self._cleanup_weather_forecast())
@@ -91,22 +88,15 @@ class DataCleanup:
             Dictionary with deletion count
         """
         try:
-            # Count records to be deleted
-            count_query = self.session.query(func.count(model_class.id)).filter(
-                model_class.timestamp < self.cutoff_date
-            )
-            count = count_query.scalar() or 0
-            
-            if count > 0:
-                # Delete old records
-                deleted = self.session.query(model_class).filter(
-                    model_class.timestamp < self.cutoff_date
-                ).delete(synchronize_session=False)
-                
+            # One DELETE per table; its rowcount replaces a separate COUNT(*) pass
+            deleted = self.session.execute(
+                delete(model_class).where(model_class.timestamp < self.cutoff_date),
+                execution_options={'synchronize_session': False}
+            ).rowcount
+            
+            if deleted > 0:
                 logger.info(f"Deleted {deleted} records from {table_name} (older than {self.retention_days} days)")
-                return {table_name: deleted}
-            else:
-                return {table_name: 0}
+            return {table_name: deleted}
                 
         except Exception as e:
             logger.error(f"Error cleaning up {table_name}: {str(e)}")
@@ -189,14 +179,30 @@ class DataCleanup:
         results = {}
         
         try:
-            # Clean up page views
+            # Clean up page views (by the indexed timestamp; created_at
+            # trails it by at most the analytics writer's flush interval)
             page_views_deleted = self.session.query(PageView).filter(
-                PageView.created_at < self.cutoff_date
+                PageView.timestamp < self.cutoff_date
             ).delete(synchronize_session=False)
             
             logger.info(f"Deleted {page_views_deleted} records from page_views (older than {self.retention_days} days)")
             results['page_views'] = page_views_deleted
             
+            # Keep the daily rollup in step: drop days that end before the cutoff
+            rollup_deleted = self.session.query(PageViewDaily).filter(
+                PageViewDaily.day < self.cutoff_date.date()
+            ).delete(synchronize_session=False)
+            
+            logger.info(f"Deleted {rollup_deleted} records from page_view_daily (older than {self.retention_days} days)")
+            results['page_view_daily'] = rollup_deleted
+            
+            visitors_deleted = self.session.query(PageViewDailyVisitor).filter(
+                PageViewDailyVisitor.day < self.cutoff_date.date()
+            ).delete(synchronize_session=False)
+            
+            logger.info(f"Deleted {visitors_deleted} records from page_view_daily_visitors (older than {self.retention_days} days)")
+            results['page_view_daily_visitors'] = visitors_deleted
+            
             # Clean up visitor sessions (use last_visit)
             sessions_deleted = self.session.query(VisitorSession).filter(
                 VisitorSession.last_visit < self.cutoff_date
@@ -208,6 +214,8 @@ class DataCleanup:
         except Exception as e:
             logger.error(f"Error cleaning up analytics data: {str(e)}")
             results['page_views'] = 0
+            results['page_view_daily'] = 0
+            results['page_view_daily_visitors'] = 0
             results['visitor_sessions'] = 0
         
         return results
@@ -0,0 +1,91 @@
+"""
+Rollup tables for analytics queries.
+Pre-aggregates complete days of page views so summaries scan a few rows per
+day instead of every raw page view.
+"""
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Optional
+
+from sqlalchemy import func, insert, literal, select
+from sqlalchemy.orm import Session
+
+from database.schema import PageView, PageViewDaily, PageViewDailyVisitor
+
+logger = logging.getLogger(__name__)
+
+
+def page_view_rollup_end(session: Session) -> Optional[date]:
+    """
+    First day not yet covered by page_view_daily.
+
+    Returns:
+        The day after the latest rolled-up day, or None if the rollup is empty
+    """
+    last_day = session.query(func.max(PageViewDaily.day)).scalar()
+    return last_day + timedelta(days=1) if last_day else None
+
+
+def refresh_page_view_daily(session: Session) -> int:
+    """
+    Roll up every complete UTC day of page views not yet in page_view_daily
+    (view counts) and page_view_daily_visitors (distinct IP hashes).
+
+    Days are rebuilt one at a time (delete + INSERT ... SELECT), so re-running
+    after a failure is safe. The current day is never rolled up; summary
+    queries read it from page_views directly.
+
+    Args:
+        session: Database session (caller commits)
+
+    Returns:
+        Number of days rolled up
+    """
+    today = datetime.utcnow().date()
+    day = page_view_rollup_end(session)
+    if day is None:
+        first_view = session.query(func.min(PageView.timestamp)).scalar()
+        if first_view is None:
+            return 0
+        day = first_view.date()
+
+    rolled = 0
+    while day < today:
+        day_start = datetime.combine(day, time.min)
+        day_end = day_start + timedelta(days=1)
+
+        session.query(PageViewDaily).filter(PageViewDaily.day == day).delete(synchronize_session=False)
+        session.query(PageViewDailyVisitor).filter(PageViewDailyVisitor.day == day).delete(synchronize_session=False)
+        session.execute(
+            insert(PageViewDaily).from_select(
+                ['day', 'path', 'referrer', 'country', 'views'],
+                select(
+                    literal(day, PageViewDaily.day.type),
+                    PageView.path,
+                    PageView.referrer,
+                    PageView.country,
+                    func.count(PageView.id)
+                ).where(
+                    PageView.timestamp >= day_start,
+                    PageView.timestamp < day_end
+                ).group_by(PageView.path, PageView.referrer, PageView.country)
+            )
+        )
+        session.execute(
+            insert(PageViewDailyVisitor).from_select(
+                ['day', 'ip_hash'],
+                select(
+                    literal(day, PageViewDailyVisitor.day.type),
+                    PageView.ip_hash
+                ).where(
+                    PageView.timestamp >= day_start,
+                    PageView.timestamp < day_end
+                ).distinct()
+            )
+        )
+        rolled += 1
+        day += timedelta(days=1)
+
+    if rolled:
+        logger.info(f"Rolled up {rolled} day(s) of page views into page_view_daily")
+    return rolled
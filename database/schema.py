@@ -3,10 +3,11 @@ Database schema for NYISO data pipeline.
 Supports multiple data types with flexible time-series storage.
 """
 from sqlalchemy import (
-    create_engine, Column, Integer, String, Float, DateTime, 
-    Boolean, Text, ForeignKey, Index, UniqueConstraint
+    create_engine, Column, Integer, String, Float, DateTime, Date,
+    Boolean, Text, ForeignKey, Index, UniqueConstraint, event, inspect, text
 )
 import hashlib
+import threading
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from datetime import datetime
@@ -79,6 +80,8 @@ class ScrapingLog(Base):
     
     __table_args__ = (
         Index('idx_log_job_created', 'job_id', 'created_at'),
+        # Retention cleanup deletes by created_at alone
+        Index('idx_log_created', 'created_at'),
     )
 
 
@@ -117,7 +120,7 @@ class RealTimeLBMP(Base):
     __tablename__ = 'realtime_lbmp'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     zone_id = Column(Integer, ForeignKey('zones.id'), nullable=False)
     ptid = Column(Integer)
     lbmp = Column(Float, nullable=False)
@@ -129,8 +132,10 @@ class RealTimeLBMP(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'zone_id', name='uq_realtime_lbmp'),
-        Index('idx_realtime_lbmp_timestamp', 'timestamp'),
-        Index('idx_realtime_lbmp_zone', 'zone_id'),
+        Index('idx_realtime_lbmp_zone_timestamp', zone_id, timestamp.desc(), postgresql_include=['lbmp']),
+        # Index-only scans for range + (timestamp, zone_id) joins; SQLite uses uq_realtime_lbmp
+        Index('idx_realtime_lbmp_timestamp_zone', timestamp, zone_id,
+              postgresql_include=['lbmp']).ddl_if(dialect='postgresql'),
     )
 
 
@@ -139,7 +144,7 @@ class DayAheadLBMP(Base):
     __tablename__ = 'dayahead_lbmp'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     zone_id = Column(Integer, ForeignKey('zones.id'), nullable=False)
     ptid = Column(Integer)
     lbmp = Column(Float, nullable=False)
@@ -151,8 +156,9 @@ class DayAheadLBMP(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'zone_id', name='uq_dayahead_lbmp'),
-        Index('idx_dayahead_lbmp_timestamp', 'timestamp'),
-        Index('idx_dayahead_lbmp_zone', 'zone_id'),
+        Index('idx_dayahead_lbmp_zone_timestamp', zone_id, timestamp.desc(), postgresql_include=['lbmp']),
+        Index('idx_dayahead_lbmp_timestamp_zone', timestamp, zone_id,
+              postgresql_include=['lbmp']).ddl_if(dialect='postgresql'),
     )
 
 
@@ -161,7 +167,7 @@ class TimeWeightedLBMP(Base):
     __tablename__ = 'timeweighted_lbmp'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     zone_id = Column(Integer, ForeignKey('zones.id'), nullable=False)
     ptid = Column(Integer)
     lbmp = Column(Float, nullable=False)
@@ -173,7 +179,7 @@ class TimeWeightedLBMP(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'zone_id', name='uq_timeweighted_lbmp'),
-        Index('idx_timeweighted_lbmp_timestamp', 'timestamp'),
+        Index('idx_timeweighted_lbmp_zone_timestamp', zone_id, timestamp.desc()),
     )
 
 
@@ -182,7 +188,7 @@ class RealTimeLoad(Base):
     __tablename__ = 'realtime_load'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     zone_id = Column(Integer, ForeignKey('zones.id'), nullable=False)
     ptid = Column(Integer)
     load = Column(Float, nullable=False)
@@ -193,8 +199,9 @@ class RealTimeLoad(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'zone_id', name='uq_realtime_load'),
-        Index('idx_realtime_load_timestamp', 'timestamp'),
-        Index('idx_realtime_load_zone', 'zone_id'),
+        Index('idx_realtime_load_zone_timestamp', zone_id, timestamp.desc(), postgresql_include=['load']),
+        Index('idx_realtime_load_timestamp_zone', timestamp, zone_id,
+              postgresql_include=['load']).ddl_if(dialect='postgresql'),
     )
 
 
@@ -203,7 +210,7 @@ class LoadForecast(Base):
     __tablename__ = 'load_forecast'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     zone_id = Column(Integer, ForeignKey('zones.id'), nullable=False)
     forecast_load = Column(Float, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -212,8 +219,9 @@ class LoadForecast(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'zone_id', name='uq_load_forecast'),
-        Index('idx_load_forecast_timestamp', 'timestamp'),
-        Index('idx_load_forecast_zone', 'zone_id'),
+        Index('idx_load_forecast_zone_timestamp', zone_id, timestamp.desc(), postgresql_include=['forecast_load']),
+        Index('idx_load_forecast_timestamp_zone', timestamp, zone_id,
+              postgresql_include=['forecast_load']).ddl_if(dialect='postgresql'),
     )
 
 
@@ -222,7 +230,7 @@ class InterfaceFlow(Base):
     __tablename__ = 'interface_flows'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     interface_id = Column(Integer, ForeignKey('interfaces.id'), nullable=False)
     point_id = Column(Integer)
     flow_mwh = Column(Float, nullable=False)
@@ -234,8 +242,7 @@ class InterfaceFlow(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'interface_id', name='uq_interface_flow'),
-        Index('idx_interface_flow_timestamp', 'timestamp'),
-        Index('idx_interface_flow_interface', 'interface_id'),
+        Index('idx_interface_flow_interface_timestamp', interface_id, timestamp.desc()),
     )
 
 
@@ -244,7 +251,7 @@ class AncillaryService(Base):
     __tablename__ = 'ancillary_services'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     zone_id = Column(Integer, ForeignKey('zones.id'), nullable=False)
     market_type = Column(String(20), nullable=False)  # 'realtime' or 'dayahead'
     service_type = Column(String(50))  # regulation, spinning_reserve, non_sync_reserve
@@ -256,8 +263,7 @@ class AncillaryService(Base):
     __table_args__ = (
         UniqueConstraint('timestamp', 'zone_id', 'market_type', 'service_type', 
                         name='uq_ancillary_service'),
-        Index('idx_ancillary_timestamp', 'timestamp'),
-        Index('idx_ancillary_zone', 'zone_id'),
+        Index('idx_ancillary_zone_timestamp', zone_id, timestamp.desc()),
     )
 
 
@@ -270,7 +276,7 @@ class MarketAdvisory(Base):
     __tablename__ = 'market_advisories'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     advisory_type = Column(String(100))
     title = Column(String(500))
     message = Column(Text)
@@ -278,7 +284,7 @@ class MarketAdvisory(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     __table_args__ = (
-        Index('idx_advisory_timestamp', 'timestamp'),
+        Index('idx_advisory_timestamp_id', timestamp.desc(), id.desc()),  # keyset pagination
     )
 
 
@@ -287,7 +293,7 @@ class Constraint(Base):
     __tablename__ = 'constraints'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     constraint_name = Column(String(200), nullable=False)
     market_type = Column(String(20), nullable=False)  # 'realtime' or 'dayahead'
     shadow_price = Column(Float)
@@ -299,7 +305,7 @@ class Constraint(Base):
     __table_args__ = (
         UniqueConstraint('timestamp', 'constraint_name', 'market_type', 
                         name='uq_constraint'),
-        Index('idx_constraint_timestamp', 'timestamp'),
+        Index('idx_constraint_timestamp_id', timestamp.desc(), id.desc()),  # keyset pagination
         Index('idx_constraint_name', 'constraint_name'),
     )
 
@@ -309,7 +315,7 @@ class ExternalRTOPrice(Base):
     __tablename__ = 'external_rto_prices'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     rto_name = Column(String(50), nullable=False)  # IESO, PJM, ISO-NE
     rtc_price = Column(Float)
     cts_price = Column(Float)
@@ -318,7 +324,7 @@ class ExternalRTOPrice(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'rto_name', name='uq_external_rto_price'),
-        Index('idx_external_rto_timestamp', 'timestamp'),
+        Index('idx_external_rto_timestamp_id', timestamp.desc(), id.desc()),  # keyset pagination
         Index('idx_external_rto_name', 'rto_name'),
     )
 
@@ -328,7 +334,7 @@ class ATC_TTC(Base):
     __tablename__ = 'atc_ttc'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     interface_id = Column(Integer, ForeignKey('interfaces.id'), nullable=False)
     forecast_type = Column(String(20))  # 'short_term' or 'long_term'
     atc_mw = Column(Float)
@@ -342,7 +348,7 @@ class ATC_TTC(Base):
     __table_args__ = (
         UniqueConstraint('timestamp', 'interface_id', 'forecast_type', 'direction',
                         name='uq_atc_ttc'),
-        Index('idx_atc_ttc_timestamp', 'timestamp'),
+        Index('idx_atc_ttc_timestamp_id', timestamp.desc(), id.desc()),  # keyset pagination
         Index('idx_atc_ttc_interface', 'interface_id'),
     )
 
@@ -352,7 +358,7 @@ class Outage(Base):
     __tablename__ = 'outages'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     outage_type = Column(String(50), nullable=False)  # 'scheduled', 'actual', 'maintenance'
     market_type = Column(String(20))  # 'realtime' or 'dayahead'
     resource_name = Column(String(200))
@@ -365,7 +371,7 @@ class Outage(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     __table_args__ = (
-        Index('idx_outage_timestamp', 'timestamp'),
+        Index('idx_outage_timestamp_id', timestamp.desc(), id.desc()),  # keyset pagination
         Index('idx_outage_resource', 'resource_name'),
         Index('idx_outage_type', 'outage_type'),
     )
@@ -376,7 +382,7 @@ class WeatherForecast(Base):
     __tablename__ = 'weather_forecast'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     forecast_time = Column(DateTime, nullable=False)  # Time being forecasted
     location = Column(String(100))
     vintage = Column(String(20))  # 'Actual' or 'Forecast' - Actual = current weather
@@ -392,11 +398,14 @@ class WeatherForecast(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'forecast_time', 'location', 'vintage', 'data_source', name='uq_weather_forecast'),
-        Index('idx_weather_timestamp', 'timestamp'),
+        Index('idx_weather_timestamp_id', timestamp.desc(), id.desc()),  # keyset pagination
         Index('idx_weather_forecast_time', 'forecast_time'),
         Index('idx_weather_vintage', 'vintage'),
         Index('idx_weather_zone', 'zone_name'),
         Index('idx_weather_data_source', 'data_source'),
+        # Latest-vintage lookups for /api/weather-current
+        Index('idx_weather_actual_vintage', forecast_time.desc(), timestamp.desc(),
+              postgresql_where=vintage == 'Actual', sqlite_where=vintage == 'Actual'),
     )
 
 
@@ -405,7 +414,7 @@ class FuelMix(Base):
     __tablename__ = 'fuel_mix'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True)
+    timestamp = Column(DateTime, nullable=False)
     fuel_type = Column(String(50), nullable=False)  # gas, nuclear, hydro, wind, solar, other
     generation_mw = Column(Float, nullable=False)
     percentage = Column(Float)
@@ -413,7 +422,8 @@ class FuelMix(Base):
     
     __table_args__ = (
         UniqueConstraint('timestamp', 'fuel_type', name='uq_fuel_mix'),
-        Index('idx_fuel_mix_timestamp', 'timestamp'),
+        Index('idx_fuel_mix_timestamp', 'timestamp', postgresql_include=['generation_mw']),
+        Index('idx_fuel_mix_timestamp_id', timestamp.desc(), id.desc()),  # keyset pagination
         Index('idx_fuel_mix_type', 'fuel_type'),
     )
 
@@ -427,9 +437,9 @@ class PageView(Base):
     __tablename__ = 'page_views'
     
     id = Column(Integer, primary_key=True)
-    timestamp = Column(DateTime, nullable=False, index=True, default=datetime.utcnow)
-    session_id = Column(String(64), nullable=False, index=True)  # Hashed session
-    ip_hash = Column(String(64), nullable=False, index=True)  # Hashed IP (privacy)
+    timestamp = Column(DateTime, nullable=False, default=datetime.utcnow)
+    session_id = Column(String(64), nullable=False)  # Hashed session
+    ip_hash = Column(String(32), nullable=False)  # Hashed IP (privacy): 128-bit hex digest
     path = Column(String(500), nullable=False)  # Page path
     referrer = Column(String(500))  # Referrer URL
     user_agent = Column(String(500))  # Browser/device
@@ -438,9 +448,45 @@ class PageView(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     __table_args__ = (
-        Index('idx_pageview_timestamp', 'timestamp'),
-        Index('idx_pageview_session', 'session_id'),
+        Index('idx_pageview_session_ts', 'session_id', 'timestamp'),
         Index('idx_pageview_path', 'path'),
+        # Covering indexes for the analytics summary's range + GROUP BY/DISTINCT queries
+        Index('idx_pageview_timestamp_path', timestamp, path, postgresql_include=['id']),
+        Index('idx_pageview_timestamp_referrer', timestamp, referrer, postgresql_include=['id'],
+              postgresql_where=referrer.isnot(None), sqlite_where=referrer.isnot(None)),
+        Index('idx_pageview_timestamp_country', timestamp, country, postgresql_include=['id'],
+              postgresql_where=country.isnot(None), sqlite_where=country.isnot(None)),
+        Index('idx_pageview_timestamp_ip_hash', timestamp, ip_hash),
+    )
+
+
+class PageViewDaily(Base):
+    """Daily page view counts per path/referrer/country (rolled up from page_views)."""
+    __tablename__ = 'page_view_daily'
+    
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)  # UTC day; only complete days are rolled up
+    path = Column(String(500), nullable=False)
+    referrer = Column(String(500))
+    country = Column(String(2))
+    views = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        # Covers the summary's top-N scan (PostgreSQL): whole days read from the index
+        Index('idx_page_view_daily_day', 'day', postgresql_include=['path', 'referrer', 'country', 'views']),
+    )
+
+
+class PageViewDailyVisitor(Base):
+    """Distinct visitors (IP hashes) per day, rolled up from page_views."""
+    __tablename__ = 'page_view_daily_visitors'
+    
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)  # UTC day; only complete days are rolled up
+    ip_hash = Column(String(32), nullable=False)
+    
+    __table_args__ = (
+        Index('idx_page_view_daily_visitors_day', 'day'),
     )
 
 
@@ -450,7 +496,7 @@ class VisitorSession(Base):
     
     id = Column(Integer, primary_key=True)
     session_id = Column(String(64), nullable=False, unique=True, index=True)
-    ip_hash = Column(String(64), nullable=False, index=True)
+    ip_hash = Column(String(32), nullable=False, index=True)
     user_agent = Column(String(500))
     country = Column(String(2))
     first_visit = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -460,7 +506,6 @@ class VisitorSession(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     
     __table_args__ = (
-        Index('idx_session_id', 'session_id'),
         Index('idx_session_last_visit', 'last_visit'),
     )
 
@@ -504,26 +549,148 @@ def get_database_url():
     return f'sqlite:///{str(db_path.absolute())}'
 
 
-def create_engine_instance():
-    """Create SQLAlchemy engine."""
-    url = get_database_url()
+# Compiled SQL cache entries per engine. The API builds a few hundred distinct
+# statement shapes (list filters x optional params); the default 500 can churn.
+QUERY_CACHE_SIZE = 1200
+
+# PostgreSQL connections per process. Every gunicorn worker gets its own pool,
+# so workers * (size + overflow) must stay under the server's max_connections
+# (default 100); the defaults are SQLAlchemy's own.
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+
+# Per-connection SQLite settings. WAL lets the API keep reading while the
+# scheduler writes; synchronous=NORMAL is durable under WAL except across an
+# OS crash, where at most the last commits are lost.
+SQLITE_PRAGMAS = (
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',  # 256 MB; shared OS page cache, not per connection
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to each new SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+    finally:
+        cursor.close()
+
+
+def _build_engine(url: str):
+    """Create a SQLAlchemy engine for ``url``."""
     if url.startswith('sqlite'):
         # Increase timeout to 30s (default 5s) to handle concurrent access better
-        return create_engine(url, echo=False, connect_args={'check_same_thread': False, 'timeout': 30})
+        engine = create_engine(url, echo=False, query_cache_size=QUERY_CACHE_SIZE,
+                               connect_args={'check_same_thread': False, 'timeout': 30})
+        event.listen(engine, 'connect', _set_sqlite_pragmas)
+        return engine
     else:
-        return create_engine(url, echo=False, pool_pre_ping=True)
+        # Recycle before managed Postgres/proxies drop idle connections
+        return create_engine(url, echo=False, query_cache_size=QUERY_CACHE_SIZE,
+                             pool_pre_ping=True, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW,
+                             pool_recycle=1800)
+
+
+# One engine (and connection pool) per database URL per process
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def create_engine_instance():
+    """Return the process-wide SQLAlchemy engine for the configured database URL."""
+    url = get_database_url()
+    engine = _engines.get(url)
+    if engine is None:
+        with _engines_lock:
+            # Another thread may have built it while we waited
+            engine = _engines.get(url)
+            if engine is None:
+                engine = _engines[url] = _build_engine(url)
+    return engine
+
+
+# Indexes no longer declared on the models. create_all() never drops
+# anything, so init_database() removes them from existing databases:
+# ix_<table>_timestamp duplicated each table's explicit idx_*_timestamp, and
+# the single-column zone/interface indexes are prefixes of the
+# (zone_id|interface_id, timestamp) composites. On the analytics tables the
+# per-column page_views indexes duplicated idx_pageview_session_ts and the
+# (timestamp, ...) composites, which also cover plain time ranges, and
+# idx_session_id duplicated the unique session_id index. The single-column
+# idx_*_timestamp B-trees on the market tables are prefixes of each table's
+# unique (timestamp, ...) constraint or (timestamp, id) keyset index, which
+# also serve time ranges, so the PostgreSQL BRIN indexes were a third copy.
+RETIRED_INDEXES = (
+    'ix_realtime_lbmp_timestamp', 'ix_dayahead_lbmp_timestamp', 'ix_timeweighted_lbmp_timestamp',
+    'ix_realtime_load_timestamp', 'ix_load_forecast_timestamp', 'ix_interface_flows_timestamp',
+    'ix_ancillary_services_timestamp', 'ix_market_advisories_timestamp', 'ix_constraints_timestamp',
+    'ix_external_rto_prices_timestamp', 'ix_atc_ttc_timestamp', 'ix_outages_timestamp',
+    'ix_weather_forecast_timestamp', 'ix_fuel_mix_timestamp',
+    'idx_realtime_lbmp_zone', 'idx_dayahead_lbmp_zone', 'idx_realtime_load_zone',
+    'idx_load_forecast_zone', 'idx_interface_flow_interface', 'idx_ancillary_zone',
+    'ix_page_views_timestamp', 'ix_page_views_session_id', 'ix_page_views_ip_hash',
+    'idx_pageview_session', 'idx_session_id',
+    'idx_realtime_lbmp_timestamp', 'idx_dayahead_lbmp_timestamp', 'idx_timeweighted_lbmp_timestamp',
+    'idx_realtime_load_timestamp', 'idx_load_forecast_timestamp', 'idx_interface_flow_timestamp',
+    'idx_ancillary_timestamp', 'idx_advisory_timestamp', 'idx_constraint_timestamp',
+    'idx_external_rto_timestamp', 'idx_atc_ttc_timestamp', 'idx_outage_timestamp', 'idx_weather_timestamp',
+    'idx_realtime_lbmp_timestamp_brin', 'idx_dayahead_lbmp_timestamp_brin', 'idx_realtime_load_timestamp_brin',
+    'idx_interface_flow_timestamp_brin', 'idx_fuel_mix_timestamp_brin',
+    'idx_pageview_timestamp', 'idx_pageview_timestamp_brin',
+)
+
+# Columns declared narrower after their tables were first created:
+# (table, column). create_all() never alters existing columns, so
+# init_database() shrinks them to the declared width on PostgreSQL (SQLite
+# does not enforce VARCHAR lengths). Stored ip_hash values were always 32 chars.
+NARROWED_COLUMNS = (
+    ('page_views', 'ip_hash'),
+    ('page_view_daily_visitors', 'ip_hash'),
+    ('visitor_sessions', 'ip_hash'),
+)
+
+
+def _narrow_columns(conn):
+    """ALTER columns in NARROWED_COLUMNS whose stored width differs from the model."""
+    inspector = inspect(conn)
+    for table_name, column_name in NARROWED_COLUMNS:
+        length = Base.metadata.tables[table_name].c[column_name].type.length
+        current = next(c for c in inspector.get_columns(table_name) if c['name'] == column_name)
+        if current['type'].length != length:
+            conn.execute(text(
+                f"ALTER TABLE {table_name} ALTER COLUMN {column_name} TYPE VARCHAR({length})"
+            ))
 
 
 def init_database():
     """Initialize database schema."""
     engine = create_engine_instance()
     Base.metadata.create_all(engine)
+    # create_all() skips existing tables, so add indexes declared after a
+    # table was first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    with engine.begin() as conn:
+        for name in RETIRED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        if conn.dialect.name == 'postgresql':
+            _narrow_columns(conn)
     return engine
 
 
+# Built on first use so DATABASE_URL can be set before the engine is created
+_session_factory = None
+
+
 def get_session():
-    """Get database session."""
-    engine = create_engine_instance()
-    Session = sessionmaker(bind=engine)
-    return Session()
+    """Get database session from the process-wide, pooled session factory."""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = sessionmaker(bind=create_engine_instance())
+    return _session_factory()
 
@@ -53,6 +53,25 @@ const api = axios.create({
   withCredentials: false, // Don't send cookies for CORS
 });
 
+// List endpoints return at most this many rows per request
+const MAX_PAGE_SIZE = 1000;
+
+// Fetch up to params.limit rows from a keyset-paged list endpoint, following
+// the X-Next-Cursor header when the limit is above the per-request cap
+const fetchPaged = async <T>(url: string, params?: DateRangeParams): Promise<T[]> => {
+  const total = params?.limit ?? MAX_PAGE_SIZE;
+  const rows: T[] = [];
+  let after: string | undefined;
+  do {
+    const response = await api.get<T[]>(url, {
+      params: { ...params, limit: Math.min(MAX_PAGE_SIZE, total - rows.length), after },
+    });
+    rows.push(...response.data);
+    after = response.headers['x-next-cursor'] as string | undefined;
+  } while (after && rows.length < total);
+  return rows;
+};
+
 // Reference Data
 export const fetchZones = async (): Promise<Zone[]> => {
   const response = await api.get<Zone[]>('/api/zones');
@@ -147,23 +166,19 @@ export const fetchFuelMix = async (params?: DateRangeParams & { fuel_type?: stri
 
 // Existing Core Data
 export const fetchRealTimeLBMP = async (params?: ZoneFilterParams): Promise<RealTimeLBMP[]> => {
-  const response = await api.get<RealTimeLBMP[]>('/api/realtime-lbmp', { params });
-  return response.data;
+  return fetchPaged<RealTimeLBMP>('/api/realtime-lbmp', params);
 };
 
 export const fetchDayAheadLBMP = async (params?: ZoneFilterParams): Promise<DayAheadLBMP[]> => {
-  const response = await api.get<DayAheadLBMP[]>('/api/dayahead-lbmp', { params });
-  return response.data;
+  return fetchPaged<DayAheadLBMP>('/api/dayahead-lbmp', params);
 };
 
 export const fetchRealTimeLoad = async (params?: ZoneFilterParams): Promise<RealTimeLoad[]> => {
-  const response = await api.get<RealTimeLoad[]>('/api/realtime-load', { params });
-  return response.data;
+  return fetchPaged<RealTimeLoad>('/api/realtime-load', params);
 };
 
 export const fetchLoadForecast = async (params?: ZoneFilterParams): Promise<LoadForecast[]> => {
-  const response = await api.get<LoadForecast[]>('/api/load-forecast', { params });
-  return response.data;
+  return fetchPaged<LoadForecast>('/api/load-forecast', params);
 };
 
 export const fetchInterfaceFlows = async (params?: DateRangeParams & { interfaces?: string }): Promise<InterfaceFlow[]> => {
@@ -0,0 +1,28 @@
+"""
+Gunicorn settings for serving the API with uvicorn workers.
+Usage: gunicorn -c gunicorn.conf.py api.main:app
+"""
+import multiprocessing
+import os
+
+bind = f"{os.getenv('API_HOST', '127.0.0.1')}:{os.getenv('API_PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"  # uses uvloop/httptools from uvicorn[standard]
+
+
+def _default_workers() -> int:
+    """2 * cores + 1 for PostgreSQL; a single worker for SQLite (one writer at a time)."""
+    database_url = os.getenv('DATABASE_URL', '')
+    if database_url.startswith(('postgresql://', 'postgres://')):
+        return multiprocessing.cpu_count() * 2 + 1
+    return 1
+
+
+workers = int(os.getenv('WEB_CONCURRENCY', _default_workers()))
+worker_connections = 1000
+timeout = 60
+graceful_timeout = 30
+keepalive = 5
+
+loglevel = "info"
+accesslog = None  # Nginx logs requests; skip a formatted line + write per request
+errorlog = "-"
@@ -182,7 +182,9 @@ def main():
                 host=host,
                 port=port,
                 log_level="info",
-                access_log=False  # Railway handles access logs
+                access_log=False,  # Railway handles access logs
+                loop="uvloop",
+                http="httptools"
             )
         except Exception as uvicorn_error:
             logger.exception(f"Uvicorn crashed: {uvicorn_error}")
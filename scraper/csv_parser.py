@@ -233,19 +233,34 @@ class NYISOCSVParser:
         
         return records
     
+    @staticmethod
+    def _column(df: pd.DataFrame, name: str, default: Any = None) -> List[Any]:
+        """Return a column as a plain list, or ``default`` repeated if it is absent."""
+        if name in df.columns:
+            return df[name].tolist()
+        return [default] * len(df)
+    
     def _transform_realtime_lbmp(self, df: pd.DataFrame, timestamp_col: str) -> List[Dict]:
         """Transform real-time LBMP data."""
-        records = []
-        for _, row in df.iterrows():
-            records.append({
-                'timestamp': row[timestamp_col],
-                'zone_name': row.get('Name', ''),
-                'ptid': row.get('PTID'),
-                'lbmp': row.get('LBMP ($/MWHr)'),
-                'marginal_cost_losses': row.get('Marginal Cost Losses ($/MWHr)'),
-                'marginal_cost_congestion': row.get('Marginal Cost Congestion ($/MWHr)'),
-            })
-        return records
+        columns = zip(
+            self._column(df, timestamp_col),
+            self._column(df, 'Name', ''),
+            self._column(df, 'PTID'),
+            self._column(df, 'LBMP ($/MWHr)'),
+            self._column(df, 'Marginal Cost Losses ($/MWHr)'),
+            self._column(df, 'Marginal Cost Congestion ($/MWHr)'),
+        )
+        return [
+            {
+                'timestamp': timestamp,
+                'zone_name': zone_name,
+                'ptid': ptid,
+                'lbmp': lbmp,
+                'marginal_cost_losses': losses,
+                'marginal_cost_congestion': congestion,
+            }
+            for timestamp, zone_name, ptid, lbmp, losses, congestion in columns
+        ]
     
     def _transform_dayahead_lbmp(self, df: pd.DataFrame, timestamp_col: str) -> List[Dict]:
         """Transform day-ahead LBMP data."""
@@ -258,8 +273,14 @@ class NYISOCSVParser:
     def _transform_realtime_load(self, df: pd.DataFrame, timestamp_col: str) -> List[Dict]:
         """Transform real-time load data."""
         records = []
-        for _, row in df.iterrows():
-            time_zone = row.get('Time Zone', '')
+        columns = zip(
+            self._column(df, timestamp_col),
+            self._column(df, 'Name', ''),
+            self._column(df, 'PTID'),
+            self._column(df, 'Load'),
+            self._column(df, 'Time Zone', ''),
+        )
+        for timestamp, zone_name, ptid, load, time_zone in columns:
             # Handle pandas NaT/NaN values
             if pd.isna(time_zone):
                 time_zone = None
@@ -269,10 +290,10 @@ class NYISOCSVParser:
                 time_zone = str(time_zone) if time_zone else None
             
             records.append({
-                'timestamp': row[timestamp_col],
-                'zone_name': row.get('Name', ''),
-                'ptid': row.get('PTID'),
-                'load': row.get('Load'),
+                'timestamp': timestamp,
+                'zone_name': zone_name,
+                'ptid': ptid,
+                'load': load,
                 'time_zone': time_zone,
             })
         return records
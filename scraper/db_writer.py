@@ -2,8 +2,8 @@
 Database writer with upsert logic and transaction management.
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Dict, Any, Optional, Tuple
+from sqlalchemy import insert, select, update
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from datetime import datetime
 import logging
 
@@ -47,496 +47,335 @@ class DatabaseWriter:
             interface.point_id = point_id
         return interface
     
-    def upsert_realtime_lbmp(self, records: List[Dict]) -> Tuple[int, int]:
-        """Upsert real-time LBMP records."""
-        inserted = 0
-        updated = 0
+    def _reference_ids(self, get_or_create: Callable, code_attr: str) -> Callable[..., int]:
+        """Per-batch memo over get_or_create_zone/get_or_create_interface.
         
-        for record in records:
-            zone = self.get_or_create_zone(record['zone_name'], record.get('ptid'))
-            
-            existing = self.session.query(RealTimeLBMP).filter(
-                and_(
-                    RealTimeLBMP.timestamp == record['timestamp'],
-                    RealTimeLBMP.zone_id == zone.id
-                )
-            ).first()
-            
-            if existing:
-                existing.lbmp = record.get('lbmp')
-                existing.marginal_cost_losses = record.get('marginal_cost_losses')
-                existing.marginal_cost_congestion = record.get('marginal_cost_congestion')
-                updated += 1
-            else:
-                new_record = RealTimeLBMP(
-                    timestamp=record['timestamp'],
-                    zone_id=zone.id,
-                    ptid=record.get('ptid'),
-                    lbmp=record.get('lbmp'),
-                    marginal_cost_losses=record.get('marginal_cost_losses'),
-                    marginal_cost_congestion=record.get('marginal_cost_congestion')
-                )
-                self.session.add(new_record)
-                inserted += 1
+        Returns ``ref_id(name, code=None)``, which hits the database once per
+        distinct name and still backfills a missing ``code_attr`` (ptid or
+        point_id) from later records.
+        """
+        refs = {}
+        
+        def ref_id(name: str, code: Optional[int] = None) -> int:
+            ref = refs.get(name)
+            if ref is None:
+                ref = refs[name] = get_or_create(name, code)
+            elif code and not getattr(ref, code_attr):
+                setattr(ref, code_attr, code)
+            return ref.id
         
-        return inserted, updated
+        return ref_id
     
-    def upsert_dayahead_lbmp(self, records: List[Dict]) -> Tuple[int, int]:
-        """Upsert day-ahead LBMP records."""
-        inserted = 0
-        updated = 0
+    def _upsert(
+        self,
+        model,
+        key_columns: Tuple[str, ...],
+        update_columns: Tuple[str, ...],
+        rows: List[Dict[str, Any]]
+    ) -> Tuple[int, int]:
+        """
+        Insert or update ``rows`` (column -> value) matched on ``key_columns``.
         
-        for record in records:
-            zone = self.get_or_create_zone(record['zone_name'], record.get('ptid'))
-            
-            existing = self.session.query(DayAheadLBMP).filter(
-                and_(
-                    DayAheadLBMP.timestamp == record['timestamp'],
-                    DayAheadLBMP.zone_id == zone.id
-                )
-            ).first()
-            
-            if existing:
-                existing.lbmp = record.get('lbmp')
-                existing.marginal_cost_losses = record.get('marginal_cost_losses')
-                existing.marginal_cost_congestion = record.get('marginal_cost_congestion')
+        Existing rows for the whole batch are loaded with one query (timestamp
+        range plus IN filters on the other key columns, selecting only id, key
+        and update columns); rows whose values changed are written back with
+        a single executemany UPDATE by primary key, and new rows go in as a
+        single executemany INSERT. A key repeated within the batch updates
+        the earlier row, as the old row-by-row path did. Update columns
+        missing from a row are left unchanged.
+        
+        Returns:
+            Tuple of (inserted_count, updated_count)
+        """
+        if not rows:
+            return 0, 0
+        
+        timestamps = [row['timestamp'] for row in rows]
+        stmt = select(
+            model.id, *(getattr(model, c) for c in key_columns + update_columns)
+        ).where(model.timestamp.between(min(timestamps), max(timestamps)))
+        for column in key_columns:
+            if column == 'timestamp':
+                continue
+            values = {row[column] for row in rows}
+            if None not in values:
+                stmt = stmt.where(getattr(model, column).in_(values))
+        existing = {
+            tuple(current[c] for c in key_columns): current
+            for current in (dict(r) for r in self.session.execute(stmt).mappings())
+        }
+        
+        new_rows = {}
+        changed = {}
+        updated = 0
+        for row in rows:
+            key = tuple(row[c] for c in key_columns)
+            current = existing.get(key)
+            if current is not None:
+                for column in update_columns:
+                    if column in row and row[column] != current[column]:
+                        current[column] = row[column]
+                        changed[current['id']] = current
+                updated += 1
+            elif key in new_rows:
+                new_rows[key].update((c, row[c]) for c in update_columns if c in row)
                 updated += 1
             else:
-                new_record = DayAheadLBMP(
-                    timestamp=record['timestamp'],
-                    zone_id=zone.id,
-                    ptid=record.get('ptid'),
-                    lbmp=record.get('lbmp'),
-                    marginal_cost_losses=record.get('marginal_cost_losses'),
-                    marginal_cost_congestion=record.get('marginal_cost_congestion')
-                )
-                self.session.add(new_record)
-                inserted += 1
+                new_rows[key] = dict(row)
+        
+        if changed:
+            # Unchanged rows are skipped, as ORM change tracking did
+            self.session.execute(
+                update(model),
+                [{'id': current['id'], **{c: current[c] for c in update_columns}} for current in changed.values()]
+            )
+        
+        if new_rows:
+            # executemany needs the same columns in every parameter set
+            columns = dict.fromkeys(c for row in new_rows.values() for c in row)
+            params = [{c: row.get(c) for c in columns} for row in new_rows.values()]
+            if 'created_at' in model.__table__.c:
+                # One timestamp per batch instead of a default call per row
+                created_at = datetime.utcnow()
+                for row in params:
+                    row['created_at'] = created_at
+            self.session.execute(insert(model), params)
         
-        return inserted, updated
+        return len(new_rows), updated
+    
+    def upsert_realtime_lbmp(self, records: List[Dict]) -> Tuple[int, int]:
+        """Upsert real-time LBMP records."""
+        return self._upsert_lbmp(RealTimeLBMP, records)
+    
+    def upsert_dayahead_lbmp(self, records: List[Dict]) -> Tuple[int, int]:
+        """Upsert day-ahead LBMP records."""
+        return self._upsert_lbmp(DayAheadLBMP, records)
     
     def upsert_timeweighted_lbmp(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert time-weighted LBMP records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            zone = self.get_or_create_zone(record['zone_name'], record.get('ptid'))
-            
-            existing = self.session.query(TimeWeightedLBMP).filter(
-                and_(
-                    TimeWeightedLBMP.timestamp == record['timestamp'],
-                    TimeWeightedLBMP.zone_id == zone.id
-                )
-            ).first()
-            
-            if existing:
-                existing.lbmp = record.get('lbmp')
-                existing.marginal_cost_losses = record.get('marginal_cost_losses')
-                existing.marginal_cost_congestion = record.get('marginal_cost_congestion')
-                updated += 1
-            else:
-                new_record = TimeWeightedLBMP(
-                    timestamp=record['timestamp'],
-                    zone_id=zone.id,
-                    ptid=record.get('ptid'),
-                    lbmp=record.get('lbmp'),
-                    marginal_cost_losses=record.get('marginal_cost_losses'),
-                    marginal_cost_congestion=record.get('marginal_cost_congestion')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        return self._upsert_lbmp(TimeWeightedLBMP, records)
+    
+    def _upsert_lbmp(self, model, records: List[Dict]) -> Tuple[int, int]:
+        """Upsert records into one of the zone LBMP tables."""
+        zone_id = self._reference_ids(self.get_or_create_zone, 'ptid')
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'zone_id': zone_id(record['zone_name'], record.get('ptid')),
+                'ptid': record.get('ptid'),
+                'lbmp': record.get('lbmp'),
+                'marginal_cost_losses': record.get('marginal_cost_losses'),
+                'marginal_cost_congestion': record.get('marginal_cost_congestion')
+            }
+            for record in records
+        ]
+        return self._upsert(
+            model, ('timestamp', 'zone_id'),
+            ('lbmp', 'marginal_cost_losses', 'marginal_cost_congestion'), rows
+        )
     
     def upsert_realtime_load(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert real-time load records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            zone = self.get_or_create_zone(record['zone_name'], record.get('ptid'))
-            
-            existing = self.session.query(RealTimeLoad).filter(
-                and_(
-                    RealTimeLoad.timestamp == record['timestamp'],
-                    RealTimeLoad.zone_id == zone.id
-                )
-            ).first()
-            
-            if existing:
-                existing.load = record.get('load')
-                existing.time_zone = record.get('time_zone')
-                updated += 1
-            else:
-                new_record = RealTimeLoad(
-                    timestamp=record['timestamp'],
-                    zone_id=zone.id,
-                    ptid=record.get('ptid'),
-                    load=record.get('load'),
-                    time_zone=record.get('time_zone')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        zone_id = self._reference_ids(self.get_or_create_zone, 'ptid')
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'zone_id': zone_id(record['zone_name'], record.get('ptid')),
+                'ptid': record.get('ptid'),
+                'load': record.get('load'),
+                'time_zone': record.get('time_zone')
+            }
+            for record in records
+        ]
+        return self._upsert(RealTimeLoad, ('timestamp', 'zone_id'), ('load', 'time_zone'), rows)
     
     def upsert_load_forecast(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert load forecast records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            zone = self.get_or_create_zone(record['zone_name'])
-            
-            existing = self.session.query(LoadForecast).filter(
-                and_(
-                    LoadForecast.timestamp == record['timestamp'],
-                    LoadForecast.zone_id == zone.id
-                )
-            ).first()
-            
-            if existing:
-                existing.forecast_load = record.get('forecast_load')
-                updated += 1
-            else:
-                new_record = LoadForecast(
-                    timestamp=record['timestamp'],
-                    zone_id=zone.id,
-                    forecast_load=record.get('forecast_load')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        zone_id = self._reference_ids(self.get_or_create_zone, 'ptid')
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'zone_id': zone_id(record['zone_name']),
+                'forecast_load': record.get('forecast_load')
+            }
+            for record in records
+        ]
+        return self._upsert(LoadForecast, ('timestamp', 'zone_id'), ('forecast_load',), rows)
     
     def upsert_interface_flows(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert interface flow records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            interface = self.get_or_create_interface(
-                record['interface_name'],
-                record.get('point_id')
-            )
-            
-            existing = self.session.query(InterfaceFlow).filter(
-                and_(
-                    InterfaceFlow.timestamp == record['timestamp'],
-                    InterfaceFlow.interface_id == interface.id
-                )
-            ).first()
-            
-            if existing:
-                existing.flow_mwh = record.get('flow_mwh')
-                existing.positive_limit_mwh = record.get('positive_limit_mwh')
-                existing.negative_limit_mwh = record.get('negative_limit_mwh')
-                updated += 1
-            else:
-                new_record = InterfaceFlow(
-                    timestamp=record['timestamp'],
-                    interface_id=interface.id,
-                    point_id=record.get('point_id'),
-                    flow_mwh=record.get('flow_mwh'),
-                    positive_limit_mwh=record.get('positive_limit_mwh'),
-                    negative_limit_mwh=record.get('negative_limit_mwh')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        interface_id = self._reference_ids(self.get_or_create_interface, 'point_id')
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'interface_id': interface_id(record['interface_name'], record.get('point_id')),
+                'point_id': record.get('point_id'),
+                'flow_mwh': record.get('flow_mwh'),
+                'positive_limit_mwh': record.get('positive_limit_mwh'),
+                'negative_limit_mwh': record.get('negative_limit_mwh')
+            }
+            for record in records
+        ]
+        return self._upsert(
+            InterfaceFlow, ('timestamp', 'interface_id'),
+            ('flow_mwh', 'positive_limit_mwh', 'negative_limit_mwh'), rows
+        )
     
     def upsert_ancillary_services(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert ancillary service records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            zone = self.get_or_create_zone(record['zone_name'])
-            
-            existing = self.session.query(AncillaryService).filter(
-                and_(
-                    AncillaryService.timestamp == record['timestamp'],
-                    AncillaryService.zone_id == zone.id,
-                    AncillaryService.market_type == record['market_type'],
-                    AncillaryService.service_type == record.get('service_type', 'regulation')
-                )
-            ).first()
-            
-            if existing:
-                existing.price = record.get('price')
-                updated += 1
-            else:
-                new_record = AncillaryService(
-                    timestamp=record['timestamp'],
-                    zone_id=zone.id,
-                    market_type=record['market_type'],
-                    service_type=record.get('service_type', 'regulation'),
-                    price=record.get('price')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        zone_id = self._reference_ids(self.get_or_create_zone, 'ptid')
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'zone_id': zone_id(record['zone_name']),
+                'market_type': record['market_type'],
+                'service_type': record.get('service_type', 'regulation'),
+                'price': record.get('price')
+            }
+            for record in records
+        ]
+        return self._upsert(
+            AncillaryService, ('timestamp', 'zone_id', 'market_type', 'service_type'), ('price',), rows
+        )
     
     def upsert_market_advisory(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert market advisory records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            existing = self.session.query(MarketAdvisory).filter(
-                and_(
-                    MarketAdvisory.timestamp == record['timestamp'],
-                    MarketAdvisory.title == record.get('title', '')
-                )
-            ).first()
-            
-            if existing:
-                existing.advisory_type = record.get('advisory_type')
-                existing.message = record.get('message')
-                existing.severity = record.get('severity')
-                updated += 1
-            else:
-                new_record = MarketAdvisory(
-                    timestamp=record['timestamp'],
-                    advisory_type=record.get('advisory_type'),
-                    title=record.get('title', ''),
-                    message=record.get('message'),
-                    severity=record.get('severity')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'advisory_type': record.get('advisory_type'),
+                'title': record.get('title', ''),
+                'message': record.get('message'),
+                'severity': record.get('severity')
+            }
+            for record in records
+        ]
+        return self._upsert(
+            MarketAdvisory, ('timestamp', 'title'), ('advisory_type', 'message', 'severity'), rows
+        )
     
     def upsert_constraints(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert constraint records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            existing = self.session.query(Constraint).filter(
-                and_(
-                    Constraint.timestamp == record['timestamp'],
-                    Constraint.constraint_name == record['constraint_name'],
-                    Constraint.market_type == record['market_type']
-                )
-            ).first()
-            
-            if existing:
-                existing.shadow_price = record.get('shadow_price')
-                existing.binding_status = record.get('binding_status')
-                existing.limit_mw = record.get('limit_mw')
-                existing.flow_mw = record.get('flow_mw')
-                updated += 1
-            else:
-                new_record = Constraint(
-                    timestamp=record['timestamp'],
-                    constraint_name=record['constraint_name'],
-                    market_type=record['market_type'],
-                    shadow_price=record.get('shadow_price'),
-                    binding_status=record.get('binding_status'),
-                    limit_mw=record.get('limit_mw'),
-                    flow_mw=record.get('flow_mw')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'constraint_name': record['constraint_name'],
+                'market_type': record['market_type'],
+                'shadow_price': record.get('shadow_price'),
+                'binding_status': record.get('binding_status'),
+                'limit_mw': record.get('limit_mw'),
+                'flow_mw': record.get('flow_mw')
+            }
+            for record in records
+        ]
+        return self._upsert(
+            Constraint, ('timestamp', 'constraint_name', 'market_type'),
+            ('shadow_price', 'binding_status', 'limit_mw', 'flow_mw'), rows
+        )
     
     def upsert_external_rto_prices(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert external RTO price records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            existing = self.session.query(ExternalRTOPrice).filter(
-                and_(
-                    ExternalRTOPrice.timestamp == record['timestamp'],
-                    ExternalRTOPrice.rto_name == record['rto_name']
-                )
-            ).first()
-            
-            if existing:
-                existing.rtc_price = record.get('rtc_price')
-                existing.cts_price = record.get('cts_price')
-                existing.price_difference = record.get('price_difference')
-                updated += 1
-            else:
-                new_record = ExternalRTOPrice(
-                    timestamp=record['timestamp'],
-                    rto_name=record['rto_name'],
-                    rtc_price=record.get('rtc_price'),
-                    cts_price=record.get('cts_price'),
-                    price_difference=record.get('price_difference')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'rto_name': record['rto_name'],
+                'rtc_price': record.get('rtc_price'),
+                'cts_price': record.get('cts_price'),
+                'price_difference': record.get('price_difference')
+            }
+            for record in records
+        ]
+        return self._upsert(
+            ExternalRTOPrice, ('timestamp', 'rto_name'),
+            ('rtc_price', 'cts_price', 'price_difference'), rows
+        )
     
     def upsert_atc_ttc(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert ATC/TTC records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            interface = self.get_or_create_interface(record['interface_name'])
-            
-            existing = self.session.query(ATC_TTC).filter(
-                and_(
-                    ATC_TTC.timestamp == record['timestamp'],
-                    ATC_TTC.interface_id == interface.id,
-                    ATC_TTC.forecast_type == record['forecast_type'],
-                    ATC_TTC.direction == record.get('direction', '')
-                )
-            ).first()
-            
-            if existing:
-                existing.atc_mw = record.get('atc_mw')
-                existing.ttc_mw = record.get('ttc_mw')
-                existing.trm_mw = record.get('trm_mw')
-                updated += 1
-            else:
-                new_record = ATC_TTC(
-                    timestamp=record['timestamp'],
-                    interface_id=interface.id,
-                    forecast_type=record['forecast_type'],
-                    atc_mw=record.get('atc_mw'),
-                    ttc_mw=record.get('ttc_mw'),
-                    trm_mw=record.get('trm_mw'),
-                    direction=record.get('direction', '')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        interface_id = self._reference_ids(self.get_or_create_interface, 'point_id')
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'interface_id': interface_id(record['interface_name']),
+                'forecast_type': record['forecast_type'],
+                'atc_mw': record.get('atc_mw'),
+                'ttc_mw': record.get('ttc_mw'),
+                'trm_mw': record.get('trm_mw'),
+                'direction': record.get('direction', '')
+            }
+            for record in records
+        ]
+        return self._upsert(
+            ATC_TTC, ('timestamp', 'interface_id', 'forecast_type', 'direction'),
+            ('atc_mw', 'ttc_mw', 'trm_mw'), rows
+        )
     
     def upsert_outages(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert outage records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            # Use resource_name + timestamp + outage_type as unique key
-            existing = self.session.query(Outage).filter(
-                and_(
-                    Outage.timestamp == record['timestamp'],
-                    Outage.resource_name == record.get('resource_name', ''),
-                    Outage.outage_type == record['outage_type']
-                )
-            ).first()
-            
-            if existing:
-                existing.market_type = record.get('market_type')
-                existing.resource_type = record.get('resource_type')
-                existing.mw_capacity = record.get('mw_capacity')
-                existing.mw_outage = record.get('mw_outage')
-                existing.start_time = record.get('start_time')
-                existing.end_time = record.get('end_time')
-                existing.status = record.get('status')
-                updated += 1
-            else:
-                new_record = Outage(
-                    timestamp=record['timestamp'],
-                    outage_type=record['outage_type'],
-                    market_type=record.get('market_type'),
-                    resource_name=record.get('resource_name', ''),
-                    resource_type=record.get('resource_type'),
-                    mw_capacity=record.get('mw_capacity'),
-                    mw_outage=record.get('mw_outage'),
-                    start_time=record.get('start_time'),
-                    end_time=record.get('end_time'),
-                    status=record.get('status')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'outage_type': record['outage_type'],
+                'market_type': record.get('market_type'),
+                'resource_name': record.get('resource_name', ''),
+                'resource_type': record.get('resource_type'),
+                'mw_capacity': record.get('mw_capacity'),
+                'mw_outage': record.get('mw_outage'),
+                'start_time': record.get('start_time'),
+                'end_time': record.get('end_time'),
+                'status': record.get('status')
+            }
+            for record in records
+        ]
+        # Use resource_name + timestamp + outage_type as unique key
+        return self._upsert(
+            Outage, ('timestamp', 'resource_name', 'outage_type'),
+            ('market_type', 'resource_type', 'mw_capacity', 'mw_outage', 'start_time', 'end_time', 'status'),
+            rows
+        )
     
     def upsert_weather_forecast(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert weather forecast records."""
-        inserted = 0
-        updated = 0
-        
+        rows = []
         for record in records:
-            # Unique constraint includes: timestamp, forecast_time, location, vintage, data_source
-            data_source = record.get('data_source', 'NYISO')  # Default to NYISO for backward compatibility
-            
-            existing = self.session.query(WeatherForecast).filter(
-                and_(
-                    WeatherForecast.timestamp == record['timestamp'],
-                    WeatherForecast.forecast_time == record['forecast_time'],
-                    WeatherForecast.location == record.get('location', ''),
-                    WeatherForecast.vintage == record.get('vintage'),
-                    WeatherForecast.data_source == data_source
-                )
-            ).first()
-            
-            if existing:
-                existing.temperature_f = record.get('temperature_f')
-                existing.humidity_percent = record.get('humidity_percent')
-                existing.wind_speed_mph = record.get('wind_speed_mph')
-                existing.wind_direction = record.get('wind_direction')
-                existing.cloud_cover_percent = record.get('cloud_cover_percent')
-                # Update new fields if provided
-                if 'zone_name' in record:
-                    existing.zone_name = record.get('zone_name')
-                if 'irradiance_w_m2' in record:
-                    existing.irradiance_w_m2 = record.get('irradiance_w_m2')
-                if 'data_source' in record:
-                    existing.data_source = record.get('data_source')
-                updated += 1
-            else:
-                new_record = WeatherForecast(
-                    timestamp=record['timestamp'],
-                    forecast_time=record['forecast_time'],
-                    location=record.get('location', ''),
-                    vintage=record.get('vintage'),
-                    temperature_f=record.get('temperature_f'),
-                    humidity_percent=record.get('humidity_percent'),
-                    wind_speed_mph=record.get('wind_speed_mph'),
-                    wind_direction=record.get('wind_direction'),
-                    cloud_cover_percent=record.get('cloud_cover_percent'),
-                    zone_name=record.get('zone_name'),
-                    irradiance_w_m2=record.get('irradiance_w_m2'),
-                    data_source=data_source
-                )
-                self.session.add(new_record)
-                inserted += 1
+            row = {
+                'timestamp': record['timestamp'],
+                'forecast_time': record['forecast_time'],
+                'location': record.get('location', ''),
+                'vintage': record.get('vintage'),
+                'temperature_f': record.get('temperature_f'),
+                'humidity_percent': record.get('humidity_percent'),
+                'wind_speed_mph': record.get('wind_speed_mph'),
+                'wind_direction': record.get('wind_direction'),
+                'cloud_cover_percent': record.get('cloud_cover_percent'),
+                'data_source': record.get('data_source', 'NYISO')  # Default to NYISO for backward compatibility
+            }
+            # Newer fields only overwrite existing rows when provided
+            for column in ('zone_name', 'irradiance_w_m2'):
+                if column in record:
+                    row[column] = record[column]
+            rows.append(row)
         
-        return inserted, updated
+        # Unique constraint includes: timestamp, forecast_time, location, vintage, data_source
+        return self._upsert(
+            WeatherForecast, ('timestamp', 'forecast_time', 'location', 'vintage', 'data_source'),
+            ('temperature_f', 'humidity_percent', 'wind_speed_mph', 'wind_direction',
+             'cloud_cover_percent', 'zone_name', 'irradiance_w_m2'),
+            rows
+        )
     
     def upsert_fuel_mix(self, records: List[Dict]) -> Tuple[int, int]:
         """Upsert fuel mix records."""
-        inserted = 0
-        updated = 0
-        
-        for record in records:
-            existing = self.session.query(FuelMix).filter(
-                and_(
-                    FuelMix.timestamp == record['timestamp'],
-                    FuelMix.fuel_type == record['fuel_type']
-                )
-            ).first()
-            
-            if existing:
-                existing.generation_mw = record.get('generation_mw')
-                existing.percentage = record.get('percentage')
-                updated += 1
-            else:
-                new_record = FuelMix(
-                    timestamp=record['timestamp'],
-                    fuel_type=record['fuel_type'],
-                    generation_mw=record.get('generation_mw'),
-                    percentage=record.get('percentage')
-                )
-                self.session.add(new_record)
-                inserted += 1
-        
-        return inserted, updated
+        rows = [
+            {
+                'timestamp': record['timestamp'],
+                'fuel_type': record['fuel_type'],
+                'generation_mw': record.get('generation_mw'),
+                'percentage': record.get('percentage')
+            }
+            for record in records
+        ]
+        return self._upsert(FuelMix, ('timestamp', 'fuel_type'), ('generation_mw', 'percentage'), rows)
     
     def write_records(
         self,
@@ -85,6 +85,10 @@ class NYISOScheduler:
         schedule.every().hour.do(self._scrape_openmeteo_wrapper)
         logger.info("Scheduled Open Meteo weather data hourly")
         
+        # Roll up completed days of page views for the analytics summary
+        schedule.every().hour.do(self._rollup_wrapper)
+        logger.info("Scheduled analytics rollup hourly")
+        
         # Schedule data cleanup (daily at 2 AM)
         schedule.every().day.at("02:00").do(self._cleanup_wrapper)
         logger.info("Scheduled data cleanup daily at 02:00 (14-day retention)")
@@ -248,6 +252,24 @@ class NYISOScheduler:
         except Exception as e:
             logger.exception(f"Error in data cleanup wrapper: {str(e)}")
     
+    def _rollup_wrapper(self):
+        """Wrapper for the page view rollup - runs hourly."""
+        try:
+            from database.rollups import refresh_page_view_daily
+            
+            session = get_session()
+            try:
+                refresh_page_view_daily(session)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.exception(f"Error during analytics rollup: {str(e)}")
+            finally:
+                session.close()
+                
+        except Exception as e:
+            logger.exception(f"Error in analytics rollup wrapper: {str(e)}")
+    
     def start(self, run_immediately: bool = True):
         """Start the scheduler."""
         self._schedule_by_frequency()
@@ -14,6 +14,8 @@ if __name__ == "__main__":
         reload=False,  # No auto-reload in production
         log_level="info",
         workers=1,  # Single worker for SQLite (use more for PostgreSQL)
-        access_log=True,
+        access_log=False,  # Nginx already logs requests; keep formatting off the hot path
+        loop="uvloop",
+        http="httptools",
     )
 
@@ -0,0 +1,30 @@
+"""
+Shared fixtures: the suite runs against a throwaway SQLite database.
+"""
+import os
+import tempfile
+
+# Set before database.schema builds its engine and session factory
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='nyiso-tests-'), 'test.db')}"
+
+import pytest
+
+from database.schema import Base, get_session, init_database
+
+
+@pytest.fixture(scope='session')
+def database():
+    """Create the schema once for the whole run."""
+    return init_database()
+
+
+@pytest.fixture
+def session(database):
+    """A session on the test database; every table is emptied afterwards."""
+    db = get_session()
+    yield db
+    db.rollback()
+    for table in reversed(Base.metadata.sorted_tables):
+        db.execute(table.delete())
+    db.commit()
+    db.close()
@@ -0,0 +1,62 @@
+"""
+PageViewWriter batches: sessions, returning visitors and page view rows.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from api.middleware.analytics import PageViewWriter
+from database.schema import PageView, VisitorSession
+
+START = datetime(2026, 1, 5, 12, 0)
+
+
+def _event(session_id, ip_hash, minutes=0, path='/'):
+    return {
+        'session_id': session_id,
+        'ip_hash': ip_hash,
+        'path': path,
+        'referrer': None,
+        'user_agent': 'pytest',
+        'country': None,
+        'timestamp': START + timedelta(minutes=minutes),
+    }
+
+
+@pytest.fixture
+def writer(session):
+    writer = PageViewWriter(timedelta(minutes=30))
+    yield writer
+    writer.stop()
+
+
+def test_batch_tracks_sessions_and_page_views(writer, session):
+    writer._write([
+        _event('s1', 'ip-a', 0, '/'),
+        _event('s1', 'ip-a', 5, '/prices'),
+        _event('s2', 'ip-b', 6),
+    ])
+
+    sessions = {s.session_id: s for s in session.query(VisitorSession)}
+    assert sessions['s1'].page_count == 2
+    assert sessions['s1'].last_visit == START + timedelta(minutes=5)
+    assert sessions['s2'].page_count == 1
+    views = session.query(PageView.session_id, PageView.path, PageView.is_unique).order_by(PageView.timestamp).all()
+    assert views == [('s1', '/', True), ('s1', '/prices', False), ('s2', '/', True)]
+
+
+def test_new_session_from_a_known_ip_is_returning(writer, session):
+    writer._write([_event('s1', 'ip-a')])
+    writer._write([_event('s2', 'ip-a', 60), _event('s3', 'ip-b', 61), _event('s4', 'ip-b', 62)])
+
+    returning = dict(session.query(VisitorSession.session_id, VisitorSession.is_returning))
+    assert returning == {'s1': False, 's2': True, 's3': False, 's4': True}
+
+
+def test_expired_session_is_restarted_in_place(writer, session):
+    writer._write([_event('s1', 'ip-a', 0), _event('s1', 'ip-a', 10)])
+    writer._write([_event('s1', 'ip-a', 45)])
+
+    s1 = session.query(VisitorSession).one()
+    assert (s1.page_count, s1.first_visit) == (1, START + timedelta(minutes=45))
+    assert session.query(PageView).count() == 3
@@ -0,0 +1,95 @@
+"""
+TTLCache expiry, eviction and stale-while-revalidate.
+"""
+import threading
+import time
+
+import pytest
+
+from api import cache
+from api.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache.time, 'monotonic', fake)
+    return fake
+
+
+def test_entries_expire_after_ttl(clock):
+    c = TTLCache(ttl=10)
+    c.set('k', 1)
+
+    clock.now += 9
+    assert c.get('k') == 1
+    clock.now += 1
+    assert c.get('k', 'missing') == 'missing'
+
+
+def test_oldest_entry_is_evicted_when_full(clock):
+    c = TTLCache(ttl=10, maxsize=2)
+    c.set('a', 1)
+    c.set('b', 2)
+    c.set('c', 3)
+
+    assert c.get('a') is None
+    assert (c.get('b'), c.get('c')) == (2, 3)
+
+
+def test_stale_value_is_served_while_refreshing_in_background(clock):
+    c = TTLCache(ttl=10, stale_ttl=10)
+    c.set('k', 'old')
+    clock.now += 15
+    refreshed = threading.Event()
+
+    def factory():
+        refreshed.set()
+        return 'new'
+
+    assert c.get_or_set('k', factory) == 'old'
+    assert refreshed.wait(2)
+    for _ in range(100):
+        if c.get('k') == 'new':
+            break
+        time.sleep(0.01)
+    assert c.get('k') == 'new'
+
+
+def test_value_past_the_stale_window_is_recomputed(clock):
+    c = TTLCache(ttl=10, stale_ttl=10)
+    c.set('k', 'old')
+    clock.now += 20
+
+    assert c.get_or_set('k', lambda: 'new') == 'new'
+
+
+def test_concurrent_misses_compute_once():
+    c = TTLCache(ttl=10)
+    calls = []
+    release = threading.Event()
+
+    def factory():
+        calls.append(1)
+        release.wait(2)
+        return 'value'
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(c.get_or_set('k', factory))) for _ in range(5)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert results == ['value'] * 5
@@ -0,0 +1,85 @@
+"""
+DatabaseWriter batched upserts: insert/update counts and stored values.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+
+from database.schema import RealTimeLBMP, Zone
+from scraper.db_writer import DatabaseWriter
+
+START = datetime(2026, 1, 5, 12, 0)
+
+
+def _record(minutes, zone_name, lbmp, ptid=None):
+    return {
+        'timestamp': START + timedelta(minutes=minutes),
+        'zone_name': zone_name,
+        'ptid': ptid,
+        'lbmp': lbmp,
+        'marginal_cost_losses': 1.0,
+        'marginal_cost_congestion': -2.0,
+    }
+
+
+def _stored(session):
+    rows = (
+        session.query(RealTimeLBMP.timestamp, Zone.name, RealTimeLBMP.lbmp)
+        .join(Zone, RealTimeLBMP.zone_id == Zone.id)
+    )
+    return {(ts, name): lbmp for ts, name, lbmp in rows}
+
+
+@pytest.fixture
+def writer(session):
+    return DatabaseWriter(session)
+
+
+def test_new_rows_are_inserted(writer, session):
+    records = [_record(m, zone, 20.0) for m in (0, 5) for zone in ('WEST', 'CAPITL')]
+
+    assert writer.upsert_realtime_lbmp(records) == (4, 0)
+    session.commit()
+    assert len(_stored(session)) == 4
+
+
+def test_existing_rows_are_counted_as_updated_and_changes_written(writer, session):
+    records = [_record(m, zone, 20.0) for m in (0, 5) for zone in ('WEST', 'CAPITL')]
+    writer.upsert_realtime_lbmp(records)
+    session.commit()
+
+    records[1]['lbmp'] = 35.5
+    assert writer.upsert_realtime_lbmp(records) == (0, 4)
+    session.commit()
+
+    stored = _stored(session)
+    assert stored[(START, 'CAPITL')] == 35.5
+    assert [v for k, v in stored.items() if k != (START, 'CAPITL')] == [20.0, 20.0, 20.0]
+
+
+def test_key_repeated_in_a_new_batch_keeps_the_last_value(writer, session):
+    records = [_record(0, 'WEST', 20.0), _record(0, 'WEST', 21.0), _record(5, 'WEST', 22.0)]
+
+    assert writer.upsert_realtime_lbmp(records) == (2, 1)
+    session.commit()
+    assert _stored(session) == {(START, 'WEST'): 21.0, (START + timedelta(minutes=5), 'WEST'): 22.0}
+
+
+def test_key_repeated_against_an_existing_row_keeps_the_last_value(writer, session):
+    writer.upsert_realtime_lbmp([_record(0, 'WEST', 20.0)])
+    session.commit()
+
+    assert writer.upsert_realtime_lbmp([_record(0, 'WEST', 25.0), _record(0, 'WEST', 26.0)]) == (0, 2)
+    session.commit()
+    assert _stored(session) == {(START, 'WEST'): 26.0}
+
+
+def test_zone_is_created_once_and_ptid_backfilled(writer, session):
+    writer.upsert_realtime_lbmp([_record(0, 'west', 20.0), _record(5, 'WEST', 21.0, ptid=61757)])
+    session.commit()
+
+    assert session.query(Zone.name, Zone.ptid).all() == [('WEST', 61757)]
+
+
+def test_empty_batch_is_a_no_op(writer):
+    assert writer.upsert_realtime_lbmp([]) == (0, 0)
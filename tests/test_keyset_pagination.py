@@ -0,0 +1,132 @@
+"""
+Keyset pagination on the list endpoints: cursor round-trips and page sizes.
+"""
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+import api.main
+from database.schema import MarketAdvisory, RealTimeLBMP, Zone
+
+START = datetime(2026, 1, 5, 12, 0)
+ZONES = ('CAPITL', 'N.Y.C.', 'WEST')
+INTERVALS = 10
+
+
+@pytest.fixture
+def client(session):
+    api.main._reference_cache.clear()
+    with TestClient(api.main.app) as client:
+        yield client
+
+
+@pytest.fixture
+def lbmp_rows(session):
+    """INTERVALS five-minute timestamps with one row per zone."""
+    zones = [Zone(name=name) for name in ZONES]
+    session.add_all(zones)
+    session.flush()
+    session.add_all(
+        RealTimeLBMP(timestamp=START + timedelta(minutes=5 * i), zone_id=zone.id, lbmp=20.0 + i)
+        for i in range(INTERVALS)
+        for zone in zones
+    )
+    session.commit()
+    return {(START + timedelta(minutes=5 * i), name) for i in range(INTERVALS) for name in ZONES}
+
+
+def _row_keys(rows):
+    return [(datetime.fromisoformat(r['timestamp']), r['zone_name']) for r in rows]
+
+
+def _walk(client, url, limit, **params):
+    """Follow X-Next-Cursor until it runs out; returns the list of pages."""
+    pages = []
+    cursor = None
+    while True:
+        response = client.get(url, params={'limit': limit, **params, **({'after': cursor} if cursor else {})})
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = response.headers.get('X-Next-Cursor')
+        if not cursor:
+            return pages
+
+
+def test_pages_cover_every_row_once_newest_first(client, lbmp_rows):
+    # 4 rows per page splits the 3-zone timestamps across pages
+    pages = _walk(client, '/api/realtime-lbmp', 4)
+
+    assert all(len(page) == 4 for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= 4
+    keys = _row_keys(row for page in pages for row in page)
+    assert len(keys) == len(lbmp_rows)
+    assert set(keys) == lbmp_rows
+    timestamps = [ts for ts, _ in keys]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+
+def test_full_last_page_is_followed_by_an_empty_one(client, lbmp_rows):
+    pages = _walk(client, '/api/realtime-lbmp', len(lbmp_rows))
+
+    assert [len(page) for page in pages] == [len(lbmp_rows), 0]
+
+
+def test_rows_written_mid_request_do_not_grow_the_page(client, session, lbmp_rows, monkeypatch):
+    stream = api.main._stream_json_rows
+    newest = START + timedelta(minutes=5 * INTERVALS)
+
+    def write_then_stream(*args, **kwargs):
+        # The scraper lands rows between the key lookup and the streamed query
+        zone_id = session.query(Zone.id).filter(Zone.name == 'WEST').scalar()
+        session.add(RealTimeLBMP(timestamp=newest, zone_id=zone_id, lbmp=99.0))
+        session.commit()
+        monkeypatch.setattr(api.main, '_stream_json_rows', stream)
+        return stream(*args, **kwargs)
+
+    monkeypatch.setattr(api.main, '_stream_json_rows', write_then_stream)
+    response = client.get('/api/realtime-lbmp', params={'limit': 5})
+
+    assert len(response.json()) == 5
+    assert (newest, 'WEST') not in _row_keys(response.json())
+    rest = _walk(client, '/api/realtime-lbmp', 5, after=response.headers['X-Next-Cursor'])
+    seen = _row_keys(response.json()) + _row_keys(row for page in rest for row in page)
+    assert set(seen) == lbmp_rows
+
+
+def test_before_ts_still_filters_by_timestamp(client, lbmp_rows):
+    cutoff = START + timedelta(minutes=25)
+    response = client.get('/api/realtime-lbmp', params={'before_ts': cutoff.isoformat()})
+
+    assert response.status_code == 200
+    assert set(_row_keys(response.json())) == {key for key in lbmp_rows if key[0] < cutoff}
+
+
+def test_malformed_cursor_is_rejected(client, lbmp_rows):
+    assert client.get('/api/realtime-lbmp', params={'after': 'not-a-cursor'}).status_code == 400
+    assert client.get('/api/realtime-lbmp', params={'after': START.isoformat()}).status_code == 400
+
+
+def test_limit_is_capped(client, lbmp_rows):
+    assert client.get('/api/realtime-lbmp', params={'limit': 1001}).status_code == 422
+
+
+def test_cursor_round_trip():
+    timestamp = datetime(2026, 3, 8, 2, 30, 15)
+
+    assert api.main._decode_cursor(api.main._encode_cursor(timestamp, 42)) == (timestamp, 42)
+
+
+def test_advisories_sharing_a_timestamp_are_not_skipped(client, session):
+    # Several advisories per timestamp, as with HAM reports published together
+    session.add_all(
+        MarketAdvisory(timestamp=START + timedelta(hours=i // 4), title=f'advisory {i}')
+        for i in range(25)
+    )
+    session.commit()
+
+    pages = _walk(client, '/api/market-advisories', 7)
+
+    assert [len(page) for page in pages] == [7, 7, 7, 4]
+    titles = [row['title'] for page in pages for row in page]
+    assert sorted(titles) == sorted(f'advisory {i}' for i in range(25))
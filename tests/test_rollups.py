@@ -0,0 +1,62 @@
+"""
+Daily page view rollup: day boundaries and incremental refresh.
+"""
+from datetime import datetime, time, timedelta
+
+from database.rollups import page_view_rollup_end, refresh_page_view_daily
+from database.schema import PageView, PageViewDaily, PageViewDailyVisitor
+
+
+def _view(timestamp, ip_hash, path='/'):
+    return PageView(timestamp=timestamp, session_id=f's-{ip_hash}', ip_hash=ip_hash, path=path)
+
+
+def _daily(session):
+    return {(d.day, d.path): d.views for d in session.query(PageViewDaily)}
+
+
+def _visitors(session):
+    return {(v.day, v.ip_hash) for v in session.query(PageViewDailyVisitor)}
+
+
+def test_views_are_rolled_up_by_utc_day(session):
+    today = datetime.utcnow().date()
+    first, second = today - timedelta(days=2), today - timedelta(days=1)
+    midnight = datetime.combine(second, time.min)
+    session.add_all([
+        _view(datetime.combine(first, time.min), 'a'),
+        _view(midnight - timedelta(microseconds=1), 'b'),  # last instant of the first day
+        _view(midnight, 'a', '/prices'),                   # first instant of the second day
+        _view(datetime.combine(today, time.min), 'c'),     # today stays live
+    ])
+    session.commit()
+
+    assert refresh_page_view_daily(session) == 2
+    session.commit()
+
+    assert _daily(session) == {(first, '/'): 2, (second, '/prices'): 1}
+    assert _visitors(session) == {(first, 'a'), (first, 'b'), (second, 'a')}
+    assert page_view_rollup_end(session) == today
+    assert refresh_page_view_daily(session) == 0
+
+
+def test_days_without_views_are_rechecked_until_a_later_day_is_rolled_up(session):
+    today = datetime.utcnow().date()
+    busy = today - timedelta(days=2)
+    session.add(_view(datetime.combine(busy, time(12)), 'a'))
+    session.commit()
+
+    # The busy day plus yesterday, which has no views and so writes no rows
+    assert refresh_page_view_daily(session) == 2
+    session.commit()
+    assert page_view_rollup_end(session) == busy + timedelta(days=1)
+
+    # Rebuilding yesterday again is harmless
+    assert refresh_page_view_daily(session) == 1
+    assert _daily(session) == {(busy, '/'): 1}
+    assert _visitors(session) == {(busy, 'a')}
+
+
+def test_empty_table_rolls_up_nothing(session):
+    assert refresh_page_view_daily(session) == 0
+    assert page_view_rollup_end(session) is None